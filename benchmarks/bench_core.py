@@ -0,0 +1,435 @@
+# C:\Users\Usuario\Desktop\proyectos\yvolo\benchmarks\bench_core.py
+"""
+Benchmarks de los caminos calientes de core con cargas sintéticas grandes.
+
+Uso (desde la raíz del repo):
+    python -m benchmarks.bench_core                  compara con baseline.json
+    python -m benchmarks.bench_core --quick          sin los tamaños de 100k
+    python -m benchmarks.bench_core --update-baseline
+    python -m benchmarks.bench_core --only roadmap
+
+Cada métrica es el mínimo de --repeat ejecuciones (segundos). Sale con
+código 1 si alguna supera la baseline en más de --threshold (por defecto 25%).
+git y gh se sustituyen por scripts falsos (solo POSIX): se mide yvolo, no git.
+La baseline depende de la máquina: regenerarla al cambiar de equipo.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from core import git_utils
+from core.backup import create_backup
+from core.batch import run_batch
+from core.config import load_config
+from core.paths import yvolo_root_file
+from core.project_catalog import ProjectCatalog
+from core.project_creator import _apply_hoja_template, _format_tasks, create_new_project, sanitize_project_name
+from core.ideas import process_all_ideas
+from core.repo_status import RepoStatusCache
+from core.roadmap import parse_roadmap, update_info_fields
+from core.roadmap_tail import read_info
+from core.roadmap_view import read_first_rows
+from core.roadmap_writer import RoadmapWriter
+from core.snapshots import BackupStore
+from core.task_graph import TaskGraph
+from core.templates import HOJA_TEMPLATE, HojaTemplate, root_templates
+
+from .generators import batch_entries, install_fake_tools, project_names, roadmap_text, scaffold_tree, task_descriptions
+
+BASELINE = Path(__file__).resolve().parent / "baseline.json"
+
+# Por debajo de esto la diferencia es ruido aunque el porcentaje sea grande
+NOISE_FLOOR = 0.002
+
+Runner = Callable[[], object]
+
+
+class Benchmark(NamedTuple):
+    name: str
+    # setup(workdir) -> función a medir; el setup no cuenta en el tiempo
+    setup: Callable[[Path], Runner]
+    quick: bool = True
+    needs_tools: bool = False
+    # Regresión tolerada propia (si es mayor que --threshold): las que
+    # lanzan procesos o tocan mucho disco son más ruidosas
+    tolerance: float = 0.0
+
+
+def _hoja_template_text() -> str:
+    return yvolo_root_file(HOJA_TEMPLATE).read_text(encoding="utf-8")
+
+
+def _tasks_bench(n: int) -> Callable[[Path], Runner]:
+    def setup(_work: Path) -> Runner:
+        tasks = task_descriptions(n)
+        return lambda: _format_tasks(tasks)
+
+    return setup
+
+
+def _apply_bench(n: int) -> Callable[[Path], Runner]:
+    def setup(_work: Path) -> Runner:
+        text = _hoja_template_text()
+        tasks = task_descriptions(n)
+        return lambda: _apply_hoja_template(text, "bench", "", "Desktop\\backups\\b.zip", tasks)
+
+    return setup
+
+
+def _render_bench(n: int) -> Callable[[Path], Runner]:
+    def setup(_work: Path) -> Runner:
+        template = HojaTemplate(_hoja_template_text())
+        tasks = task_descriptions(n)
+        return lambda: template.render("bench", "", "Desktop\\backups\\b.zip", tasks)
+
+    return setup
+
+
+def _parse_bench(n: int) -> Callable[[Path], Runner]:
+    def setup(_work: Path) -> Runner:
+        text = roadmap_text(n, n_ideas=n // 10)
+        return lambda: parse_roadmap(text)
+
+    return setup
+
+
+def _first_screen_bench(n: int) -> Callable[[Path], Runner]:
+    def setup(work: Path) -> Runner:
+        path = work / f"hoja_{n}.txt"
+        if not path.exists():
+            path.write_text(roadmap_text(n), encoding="utf-8")
+        return lambda: read_first_rows(path, 200)
+
+    return setup
+
+
+def _serialize_bench(n: int) -> Callable[[Path], Runner]:
+    def setup(_work: Path) -> Runner:
+        roadmap = parse_roadmap(roadmap_text(n))
+        return roadmap.serialize
+
+    return setup
+
+
+def _patch_bench(n: int) -> Callable[[Path], Runner]:
+    """Cambiar un campo y una línea de #ProyectoInfo: un parche, una escritura."""
+
+    def setup(work: Path) -> Runner:
+        path = work / f"hoja_patch_{n}.txt"
+        path.write_text(roadmap_text(n), encoding="utf-8")
+        writer = RoadmapWriter(path)
+        writer.roadmap  # primer parseo fuera de la medición
+        state = {"i": 0}
+
+        def run() -> None:
+            state["i"] += 1
+            with writer:
+                writer.set_task_field(n // 2, "Implementada", "Implementada" if state["i"] % 2 else "No implementada")
+                writer.set_info(backup=f"backup_{state['i']}.zip")
+
+        return run
+
+    return setup
+
+
+def _info_tail_bench(n: int) -> Callable[[Path], Runner]:
+    """Leer y cambiar backup: de #ProyectoInfo sin tocar las tareas."""
+
+    def setup(work: Path) -> Runner:
+        path = work / f"hoja_info_{n}.txt"
+        path.write_text(roadmap_text(n), encoding="utf-8")
+        # Fuera de la medición: el primer fsync vuelca el fichero recién escrito y
+        # la búsqueda de otra cabecera #ProyectoInfo queda en caché
+        update_info_fields(path, backup="")
+        state = {"i": 0}
+
+        def run() -> None:
+            state["i"] += 1
+            read_info(path)
+            update_info_fields(path, backup=f"backup_{state['i']}.zip")
+
+        return run
+
+    return setup
+
+
+def _graph_bench(n: int) -> Callable[[Path], Runner]:
+    def setup(_work: Path) -> Runner:
+        roadmap = parse_roadmap(roadmap_text(n))
+
+        def run() -> None:
+            graph = TaskGraph.from_roadmap(roadmap)
+            graph.unblocked()
+            graph.critical_path()
+
+        return run
+
+    return setup
+
+
+def _sanitize_setup(_work: Path) -> Runner:
+    names = project_names(10_000)
+    return lambda: [sanitize_project_name(n) for n in names]
+
+
+def _config_setup(_work: Path) -> Runner:
+    return lambda: [load_config() for _ in range(1000)]
+
+
+def _create_bench(n: int) -> Callable[[Path], Runner]:
+    def setup(work: Path) -> Runner:
+        base = work / "Desktop" / "proyectos"
+        shutil.rmtree(base, ignore_errors=True)
+        tasks = task_descriptions(20)
+        templates = root_templates()
+
+        def run() -> None:
+            for i in range(n):
+                ok, msg = create_new_project(f"bench_{i}", "Python", False, tasks, templates=templates)
+                if not ok:
+                    raise RuntimeError(msg)
+
+        return run
+
+    return setup
+
+
+def _batch_bench(n: int) -> Callable[[Path], Runner]:
+    def setup(work: Path) -> Runner:
+        shutil.rmtree(work / "Desktop" / "proyectos", ignore_errors=True)
+        entries = batch_entries(n)
+
+        def run() -> None:
+            results, _total = run_batch(entries, workers=8)
+            failed = [r for r in results if not r.ok]
+            if failed:
+                raise RuntimeError(failed[0].message)
+
+        return run
+
+    return setup
+
+
+def _tree(work: Path) -> Path:
+    tree = work / "tree" / "deep_project"
+    if not tree.exists():
+        scaffold_tree(tree, depth=6, fanout=3, files_per_dir=5, file_size=2048)
+    return tree
+
+
+def _backup_setup(work: Path) -> Runner:
+    tree = _tree(work)
+    dest = work / "zips"
+    shutil.rmtree(dest, ignore_errors=True)
+    return lambda: create_backup(tree, dest_dir=dest, update_roadmap=False)
+
+
+def _snapshot_setup(work: Path) -> Runner:
+    tree = _tree(work)
+    store = BackupStore(work / "store_backups" / "store")
+    if store.latest(tree.name) is None:
+        store.snapshot(tree)
+    return lambda: store.snapshot(tree)
+
+
+def _ideas_setup(work: Path) -> Runner:
+    """500 proyectos, 1 de cada 10 con ideas listas: se restauran en cada vuelta."""
+    base = work / "ideas" / "proyectos"
+    plain = roadmap_text(30, n_ideas=5)
+    ready = plain.replace("  Dependencias: Ninguna\n\n--", "  Dependencias: Ninguna\n  Lista: Sí\n\n--")
+    assert ready != plain
+    hojas = []
+    for i, name in enumerate(project_names(500)):
+        folder = base / sanitize_project_name(name)
+        folder.mkdir(parents=True, exist_ok=True)
+        hoja = folder / "hoja_de_ruta.txt"
+        hoja.write_text(plain, encoding="utf-8")
+        if i % 10 == 0:
+            hojas.append(hoja)
+
+    def run() -> None:
+        for hoja in hojas:
+            hoja.write_text(ready, encoding="utf-8")
+        report = process_all_ideas(base, pool_min=0)
+        assert report.promoted == len(hojas), report
+
+    return run
+
+
+def _git_status_setup(work: Path) -> Runner:
+    """300 repos (git falso); en cada vuelta cambia el index de 30."""
+    base = work / "git_status" / "proyectos"
+    repos = []
+    for name in project_names(300):
+        repo = base / sanitize_project_name(name)
+        (repo / ".git").mkdir(parents=True, exist_ok=True)
+        (repo / ".git" / "HEAD").write_text("ref: refs/heads/main\n", encoding="utf-8")
+        (repo / ".git" / "index").write_bytes(b"")
+        repos.append(repo)
+    cache = RepoStatusCache(work / "git_status" / "git_status.json")
+    cache.scan(base)
+    state = {"i": 0}
+
+    def run() -> None:
+        state["i"] += 1
+        for repo in repos[::10]:
+            (repo / ".git" / "index").write_bytes(b"x" * state["i"])
+        report = cache.scan(base)
+        assert report.queried == 30, report.queried
+
+    return run
+
+
+def _catalog_setup(work: Path) -> Runner:
+    base = work / "catalog" / "proyectos"
+    if not base.exists():
+        text = roadmap_text(30)
+        for name in project_names(2000):
+            folder = base / sanitize_project_name(name)
+            folder.mkdir(parents=True, exist_ok=True)
+            (folder / "hoja_de_ruta.txt").write_text(text, encoding="utf-8")
+    catalog = ProjectCatalog(work / "catalog" / "projects.sqlite3", base=base)
+    catalog.refresh()
+    return catalog.refresh
+
+
+BENCHMARKS: List[Benchmark] = [
+    Benchmark("sanitize_project_name[10k]", _sanitize_setup),
+    Benchmark("format_tasks[10k]", _tasks_bench(10_000)),
+    Benchmark("format_tasks[100k]", _tasks_bench(100_000), quick=False),
+    Benchmark("apply_hoja_template[10k]", _apply_bench(10_000)),
+    Benchmark("apply_hoja_template[100k]", _apply_bench(100_000), quick=False),
+    Benchmark("hoja_render_presplit[100k]", _render_bench(100_000), quick=False),
+    Benchmark("parse_roadmap[10k]", _parse_bench(10_000)),
+    Benchmark("parse_roadmap[100k]", _parse_bench(100_000), quick=False),
+    Benchmark("roadmap_first_screen[100k]", _first_screen_bench(100_000)),
+    Benchmark("roadmap_serialize[100k]", _serialize_bench(100_000), quick=False),
+    Benchmark("roadmap_patch_field[100k]", _patch_bench(100_000), tolerance=0.5),
+    Benchmark("roadmap_info_tail[100k]", _info_tail_bench(100_000), tolerance=1.0),
+    Benchmark("task_graph[10k]", _graph_bench(10_000)),
+    Benchmark("task_graph[100k]", _graph_bench(100_000), quick=False),
+    Benchmark("load_config[x1000]", _config_setup),
+    Benchmark("create_new_project[x20]", _create_bench(20), needs_tools=True, tolerance=1.0),
+    Benchmark("run_batch[50]", _batch_bench(50), needs_tools=True, tolerance=1.0),
+    Benchmark("run_batch[300]", _batch_bench(300), quick=False, needs_tools=True, tolerance=1.0),
+    Benchmark("backup_deep_tree[1820 files]", _backup_setup, tolerance=0.5),
+    Benchmark("snapshot_unchanged[1820 files]", _snapshot_setup, tolerance=0.5),
+    Benchmark("catalog_refresh_unchanged[2000]", _catalog_setup, tolerance=0.5),
+    Benchmark("process_ideas[500]", _ideas_setup, tolerance=1.0),
+    Benchmark("git_status_refresh[300, 30 changed]", _git_status_setup, needs_tools=True, tolerance=1.0),
+]
+
+
+class _Sandbox:
+    """HOME/APPDATA temporales y git/gh falsos en PATH mientras dure."""
+
+    def __init__(self, work: Path, tools: bool) -> None:
+        self.work = work
+        self.tools = tools
+        self._saved: Dict[str, Optional[str]] = {}
+
+    def __enter__(self) -> "_Sandbox":
+        env = {"HOME": str(self.work), "USERPROFILE": str(self.work), "APPDATA": str(self.work / "AppData")}
+        if self.tools:
+            bin_dir = install_fake_tools(self.work / "bin")
+            env["PATH"] = str(bin_dir) + os.pathsep + os.environ.get("PATH", "")
+        for k, v in env.items():
+            self._saved[k] = os.environ.get(k)
+            os.environ[k] = v
+        git_utils.gh_auth_invalidate()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        for k, v in self._saved.items():
+            if v is None:
+                os.environ.pop(k, None)
+            else:
+                os.environ[k] = v
+        git_utils.gh_auth_invalidate()
+
+
+def run_benchmarks(selected: List[Benchmark], repeat: int) -> Dict[str, float]:
+    results: Dict[str, float] = {}
+    tools = os.name == "posix"
+    with tempfile.TemporaryDirectory(prefix="yvolo_bench_") as tmp:
+        work = Path(tmp)
+        with _Sandbox(work, tools):
+            for bench in selected:
+                if bench.needs_tools and not tools:
+                    print(f"{bench.name:<34} omitido (git/gh falsos solo en POSIX)")
+                    continue
+                best = float("inf")
+                for _ in range(repeat):
+                    run = bench.setup(work)
+                    t0 = time.perf_counter()
+                    run()
+                    best = min(best, time.perf_counter() - t0)
+                results[bench.name] = best
+                print(f"{bench.name:<34} {best * 1000:10.2f} ms", flush=True)
+    return results
+
+
+def compare(results: Dict[str, float], baseline: Dict[str, float], threshold: float) -> List[str]:
+    tolerances = {b.name: b.tolerance for b in BENCHMARKS}
+    regressions = []
+    for name, value in results.items():
+        ref = baseline.get(name)
+        if ref is None:
+            continue
+        limit = max(threshold, tolerances.get(name, 0.0))
+        if value > ref * (1 + limit) and value - ref > NOISE_FLOOR:
+            regressions.append(f"{name}: {ref * 1000:.2f} ms -> {value * 1000:.2f} ms (+{(value / ref - 1) * 100:.0f}%)")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="bench_core")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--quick", action="store_true", help="Omite los tamaños grandes (100k, lotes de 300)")
+    parser.add_argument("--only", type=str, default="", help="Solo métricas cuyo nombre contenga este texto")
+    parser.add_argument("--baseline", type=str, default=str(BASELINE))
+    parser.add_argument("--threshold", type=float, default=0.25, help="Regresión tolerada (0.25 = 25%%)")
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    selected = [b for b in BENCHMARKS if (b.quick or not args.quick) and args.only in b.name]
+    results = run_benchmarks(selected, max(1, args.repeat))
+
+    baseline_path = Path(args.baseline)
+    if args.update_baseline:
+        try:
+            previous = json.loads(baseline_path.read_text(encoding="utf-8")).get("metrics", {})
+        except (OSError, ValueError):
+            previous = {}
+        previous.update({k: round(v, 6) for k, v in results.items()})
+        payload = {"python": sys.version.split()[0], "platform": sys.platform, "metrics": previous}
+        baseline_path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        print(f"Baseline actualizada: {baseline_path}")
+        return 0
+
+    try:
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8")).get("metrics", {})
+    except (OSError, ValueError):
+        print(f"Sin baseline en {baseline_path} (usar --update-baseline)")
+        return 0
+
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"\nREGRESIONES (> {args.threshold * 100:.0f}%):")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+    print(f"\nSin regresiones (umbral {args.threshold * 100:.0f}%).")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
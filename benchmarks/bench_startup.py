@@ -0,0 +1,139 @@
+# C:\Users\Usuario\Desktop\proyectos\yvolo\benchmarks\bench_startup.py
+"""
+Benchmark de arranque de yvolo.
+
+Mide, en procesos nuevos (arranque en frío de Python cada vez):
+    import      python -c "import ui_main"      (y comprueba que no carga tkinter)
+    create      ui_main.py --create ... hasta que termina (HOME/APPDATA temporales;
+                el remoto queda en cola con --no-wait-remote)
+    window      hasta que YvoloApp tiene la ventana dibujada (necesita pantalla)
+
+Uso:
+    python benchmarks/bench_startup.py [--repeat 5] [--json salida.json]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+
+IMPORT_PROBE = "import sys, ui_main; sys.exit(1 if 'tkinter' in sys.modules else 0)"
+
+WINDOW_PROBE = (
+    "import ui_main\n"
+    "from ui.app import YvoloApp\n"
+    "app = YvoloApp()\n"
+    "app.update()\n"
+    "print('ready', flush=True)\n"
+    "app.destroy()\n"
+)
+
+
+def _isolated_env(home: Path) -> Dict[str, str]:
+    env = dict(os.environ)
+    env["HOME"] = str(home)
+    env["USERPROFILE"] = str(home)
+    env["APPDATA"] = str(home / "AppData")
+    return env
+
+
+def _timed(cmd: List[str], env: Optional[Dict[str, str]] = None, until: Optional[str] = None) -> float:
+    """Segundos de pared hasta que el proceso termina (o imprime until)."""
+    t0 = time.perf_counter()
+    if until is None:
+        proc = subprocess.run(cmd, cwd=str(ROOT), env=env, capture_output=True, text=True)
+        elapsed = time.perf_counter() - t0
+        if proc.returncode != 0:
+            raise RuntimeError(f"{' '.join(cmd)} -> {proc.returncode}\n{proc.stdout}{proc.stderr}")
+        return elapsed
+
+    proc = subprocess.Popen(cmd, cwd=str(ROOT), env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    try:
+        for line in proc.stdout:
+            if line.strip() == until:
+                return time.perf_counter() - t0
+        raise RuntimeError(proc.stderr.read())
+    finally:
+        proc.wait()
+
+
+def bench_import(repeat: int) -> List[float]:
+    return [_timed([sys.executable, "-c", IMPORT_PROBE]) for _ in range(repeat)]
+
+
+def bench_create(repeat: int) -> List[float]:
+    samples = []
+    with tempfile.TemporaryDirectory() as tmp:
+        env = _isolated_env(Path(tmp))
+        for i in range(repeat):
+            cmd = [
+                sys.executable,
+                "ui_main.py",
+                "--create",
+                f"bench_{i}",
+                "--type",
+                "Python",
+                "--open-vscode",
+                "0",
+                "--no-wait-remote",
+            ]
+            samples.append(_timed(cmd, env=env))
+    return samples
+
+
+def bench_window(repeat: int) -> Optional[List[float]]:
+    try:
+        return [_timed([sys.executable, "-c", WINDOW_PROBE], until="ready") for _ in range(repeat)]
+    except RuntimeError as e:
+        if "display" in str(e).lower() or "TclError" in str(e):
+            return None
+        raise
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    return {
+        "median_ms": round(statistics.median(samples) * 1000, 1),
+        "min_ms": round(min(samples) * 1000, 1),
+        "max_ms": round(max(samples) * 1000, 1),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="bench_startup")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", type=str, help="Guarda los resultados en este fichero")
+    args = parser.parse_args()
+
+    results: Dict[str, Optional[Dict[str, float]]] = {}
+    try:
+        results["import"] = summarize(bench_import(args.repeat))
+    except RuntimeError:
+        print("ERROR: importar ui_main carga tkinter (el modo CLI debe ser perezoso)")
+        return 1
+    results["create"] = summarize(bench_create(args.repeat))
+    window = bench_window(args.repeat)
+    results["window"] = summarize(window) if window else None
+
+    for name, r in results.items():
+        if r is None:
+            print(f"{name:<8} (sin pantalla, omitido)")
+        else:
+            print(f"{name:<8} mediana {r['median_ms']:8.1f} ms   min {r['min_ms']:8.1f}   max {r['max_ms']:8.1f}")
+
+    if args.json:
+        payload = {"python": sys.version.split()[0], "platform": sys.platform, "results": results}
+        Path(args.json).write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
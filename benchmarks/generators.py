@@ -0,0 +1,130 @@
+# C:\Users\Usuario\Desktop\proyectos\yvolo\benchmarks\generators.py
+"""
+Datos sintéticos y binarios falsos para los benchmarks.
+Todo es determinista (seed) para que las mediciones sean comparables.
+"""
+from __future__ import annotations
+
+import os
+import random
+import stat
+from pathlib import Path
+from typing import List
+
+from core.batch import BatchEntry
+from core.roadmap import format_entry
+
+_WORDS = (
+    "crear validar migrar documentar refactorizar optimizar conectar probar "
+    "ventana botón hoja ruta proyecto backup plantilla configuración caché índice "
+    "usuario remoto repositorio tarea idea dependencia crítica lote informe"
+).split()
+
+_SEPARATOR = "-" * 50
+
+
+def task_descriptions(n: int, seed: int = 1) -> List[str]:
+    rnd = random.Random(seed)
+    return [" ".join(rnd.choice(_WORDS) for _ in range(rnd.randint(4, 14))) for _ in range(n)]
+
+
+def project_names(n: int, seed: int = 2) -> List[str]:
+    """Nombres con espacios, acentos y símbolos, como los teclea un usuario."""
+    rnd = random.Random(seed)
+    noise = " -_.áéñ!?/#@  "
+    names = []
+    for i in range(n):
+        parts = [rnd.choice(_WORDS) for _ in range(rnd.randint(1, 4))]
+        extra = "".join(rnd.choice(noise) for _ in range(rnd.randint(0, 6)))
+        names.append(f" {' '.join(parts)}{extra}{i} ")
+    return names
+
+
+def roadmap_text(n_tasks: int, n_ideas: int = 0, seed: int = 3) -> str:
+    """
+    hoja_de_ruta.txt con n_tasks tareas. Cada tarea depende de 0-3 tareas
+    anteriores (grafo acíclico); ~30% implementadas, ~20% críticas.
+    """
+    rnd = random.Random(seed)
+    descriptions = task_descriptions(n_tasks + n_ideas, seed)
+    parts = ["#Tareas\n"]
+    for i in range(1, n_tasks + 1):
+        deps = sorted(rnd.sample(range(1, i), min(i - 1, rnd.randint(0, 3)))) if i > 1 else []
+        parts.append(
+            format_entry(
+                descriptions[i - 1],
+                critica="Critica" if rnd.random() < 0.2 else "No critica",
+                implementada="Implementada" if rnd.random() < 0.3 else "No implementada",
+                dependencias=", ".join(f"Tarea {d}" for d in deps) if deps else "Ninguna",
+            )
+        )
+    parts.append("#Ideas\n")
+    for desc in descriptions[n_tasks:]:
+        parts.append(format_entry(desc))
+    parts.append(
+        f"{_SEPARATOR}\n#ProyectoInfo\n\nrepo_git:\nname_project: bench\n"
+        f"backup: Desktop\\backups\\backup_bench_20260101_000000.zip\n{_SEPARATOR}\n"
+    )
+    return "".join(parts)
+
+
+def batch_entries(n: int, project_type: str = "Python", tasks_per_project: int = 5) -> List[BatchEntry]:
+    tasks = task_descriptions(tasks_per_project)
+    return [BatchEntry(f"bench_{i:04d}", project_type, list(tasks), False) for i in range(n)]
+
+
+def scaffold_tree(root: Path, depth: int, fanout: int, files_per_dir: int, file_size: int, seed: int = 4) -> int:
+    """
+    Árbol de carpetas profundo (depth niveles, fanout subcarpetas por nivel).
+    Devuelve el número de ficheros creados. El contenido es texto
+    semi-repetitivo (comprime como código fuente, no como ruido).
+    """
+    rnd = random.Random(seed)
+    count = 0
+    level = [Path(root)]
+    for d in range(depth):
+        next_level = []
+        for folder in level:
+            folder.mkdir(parents=True, exist_ok=True)
+            for f in range(files_per_dir):
+                line = " ".join(rnd.choice(_WORDS) for _ in range(8)) + "\n"
+                body = (line * (file_size // len(line) + 1))[:file_size]
+                (folder / f"mod_{d}_{f}.py").write_text(body, encoding="utf-8")
+                count += 1
+            if d < depth - 1:
+                next_level.extend(folder / f"pkg_{k}" for k in range(fanout))
+        level = next_level
+    return count
+
+
+# ---------- git / gh falsos ----------
+
+FAKE_GIT = """#!/bin/sh
+# git falso: init crea .git mínimo; no hay remotos
+case "$1" in
+  init)
+    mkdir -p .git
+    printf '[core]\\n\\trepositoryformatversion = 0\\n' > .git/config
+    printf 'ref: refs/heads/main\\n' > .git/HEAD
+    exit 0 ;;
+  remote) exit 2 ;;
+  *) exit 0 ;;
+esac
+"""
+
+FAKE_GH = """#!/bin/sh
+# gh falso sin sesión: la creación del remoto se omite enseguida
+exit 1
+"""
+
+
+def install_fake_tools(bin_dir: Path) -> Path:
+    """Escribe git y gh falsos en bin_dir (anteponer a PATH). Solo POSIX."""
+    if os.name != "posix":
+        raise OSError("los binarios falsos son scripts sh (solo POSIX)")
+    bin_dir.mkdir(parents=True, exist_ok=True)
+    for name, body in (("git", FAKE_GIT), ("gh", FAKE_GH)):
+        path = bin_dir / name
+        path.write_text(body, encoding="utf-8")
+        path.chmod(path.stat().st_mode | stat.S_IEXEC)
+    return bin_dir
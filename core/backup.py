@@ -0,0 +1,365 @@
+# C:\Users\Usuario\Desktop\proyectos\yvolo\core\backup.py
+from __future__ import annotations
+
+import fnmatch
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import zipfile
+import zlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Callable, Deque, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from .backup_catalog import KIND_ZIP, file_checksum, register_backup
+from .paths import backups_base_dir
+from .roadmap import update_info_fields
+
+# Carpetas y ficheros que no se copian por defecto (nombres, admite comodines)
+DEFAULT_EXCLUDES: Tuple[str, ...] = (
+    ".git",
+    ".hg",
+    ".svn",
+    ".venv",
+    "venv",
+    "env",
+    "__pycache__",
+    ".mypy_cache",
+    ".pytest_cache",
+    ".ruff_cache",
+    ".tox",
+    ".nox",
+    "node_modules",
+    "*.pyc",
+    "*.pyo",
+)
+
+# Formatos ya comprimidos: se guardan sin deflate
+STORED_SUFFIXES = frozenset(
+    (".zip", ".gz", ".bz2", ".xz", ".7z", ".rar", ".jpg", ".jpeg", ".png", ".gif", ".webp", ".mp3", ".mp4", ".whl")
+)
+
+CHUNK_SIZE = 1024 * 1024
+# Por encima de esto el comprimido de cada fichero pasa a disco
+SPOOL_MAX = 8 * 1024 * 1024
+
+BackupProgress = Callable[[int, int], None]
+
+
+class BackupCancelled(Exception):
+    pass
+
+
+class BackupResult(NamedTuple):
+    path: Path
+    files: int
+    bytes_in: int
+    bytes_out: int
+    seconds: float
+
+
+def default_workers() -> int:
+    return os.cpu_count() or 1
+
+
+def backup_name(project_name: str, when: Optional[datetime] = None) -> str:
+    when = when or datetime.now()
+    return f"backup_{project_name}_{when.strftime('%Y%m%d_%H%M%S')}.zip"
+
+
+def backup_value(path: Path) -> str:
+    """
+    Valor del campo backup: de #ProyectoInfo.
+    Relativo al home con "\\" (Desktop\\backups\\backup_x.zip), como el promp maestro.
+    """
+    path = Path(path)
+    try:
+        rel = path.resolve().relative_to(Path.home().resolve())
+    except ValueError:
+        return str(path)
+    return "\\".join(rel.parts)
+
+
+def _excluded(name: str, excludes: Sequence[str]) -> bool:
+    return any(name == pat or fnmatch.fnmatchcase(name, pat) for pat in excludes)
+
+
+def iter_project_files(root: Path, excludes: Sequence[str] = DEFAULT_EXCLUDES) -> Iterator[Tuple[str, str, bool]]:
+    """
+    Recorre el proyecto sin seguir enlaces a carpetas.
+
+    Devuelve:
+        (ruta, nombre en el zip, es_carpeta_vacía)
+
+    Los virtualenvs se detectan también por pyvenv.cfg, se llamen como se llamen.
+    """
+    root = Path(root)
+    stack: List[Tuple[str, str]] = [(str(root), "")]
+    while stack:
+        folder, prefix = stack.pop()
+        try:
+            with os.scandir(folder) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            continue
+
+        kept = 0
+        subdirs: List[Tuple[str, str]] = []
+        for entry in entries:
+            if _excluded(entry.name, excludes):
+                continue
+            arcname = prefix + entry.name
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if os.path.isfile(os.path.join(entry.path, "pyvenv.cfg")):
+                        continue
+                    subdirs.append((entry.path, arcname + "/"))
+                    kept += 1
+                elif entry.is_file():
+                    kept += 1
+                    yield entry.path, arcname, False
+            except OSError:
+                continue
+
+        if not kept and prefix:
+            yield folder, prefix, True
+        # Orden estable: la pila invierte
+        stack.extend(reversed(subdirs))
+
+
+def _compress_file(path: str, arcname: str, level: int, chunk_size: int) -> Tuple[zipfile.ZipInfo, IO[bytes]]:
+    """
+    Comprime un fichero por trozos a un SpooledTemporaryFile (deflate crudo).
+    Se ejecuta en los hilos del pool: zlib libera el GIL.
+    """
+    zinfo = zipfile.ZipInfo.from_file(path, arcname)
+    stored = os.path.splitext(arcname)[1].lower() in STORED_SUFFIXES
+    zinfo.compress_type = zipfile.ZIP_STORED if stored else zipfile.ZIP_DEFLATED
+    compressor = None if stored else zlib.compressobj(level, zlib.DEFLATED, -15)
+
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX)
+    crc = 0
+    size = 0
+    try:
+        with open(path, "rb") as f:
+            while True:
+                data = f.read(chunk_size)
+                if not data:
+                    break
+                crc = zlib.crc32(data, crc)
+                size += len(data)
+                spool.write(compressor.compress(data) if compressor else data)
+        if compressor:
+            spool.write(compressor.flush())
+    except Exception:
+        spool.close()
+        raise
+
+    zinfo.CRC = crc
+    zinfo.file_size = size
+    zinfo.compress_size = spool.tell()
+    spool.seek(0)
+    return zinfo, spool
+
+
+# zipfile no permite añadir datos ya comprimidos: el camino rápido escribe
+# con sus internos (_writecheck, FileHeader, start_dir...), iguales de 3.8 a
+# 3.13. En otra versión, o si faltan, se descomprime y se vuelve a escribir
+# con zf.open(zinfo, "w"): más lento, pero sin depender de nada privado.
+_RAW_APPEND = (
+    (3, 8) <= sys.version_info[:2] <= (3, 13)
+    and hasattr(zipfile.ZipFile, "_writecheck")
+    and hasattr(zipfile.ZipInfo, "FileHeader")
+)
+
+
+def _append_compressed(zf: zipfile.ZipFile, zinfo: zipfile.ZipInfo, data: IO[bytes]) -> None:
+    """
+    Añade al zip datos ya comprimidos (deflate crudo o stored) con CRC,
+    file_size y compress_size ya puestos en zinfo.
+    Equivale a lo que hace ZipFile.write() tras comprimir.
+    """
+    if not _RAW_APPEND:
+        _rewrite_compressed(zf, zinfo, data)
+        return
+    zip64 = zinfo.file_size > zipfile.ZIP64_LIMIT or zinfo.compress_size > zipfile.ZIP64_LIMIT
+    zinfo.header_offset = zf.fp.tell()
+    zf._writecheck(zinfo)
+    zf._didModify = True
+    zf.fp.write(zinfo.FileHeader(zip64))
+    shutil.copyfileobj(data, zf.fp, CHUNK_SIZE)
+    zf.filelist.append(zinfo)
+    zf.NameToInfo[zinfo.filename] = zinfo
+    zf.start_dir = zf.fp.tell()
+
+
+def _rewrite_compressed(zf: zipfile.ZipFile, zinfo: zipfile.ZipInfo, data: IO[bytes]) -> None:
+    """Camino sin internos de zipfile: descomprime por trozos y zf.open() recomprime."""
+    decompressor = zlib.decompressobj(-15) if zinfo.compress_type == zipfile.ZIP_DEFLATED else None
+    force_zip64 = zinfo.file_size > zipfile.ZIP64_LIMIT
+    with zf.open(zinfo, "w", force_zip64=force_zip64) as dst:
+        while True:
+            chunk = data.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            if decompressor is None:
+                dst.write(chunk)
+                continue
+            # max_length: un fichero muy comprimible no se expande entero en memoria
+            while chunk:
+                dst.write(decompressor.decompress(chunk, CHUNK_SIZE))
+                chunk = decompressor.unconsumed_tail
+        if decompressor is not None:
+            dst.write(decompressor.flush())
+
+
+def empty_dir_info(arcname: str) -> zipfile.ZipInfo:
+    info = zipfile.ZipInfo(arcname)
+    info.external_attr = (0o40755 << 16) | 0x10
+    return info
+
+
+@contextmanager
+def atomic_zip(target: Path) -> Iterator[zipfile.ZipFile]:
+    """
+    Zip escrito en un .tmp junto a target y renombrado al cerrar bien.
+    Si algo falla (o se cancela) no queda nada.
+    """
+    target = Path(target)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=".backup_", suffix=".tmp", dir=str(target.parent))
+    os.close(fd)
+    try:
+        with zipfile.ZipFile(tmp, "w", allowZip64=True) as zf:
+            yield zf
+        os.replace(tmp, target)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def record_backup(project_dir: Path, zip_path: Path) -> None:
+    """Escribe backup: en #ProyectoInfo (si el proyecto tiene hoja de ruta)."""
+    hoja = Path(project_dir) / "hoja_de_ruta.txt"
+    if hoja.is_file():
+        try:
+            update_info_fields(hoja, backup=backup_value(zip_path))
+        except ValueError:
+            # hoja sin #ProyectoInfo: el zip vale igual
+            pass
+
+
+def create_backup(
+    project_dir: Path,
+    dest_dir: Optional[Path] = None,
+    workers: Optional[int] = None,
+    excludes: Sequence[str] = DEFAULT_EXCLUDES,
+    level: int = 6,
+    chunk_size: int = CHUNK_SIZE,
+    update_roadmap: bool = True,
+    progress: Optional[BackupProgress] = None,
+    cancel_event: Optional[threading.Event] = None,
+) -> BackupResult:
+    """
+    Zip del proyecto en dest_dir (por defecto Desktop\\backups).
+
+    - Los ficheros se comprimen en paralelo (workers hilos) y se escriben
+      en el zip en orden; como mucho 2*workers ficheros en vuelo.
+    - Cada fichero se lee por trozos: memoria acotada aunque pese GB.
+    - Se escribe en un .tmp y se renombra: nunca queda un zip a medias.
+    - update_roadmap: escribe backup: en #ProyectoInfo de hoja_de_ruta.txt.
+
+    progress(ficheros, bytes) tras cada fichero escrito.
+    Lanza BackupCancelled si se activa cancel_event.
+    """
+    t0 = time.perf_counter()
+    project_dir = Path(project_dir).resolve()
+    if not project_dir.is_dir():
+        raise FileNotFoundError(f"No existe el proyecto: {project_dir}")
+
+    dest_dir = Path(dest_dir) if dest_dir is not None else backups_base_dir()
+    created = datetime.now()
+    target = dest_dir / backup_name(project_dir.name, created)
+
+    workers = max(1, workers or default_workers())
+    skip = {os.path.normcase(str(target.parent / ".backup_"))}
+
+    files = 0
+    bytes_in = 0
+    pending: Deque[Future] = deque()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="yvolo-backup") as pool:
+        with atomic_zip(target) as zf:
+
+            def flush_one() -> None:
+                nonlocal files, bytes_in
+                zinfo, spool = pending.popleft().result()
+                with spool:
+                    _append_compressed(zf, zinfo, spool)
+                files += 1
+                bytes_in += zinfo.file_size
+                if progress is not None:
+                    try:
+                        progress(files, bytes_in)
+                    except Exception:
+                        pass
+
+            try:
+                for path, arcname, empty_dir in iter_project_files(project_dir, excludes):
+                    if cancel_event is not None and cancel_event.is_set():
+                        raise BackupCancelled()
+                    if os.path.normcase(path).startswith(tuple(skip)):
+                        # el propio .tmp si dest_dir está dentro del proyecto
+                        continue
+                    if empty_dir:
+                        zf.writestr(empty_dir_info(arcname), b"")
+                        continue
+                    pending.append(pool.submit(_compress_file, path, arcname, level, chunk_size))
+                    if len(pending) >= 2 * workers:
+                        flush_one()
+                while pending:
+                    if cancel_event is not None and cancel_event.is_set():
+                        raise BackupCancelled()
+                    flush_one()
+            finally:
+                # Liberar spools de trabajos no escritos
+                for fut in pending:
+                    fut.cancel()
+                    if not fut.cancelled():
+                        try:
+                            fut.result()[1].close()
+                        except Exception:
+                            pass
+
+    if update_roadmap:
+        record_backup(project_dir, target)
+
+    size = target.stat().st_size
+    register_backup(target.parent, project_dir.name, KIND_ZIP, target, created, size, file_checksum(target))
+    return BackupResult(target, files, bytes_in, size, time.perf_counter() - t0)
+
+
+def backup_project(project_dir: Path, **kwargs) -> Tuple[bool, str]:
+    """
+    Igual que create_backup pero con el contrato (ok, mensaje) de la UI/CLI.
+    """
+    try:
+        result = create_backup(project_dir, **kwargs)
+    except BackupCancelled:
+        return False, "Backup cancelado."
+    except Exception as e:
+        return False, f"Error creando backup: {e}"
+    mb_in = result.bytes_in / (1024 * 1024)
+    mb_out = result.bytes_out / (1024 * 1024)
+    return True, (
+        f"Backup creado: {result.path}\n"
+        f"{result.files} ficheros, {mb_in:.1f} MB -> {mb_out:.1f} MB en {result.seconds:.2f}s"
+    )
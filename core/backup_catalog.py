@@ -0,0 +1,392 @@
+# C:\Users\Usuario\Desktop\proyectos\yvolo\core\backup_catalog.py
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from .config import CONFIG
+from .paths import backups_base_dir
+
+# Índice de Desktop\backups: catalog.json junto a los zips.
+#
+#   {"version": 1, "projects": {"demo": [entrada, ...]}}   (cada lista por fecha)
+#
+# entrada = {"kind": "zip"|"snapshot", "path": "...", "created": "YYYYmmdd_HHMMSS",
+#            "size": bytes, "checksum": sha256}
+
+CATALOG_FILE = "catalog.json"
+CATALOG_TS_FORMAT = "%Y%m%d_%H%M%S"
+KIND_ZIP = "zip"
+KIND_SNAPSHOT = "snapshot"
+
+_ZIP_NAME_RE = re.compile(r"^backup_(.+)_(\d{8}_\d{6})\.zip$")
+
+Entry = Dict[str, Any]
+
+
+class RetentionPolicy(NamedTuple):
+    """
+    Se conserva la unión de:
+        - los keep_last backups más recientes
+        - el más reciente de cada uno de los últimos keep_daily días
+        - el más reciente de cada una de las últimas keep_weekly semanas
+    """
+
+    keep_last: int = 10
+    keep_daily: int = 7
+    keep_weekly: int = 4
+
+
+def file_checksum(path: Path, chunk_size: int = 1024 * 1024) -> str:
+    sha = hashlib.sha256()
+    with Path(path).open("rb") as f:
+        while True:
+            data = f.read(chunk_size)
+            if not data:
+                break
+            sha.update(data)
+    return sha.hexdigest()
+
+
+def select_pruned(entries: List[Entry], policy: RetentionPolicy) -> List[Entry]:
+    """Entradas que sobran según policy (entries en cualquier orden)."""
+    newest_first = sorted(entries, key=lambda e: e["created"], reverse=True)
+    keep = set()
+
+    for e in newest_first[: max(0, policy.keep_last)]:
+        keep.add(e["path"])
+
+    for limit, bucket in (
+        (policy.keep_daily, lambda d: d.date()),
+        (policy.keep_weekly, lambda d: d.isocalendar()[:2]),
+    ):
+        seen = set()
+        for e in newest_first:
+            if len(seen) >= limit:
+                break
+            try:
+                key = bucket(datetime.strptime(e["created"], CATALOG_TS_FORMAT))
+            except ValueError:
+                continue
+            if key not in seen:
+                seen.add(key)
+                keep.add(e["path"])
+
+    return [e for e in newest_first if e["path"] not in keep]
+
+
+class BackupCatalog:
+    """
+    Catálogo persistente de backups por proyecto.
+
+    - latest(proyecto) es O(1): listas ordenadas por fecha en memoria.
+    - Se recarga solo si catalog.json cambió en disco (mtime_ns, size),
+      así varios procesos pueden compartirlo.
+    - Guardado atómico (tmp + replace).
+    """
+
+    def __init__(self, folder: Optional[Path] = None) -> None:
+        self.folder = Path(folder) if folder is not None else backups_base_dir()
+        self.path = self.folder / CATALOG_FILE
+        self._lock = threading.RLock()
+        self._projects: Dict[str, List[Entry]] = {}
+        self._sig: Optional[Tuple[int, int]] = None
+        self._loaded = False
+
+    # ---------- persistencia ----------
+
+    def _stat_sig(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _refresh(self) -> None:
+        # Llamar con self._lock adquirido
+        sig = self._stat_sig()
+        if self._loaded and sig == self._sig:
+            return
+        projects: Dict[str, List[Entry]] = {}
+        if sig is not None:
+            try:
+                with self.path.open("r", encoding="utf-8") as f:
+                    data = json.load(f)
+                raw = data.get("projects", {}) if isinstance(data, dict) else {}
+                for name, items in raw.items():
+                    if isinstance(items, list):
+                        projects[name] = sorted(
+                            (i for i in items if isinstance(i, dict) and "path" in i and "created" in i),
+                            key=lambda e: e["created"],
+                        )
+            except (OSError, ValueError, AttributeError):
+                projects = {}
+        self._projects = projects
+        self._sig = sig
+        self._loaded = True
+
+    def _save(self) -> None:
+        # Llamar con self._lock adquirido
+        self.folder.mkdir(parents=True, exist_ok=True)
+        payload = json.dumps({"version": 1, "projects": self._projects}, ensure_ascii=False, indent=1)
+        fd, tmp = tempfile.mkstemp(prefix=".catalog.", suffix=".tmp", dir=str(self.folder))
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp, self.path)
+        except Exception:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            return
+        self._sig = self._stat_sig()
+
+    # ---------- API ----------
+
+    def add(
+        self,
+        project: str,
+        kind: str,
+        path: Path,
+        created: datetime,
+        size: int,
+        checksum: str = "",
+    ) -> Entry:
+        entry = {
+            "kind": kind,
+            "path": str(path),
+            "created": created.strftime(CATALOG_TS_FORMAT),
+            "size": int(size),
+            "checksum": checksum,
+        }
+        with self._lock:
+            self._refresh()
+            items = [e for e in self._projects.get(project, []) if e["path"] != entry["path"]]
+            items.append(entry)
+            if len(items) > 1 and items[-2]["created"] > entry["created"]:
+                items.sort(key=lambda e: e["created"])
+            self._projects[project] = items
+            self._save()
+        return entry
+
+    def latest(self, project: str, kind: Optional[str] = None) -> Optional[Entry]:
+        with self._lock:
+            self._refresh()
+            items = self._projects.get(project, [])
+            if kind is None:
+                return dict(items[-1]) if items else None
+            for e in reversed(items):
+                if e["kind"] == kind:
+                    return dict(e)
+            return None
+
+    def entries(self, project: str) -> List[Entry]:
+        with self._lock:
+            self._refresh()
+            return [dict(e) for e in self._projects.get(project, [])]
+
+    def projects(self) -> List[str]:
+        with self._lock:
+            self._refresh()
+            return sorted(self._projects)
+
+    def remove(self, paths: List[str]) -> int:
+        drop = set(paths)
+        with self._lock:
+            self._refresh()
+            n = 0
+            for name in list(self._projects):
+                kept = [e for e in self._projects[name] if e["path"] not in drop]
+                n += len(self._projects[name]) - len(kept)
+                if kept:
+                    self._projects[name] = kept
+                else:
+                    del self._projects[name]
+            if n:
+                self._save()
+            return n
+
+    def rebuild(self, checksums: bool = False) -> int:
+        """
+        Reconstruye el catálogo de los zips backup_<nombre>_<fecha>.zip de la
+        carpeta (migración desde antes del catálogo). Conserva las entradas
+        de snapshots que sigan existiendo.
+        """
+        found: Dict[str, List[Entry]] = {}
+        try:
+            names = os.listdir(self.folder)
+        except OSError:
+            names = []
+        for fname in names:
+            m = _ZIP_NAME_RE.match(fname)
+            if not m:
+                continue
+            path = self.folder / fname
+            try:
+                size = path.stat().st_size
+            except OSError:
+                continue
+            found.setdefault(m.group(1), []).append(
+                {
+                    "kind": KIND_ZIP,
+                    "path": str(path),
+                    "created": m.group(2),
+                    "size": size,
+                    "checksum": file_checksum(path) if checksums else "",
+                }
+            )
+
+        with self._lock:
+            self._refresh()
+            for name, items in self._projects.items():
+                for e in items:
+                    if e["kind"] == KIND_SNAPSHOT and Path(e["path"]).is_file():
+                        found.setdefault(name, []).append(e)
+            for items in found.values():
+                items.sort(key=lambda e: e["created"])
+            self._projects = found
+            self._save()
+            return sum(len(v) for v in found.values())
+
+    # ---------- retención ----------
+
+    def prune(self, policy: RetentionPolicy, project: Optional[str] = None, dry_run: bool = False) -> List[Entry]:
+        """
+        Borra los backups que sobran según policy (zip o manifiesto de
+        snapshot) y los quita del catálogo. Si se borra algún snapshot se
+        liberan los objetos del almacén que ya nadie referencia.
+        """
+        with self._lock:
+            self._refresh()
+            names = [project] if project is not None else list(self._projects)
+            doomed: List[Entry] = []
+            for name in names:
+                doomed.extend(select_pruned(self._projects.get(name, []), policy))
+
+        if dry_run or not doomed:
+            return doomed
+
+        removed: List[str] = []
+        for e in doomed:
+            try:
+                os.unlink(e["path"])
+            except FileNotFoundError:
+                pass
+            except OSError:
+                # en uso (Windows): se reintentará en la próxima poda
+                continue
+            removed.append(e["path"])
+
+        self.remove(removed)
+        if any(e["kind"] == KIND_SNAPSHOT for e in doomed):
+            # Import local: snapshots depende de backup, que registra aquí
+            from .snapshots import BackupStore
+
+            try:
+                BackupStore(self.folder / "store").collect_garbage()
+            except OSError:
+                pass
+        return [e for e in doomed if e["path"] in set(removed)]
+
+
+_catalogs: Dict[str, BackupCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def catalog_for(folder: Optional[Path] = None) -> BackupCatalog:
+    """Catálogo compartido del proceso para una carpeta de backups."""
+    folder = Path(folder) if folder is not None else backups_base_dir()
+    key = os.path.normcase(str(folder.resolve()))
+    with _catalogs_lock:
+        catalog = _catalogs.get(key)
+        if catalog is None:
+            catalog = _catalogs[key] = BackupCatalog(folder)
+            if folder.is_dir() and not catalog.path.exists():
+                # Primera vez: indexar los zips que ya hubiera
+                catalog.rebuild()
+        return catalog
+
+
+def latest_backup(project: str, folder: Optional[Path] = None) -> Optional[Entry]:
+    return catalog_for(folder).latest(project)
+
+
+def format_catalog(catalog: BackupCatalog, project: Optional[str] = None) -> str:
+    names = [project] if project else catalog.projects()
+    lines: List[str] = []
+    for name in names:
+        entries = catalog.entries(name)
+        if not entries:
+            continue
+        lines.append(f"{name}:")
+        for e in reversed(entries):
+            lines.append(f"  {e['created']}  {e['kind']:<8}  {e['size'] / (1024 * 1024):8.1f} MB  {e['path']}")
+    return "\n".join(lines) if lines else "No hay backups registrados."
+
+
+def retention_policy(config: Dict[str, Any]) -> Optional[RetentionPolicy]:
+    """
+    Política de settings.json (None = no podar automáticamente):
+        "backup_retention": {"keep_last": 10, "keep_daily": 7, "keep_weekly": 4}
+    """
+    raw = config.get("backup_retention")
+    if not isinstance(raw, dict):
+        return None
+    defaults = RetentionPolicy()
+    try:
+        return RetentionPolicy(
+            keep_last=int(raw.get("keep_last", defaults.keep_last)),
+            keep_daily=int(raw.get("keep_daily", defaults.keep_daily)),
+            keep_weekly=int(raw.get("keep_weekly", defaults.keep_weekly)),
+        )
+    except (TypeError, ValueError):
+        return None
+
+
+def prune_in_background(
+    catalog: BackupCatalog,
+    policy: RetentionPolicy,
+    project: Optional[str] = None,
+) -> threading.Thread:
+    def run() -> None:
+        try:
+            catalog.prune(policy, project=project)
+        except Exception:
+            # no romper flujo: la poda es de mantenimiento
+            pass
+
+    t = threading.Thread(target=run, name="yvolo-backup-prune", daemon=True)
+    t.start()
+    return t
+
+
+def register_backup(
+    folder: Path,
+    project: str,
+    kind: str,
+    path: Path,
+    created: datetime,
+    size: int,
+    checksum: str = "",
+) -> None:
+    """
+    Apunta un backup recién escrito y, si settings.json define
+    backup_retention, poda ese proyecto en segundo plano.
+    """
+    try:
+        catalog = catalog_for(folder)
+        catalog.add(project, kind, path, created, size, checksum)
+    except Exception:
+        # no romper flujo: el backup ya está en disco
+        return
+    policy = retention_policy(CONFIG.get())
+    if policy is not None:
+        prune_in_background(catalog, policy, project=project)
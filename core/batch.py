@@ -0,0 +1,211 @@
+# C:\Users\Usuario\Desktop\proyectos\yvolo\core\batch.py
+from __future__ import annotations
+
+import csv
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Set, Tuple
+
+from .paths import projects_base_dir
+from .project_creator import create_new_project, load_templates, sanitize_project_name
+from .templates import HojaTemplate
+
+if TYPE_CHECKING:
+    from .project_catalog import ProjectCatalog
+    from .remote_queue import RemoteQueue
+
+
+class BatchEntry(NamedTuple):
+    name: str
+    project_type: str
+    tasks: List[str]
+    open_vscode: bool
+
+
+class BatchResult(NamedTuple):
+    name: str
+    ok: bool
+    message: str
+    seconds: float
+
+
+def default_workers() -> int:
+    # Trabajo dominado por subprocesos git/gh: hilos, acotados.
+    return min(8, (os.cpu_count() or 1) + 2)
+
+
+def _split_tasks(value: Any) -> List[str]:
+    if value is None:
+        return []
+    if isinstance(value, list):
+        raw = [str(v) for v in value]
+    else:
+        raw = str(value).replace("|", "\n").splitlines()
+    return [t.strip() for t in raw if t and t.strip()]
+
+
+def _to_bool(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    return str(value or "").strip().lower() in ("1", "true", "si", "sí", "yes")
+
+
+def _entry_from_dict(data: Dict[str, Any]) -> BatchEntry:
+    return BatchEntry(
+        name=str(data.get("name") or "").strip(),
+        project_type=str(data.get("type") or "Vacío").strip() or "Vacío",
+        tasks=_split_tasks(data.get("tasks")),
+        open_vscode=_to_bool(data.get("open_vscode", False)),
+    )
+
+
+def load_manifest(path: Path) -> List[BatchEntry]:
+    """
+    Manifiesto JSON:
+        [{"name": "...", "type": "Python", "tasks": ["...", "..."]}, ...]
+        o {"projects": [...]}
+
+    Manifiesto CSV (con cabecera):
+        name,type,tasks
+        demo,Flask,tarea 1|tarea 2
+
+    En CSV las tareas se separan con "|" o saltos de línea.
+    """
+    path = Path(path)
+    if path.suffix.lower() == ".csv":
+        with path.open("r", encoding="utf-8-sig", newline="") as f:
+            return [_entry_from_dict(row) for row in csv.DictReader(f)]
+
+    with path.open("r", encoding="utf-8") as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        data = data.get("projects")
+    if not isinstance(data, list):
+        raise ValueError("El manifiesto debe ser una lista de proyectos")
+    return [_entry_from_dict(item) for item in data if isinstance(item, dict)]
+
+
+def check_collisions(
+    entries: List[BatchEntry],
+    base: Optional[Path] = None,
+    catalog: Optional["ProjectCatalog"] = None,
+) -> List[str]:
+    """
+    Valida el lote completo antes de crear nada.
+    Devuelve lista de errores (vacía si todo OK).
+
+    Cada nombre se comprueba en disco (un stat por entrada: cubre lo creado
+    fuera de yvolo o aún sin indexar). El catálogo de proyectos es una fuente
+    más: detecta nombres que en disco difieren solo en mayúsculas y, de paso,
+    olvida los proyectos borrados a mano.
+    """
+    if catalog is None and base is None:
+        from .project_catalog import default_catalog
+
+        catalog = default_catalog()
+    if catalog is not None:
+        base = catalog.base
+    base = base or projects_base_dir()
+    errors: List[Tuple[int, str]] = []
+    seen: Dict[str, int] = {}
+    candidates: List[Tuple[int, str]] = []
+
+    for i, entry in enumerate(entries, start=1):
+        name = sanitize_project_name(entry.name)
+        if not name:
+            errors.append((i, f"Entrada {i}: nombre de proyecto inválido ({entry.name!r})."))
+            continue
+        key = name.lower()
+        if key in seen:
+            errors.append((i, f"Entrada {i}: '{name}' repetido (ya en entrada {seen[key]})."))
+            continue
+        seen[key] = i
+        candidates.append((i, name))
+
+    taken = _taken_names([n for _, n in candidates], base, catalog)
+    for i, name in candidates:
+        if name.lower() in taken:
+            errors.append((i, f"Entrada {i}: ya existe {base / name}"))
+
+    errors.sort(key=lambda e: e[0])
+    return [msg for _, msg in errors]
+
+
+def _taken_names(names: List[str], base: Path, catalog: Optional["ProjectCatalog"]) -> Set[str]:
+    taken = {n.lower() for n in names if (base / n).exists()}
+    if catalog is not None:
+        try:
+            for name in catalog.existing(names):
+                record = catalog.get(name)
+                if record is not None and Path(record.path).exists():
+                    taken.add(name.lower())
+                else:
+                    catalog.forget(name)
+        except Exception:
+            pass  # no romper flujo: queda la comprobación en disco
+    return taken
+
+
+def _create_one(
+    entry: BatchEntry,
+    templates: Tuple[str, HojaTemplate],
+    remote_queue: Optional["RemoteQueue"],
+) -> BatchResult:
+    t0 = time.perf_counter()
+    try:
+        ok, msg = create_new_project(
+            project_name=entry.name,
+            project_type=entry.project_type,
+            open_vscode=entry.open_vscode,
+            tasks=entry.tasks,
+            templates=templates,
+            remote_queue=remote_queue,
+        )
+    except Exception as e:
+        ok, msg = False, f"Error creando proyecto: {e}"
+    return BatchResult(entry.name, ok, msg, time.perf_counter() - t0)
+
+
+def run_batch(
+    entries: List[BatchEntry],
+    workers: Optional[int] = None,
+    remote_queue: Optional["RemoteQueue"] = None,
+) -> Tuple[List[BatchResult], float]:
+    """
+    Crea todos los proyectos del lote en un pool acotado de hilos.
+    Las plantillas salen de la caché de proceso (una lectura por lote).
+    Con remote_queue los repos remotos se encolan en lugar de crearse en línea.
+
+    Devuelve:
+        (resultados en el orden del manifiesto, segundos totales)
+    """
+    t0 = time.perf_counter()
+    templates = load_templates()
+    workers = max(1, workers or default_workers())
+
+    results: Dict[int, BatchResult] = {}
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(_create_one, e, templates, remote_queue): i for i, e in enumerate(entries)}
+        for fut in as_completed(futures):
+            results[futures[fut]] = fut.result()
+
+    ordered = [results[i] for i in range(len(entries))]
+    return ordered, time.perf_counter() - t0
+
+
+def format_summary(results: List[BatchResult], total_seconds: float, workers: int) -> str:
+    lines: List[str] = []
+    width = max([len(r.name) for r in results] + [4])
+    for r in results:
+        tag = "[OK]   " if r.ok else "[ERROR]"
+        lines.append(f"{tag} {r.name:<{width}}  {r.seconds:6.2f}s  {r.message}")
+
+    ok_count = sum(1 for r in results if r.ok)
+    lines.append(
+        f"Total: {len(results)} proyectos, {ok_count} OK, "
+        f"{len(results) - ok_count} error(es) en {total_seconds:.2f}s (workers={workers})"
+    )
+    return "\n".join(lines)
@@ -0,0 +1,198 @@
+# C:\Users\Usuario\Desktop\proyectos\yvolo\core\chat_bundle.py
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import zipfile
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from .backup import STORED_SUFFIXES, atomic_zip
+from .backup_catalog import CATALOG_FILE, KIND_ZIP, file_checksum, latest_backup
+from .paths import appdata_dir, backups_base_dir, yvolo_root_file
+from .roadmap import load_roadmap
+from .roadmap_tail import read_info
+
+# Paquete para "Abrir Chat": hoja_de_ruta.txt, promp_maestro.txt y el último
+# backup del proyecto. Se identifica por el hash de su contenido y solo se
+# recalcula cuando cambia alguna entrada; el clic en la UI solo hace stat().
+
+StatSig = Tuple[str, int, int]
+
+
+class ChatBundle(NamedTuple):
+    key: str
+    files: List[Path]
+    backup: Optional[Path]
+    archive: Optional[Path]
+    command: str
+
+
+def bundles_dir() -> Path:
+    return appdata_dir() / "chat_bundles"
+
+
+def _ps_quote(value: str) -> str:
+    # Cadena entre comillas dobles de PowerShell: escapar ` " $
+    return '"' + value.replace("`", "``").replace('"', '`"').replace("$", "`$") + '"'
+
+
+def powershell_filedrop_command(files: List[Path]) -> str:
+    """Script PowerShell que deja files en el portapapeles como FileDropList."""
+    parts = [
+        "Add-Type -AssemblyName System.Windows.Forms;",
+        "$files = New-Object System.Collections.Specialized.StringCollection;",
+    ]
+    parts.extend(f"$files.Add({_ps_quote(str(f))});" for f in files)
+    parts.append("[System.Windows.Forms.Clipboard]::SetFileDropList($files);")
+    return "".join(parts)
+
+
+def resolve_backup(hoja: Path) -> Optional[Path]:
+    """
+    Backup que indica backup: de #ProyectoInfo (relativo al home, como lo
+    escribe el promp maestro). Si no existe, el último zip del catálogo
+    para name_project.
+    """
+    try:
+        # Solo hace falta #ProyectoInfo: se lee desde el final del fichero
+        info = read_info(hoja)
+        if info is None:
+            info = load_roadmap(hoja).info
+    except (OSError, ValueError):
+        return None
+    if info is None:
+        return None
+
+    value = info.backup.strip()
+    if value:
+        candidate = Path(value.replace("\\", os.sep))
+        if not candidate.is_absolute():
+            candidate = Path.home() / candidate
+        if candidate.is_file():
+            return candidate
+
+    name = info.name_project.strip()
+    if name and backups_base_dir().is_dir():
+        entry = latest_backup(name)
+        if entry is not None and entry["kind"] == KIND_ZIP and Path(entry["path"]).is_file():
+            return Path(entry["path"])
+    return None
+
+
+def _stat_sig(path: Optional[Path]) -> Optional[StatSig]:
+    if path is None:
+        return None
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return str(path), st.st_mtime_ns, st.st_size
+
+
+class ChatBundleBuilder:
+    """
+    Caché de ChatBundle.
+
+    - Sin cambios (stat de las entradas igual): se devuelve el mismo
+      bundle sin leer nada.
+    - Con cambios: se hashea el contenido; si el hash coincide con el
+      anterior (p.ej. solo cambió mtime) tampoco se reconstruye.
+    - archive=True genera además chat_<hash>.zip en bundles_dir() para
+      entregar un único fichero; se borran los de hashes anteriores.
+    """
+
+    def __init__(self, out_dir: Optional[Path] = None) -> None:
+        self.out_dir = Path(out_dir) if out_dir is not None else None
+        self._lock = threading.Lock()
+        self._sigs: Optional[Tuple[Optional[StatSig], ...]] = None
+        self._bundle: Optional[ChatBundle] = None
+        # Backup resuelto por (firma de la hoja, firma de catalog.json): un
+        # backup nuevo en el catálogo cuenta aunque la hoja no cambie
+        self._backup_for: Tuple[Optional[Tuple[Optional[StatSig], ...]], Optional[Path]] = (None, None)
+        # Hash por (ruta, mtime, tamaño): el zip del backup no se relee
+        # cuando solo cambia la hoja de ruta
+        self._hashes: Dict[StatSig, str] = {}
+        self.builds = 0
+
+    def _content_key(self, inputs: List[Path], sigs: List[StatSig]) -> str:
+        hashes: Dict[StatSig, str] = {}
+        sha = hashlib.sha256()
+        for path, sig in zip(inputs, sigs):
+            digest = self._hashes.get(sig) or file_checksum(path)
+            hashes[sig] = digest
+            sha.update(path.name.encode("utf-8") + b"\0")
+            sha.update(digest.encode("ascii"))
+        self._hashes = hashes
+        return sha.hexdigest()
+
+    def _write_archive(self, key: str, inputs: List[Path]) -> Path:
+        out_dir = self.out_dir or bundles_dir()
+        target = out_dir / f"chat_{key[:16]}.zip"
+        if not target.is_file():
+            with atomic_zip(target) as zf:
+                for path in inputs:
+                    stored = path.suffix.lower() in STORED_SUFFIXES
+                    zf.write(path, path.name, zipfile.ZIP_STORED if stored else zipfile.ZIP_DEFLATED)
+        for old in out_dir.glob("chat_*.zip"):
+            if old != target:
+                try:
+                    old.unlink()
+                except OSError:
+                    pass
+        return target
+
+    def build(
+        self,
+        hoja: Optional[Path] = None,
+        promp: Optional[Path] = None,
+        archive: bool = False,
+    ) -> Optional[ChatBundle]:
+        """
+        Devuelve None si no existe ninguna de las entradas.
+        """
+        hoja = Path(hoja) if hoja is not None else yvolo_root_file("hoja_de_ruta.txt")
+        promp = Path(promp) if promp is not None else yvolo_root_file("promp_maestro.txt")
+
+        with self._lock:
+            hoja_sig = _stat_sig(hoja)
+            backup_key = (hoja_sig, _stat_sig(backups_base_dir() / CATALOG_FILE))
+            if hoja_sig is not None and self._backup_for[0] == backup_key:
+                backup = self._backup_for[1]
+            else:
+                backup = resolve_backup(hoja) if hoja_sig is not None else None
+                self._backup_for = (backup_key, backup)
+            sigs = (hoja_sig, _stat_sig(promp), _stat_sig(backup))
+
+            bundle = self._bundle
+            if bundle is not None and sigs == self._sigs and (not archive or bundle.archive is not None):
+                return bundle
+
+            present = [(p, sig) for p, sig in zip((hoja, promp, backup), sigs) if sig is not None]
+            if not present:
+                self._sigs, self._bundle = sigs, None
+                return None
+
+            inputs = [p for p, _ in present]
+            key = self._content_key(inputs, [sig for _, sig in present])
+            if bundle is None or bundle.key != key or (archive and bundle.archive is None):
+                self.builds += 1
+                bundle = ChatBundle(
+                    key=key,
+                    files=inputs,
+                    backup=backup if sigs[2] is not None else None,
+                    archive=self._write_archive(key, inputs) if archive else None,
+                    command=powershell_filedrop_command(inputs),
+                )
+            self._sigs, self._bundle = sigs, bundle
+            return bundle
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._sigs = None
+            self._bundle = None
+            self._backup_for = (None, None)
+
+
+CHAT_BUNDLES = ChatBundleBuilder()
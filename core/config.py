@@ -1,9 +1,12 @@
 # C:\Users\Usuario\Desktop\proyectos\yvolo\core\config.py
 from __future__ import annotations
 
+import copy
 import json
+import os
+import threading
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from .paths import app_dir, is_frozen_exe, appdata_dir
 
@@ -36,7 +39,17 @@ def _load_json(path: Path) -> Dict[str, Any]:
     return data
 
 
-def load_config() -> Dict[str, Any]:
+def _validate(data: Dict[str, Any]) -> Dict[str, Any]:
+    data.setdefault("app_name", DEFAULT_CONFIG["app_name"])
+    data = _ensure_labels(data)
+    labels = data["labels"]
+    for key, value in list(labels.items()):
+        if not isinstance(value, str):
+            labels[key] = DEFAULT_CONFIG["labels"].get(key, str(value))
+    return data
+
+
+def config_candidates() -> List[Path]:
     """
     SOURCE:
         <repo>/config/settings.json
@@ -48,29 +61,137 @@ def load_config() -> Dict[str, Any]:
         3) %APPDATA%/yvolo/settings.json
         4) DEFAULT_CONFIG
     """
-
     if not is_frozen_exe():
-        cfg_path = app_dir() / "config" / "settings.json"
-        try:
-            data = _load_json(cfg_path)
-            data.setdefault("app_name", DEFAULT_CONFIG["app_name"])
-            data = _ensure_labels(data)
+        return [app_dir() / "config" / "settings.json"]
+    return [
+        app_dir() / "config" / "settings.json",
+        app_dir() / "settings.json",
+        appdata_dir() / "settings.json",
+    ]
+
+
+Signature = Tuple[Tuple[str, int, int], ...]
+Listener = Callable[[Dict[str, Any]], None]
+
+
+class ConfigService:
+    """
+    Configuración cacheada para todo el proceso.
+
+    - Las rutas candidatas se resuelven una vez.
+    - refresh() solo hace stat(); vuelve a parsear si cambia la firma
+      (mtime_ns, size) de alguna candidata.
+    - get() es un acceso a dict.
+    - subscribe() avisa cuando la configuración efectiva cambia.
+    """
+
+    def __init__(self, candidates: Optional[List[Path]] = None) -> None:
+        self._candidates = candidates
+        self._lock = threading.RLock()
+        self._signature: Optional[Signature] = None
+        self._data: Optional[Dict[str, Any]] = None
+        self._listeners: List[Listener] = []
+        self.source: Optional[Path] = None
+        self.skipped: List[Tuple[Path, str]] = []
+
+    @property
+    def candidates(self) -> List[Path]:
+        if self._candidates is None:
+            self._candidates = config_candidates()
+        return self._candidates
+
+    def _stat_signature(self) -> Signature:
+        sig = []
+        for path in self.candidates:
+            try:
+                st = os.stat(path)
+                sig.append((str(path), st.st_mtime_ns, st.st_size))
+            except OSError:
+                sig.append((str(path), -1, -1))
+        return tuple(sig)
+
+    def _load(self) -> Dict[str, Any]:
+        skipped: List[Tuple[Path, str]] = []
+        for path in self.candidates:
+            try:
+                data = _validate(_load_json(path))
+            except FileNotFoundError:
+                skipped.append((path, "no existe"))
+                continue
+            except (ValueError, OSError) as e:
+                # json.JSONDecodeError es ValueError
+                skipped.append((path, f"inválido: {e}"))
+                continue
+            self.source = path
+            self.skipped = skipped
             return data
-        except Exception:
-            return dict(DEFAULT_CONFIG)
-
-    portable_1 = app_dir() / "config" / "settings.json"
-    portable_2 = app_dir() / "settings.json"
-    user_cfg = appdata_dir() / "settings.json"
-
-    for path in (portable_1, portable_2, user_cfg):
-        try:
-            if path.exists():
-                data = _load_json(path)
-                data.setdefault("app_name", DEFAULT_CONFIG["app_name"])
-                data = _ensure_labels(data)
-                return data
-        except Exception:
-            continue
-
-    return dict(DEFAULT_CONFIG)
+
+        self.source = None
+        self.skipped = skipped
+        return copy.deepcopy(DEFAULT_CONFIG)
+
+    def refresh(self) -> bool:
+        """
+        Recarga si cambió algún fichero candidato.
+        Devuelve True si la configuración efectiva cambió.
+        """
+        with self._lock:
+            sig = self._stat_signature()
+            if sig == self._signature and self._data is not None:
+                return False
+            self._signature = sig
+            data = self._load()
+            if data == self._data:
+                return False
+            self._data = data
+            listeners = list(self._listeners)
+
+        for cb in listeners:
+            try:
+                cb(data)
+            except Exception:
+                # no romper flujo
+                pass
+        return True
+
+    def get(self) -> Dict[str, Any]:
+        """Configuración cacheada (no modificar; usar load_config() para una copia)."""
+        data = self._data
+        if data is None:
+            self.refresh()
+            data = self._data
+        return data
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._signature = None
+
+    def subscribe(self, callback: Listener) -> Callable[[], None]:
+        with self._lock:
+            self._listeners.append(callback)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                if callback in self._listeners:
+                    self._listeners.remove(callback)
+
+        return unsubscribe
+
+    def describe(self) -> str:
+        self.get()
+        lines = [f"Config: {self.source if self.source else 'DEFAULT_CONFIG'}"]
+        for path, reason in self.skipped:
+            lines.append(f"  descartado {path}: {reason}")
+        return "\n".join(lines)
+
+
+CONFIG = ConfigService()
+
+
+def load_config() -> Dict[str, Any]:
+    """
+    Copia de la configuración efectiva (ver config_candidates()).
+    Comprueba cambios en disco con stat() antes de devolverla.
+    """
+    CONFIG.refresh()
+    return copy.deepcopy(CONFIG.get())
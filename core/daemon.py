@@ -0,0 +1,344 @@
+# C:\Users\Usuario\Desktop\proyectos\yvolo\core\daemon.py
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import threading
+import time
+from multiprocessing.connection import AuthenticationError, Client, Connection, Listener
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
+
+from .paths import appdata_dir
+
+if TYPE_CHECKING:
+    from .remote_queue import RemoteQueue
+
+# Servicio residente opcional (python ui_main.py --daemon).
+#
+# Mantiene en memoria lo que cada arranque en frío vuelve a leer: config,
+# plantillas, "gh auth status", catálogo de proyectos y la cola de remotos;
+# un FileWatcher los mantiene al día. La CLI le pasa los comandos por un
+# socket Unix (o una tubería con nombre en Windows) y, si no hay demonio,
+# los ejecuta en su propio proceso como siempre.
+#
+# Este módulo solo importa stdlib y core.paths al cargarse: es lo que paga
+# la CLI para preguntar si hay demonio.
+
+# Cambia si cambian los comandos o sus respuestas: un demonio de otra
+# versión se trata como ausente
+PROTOCOL = 1
+
+KEY_FILE = "daemon.key"
+SOCKET_FILE = "daemon.sock"
+
+
+class DaemonError(Exception):
+    """
+    El demonio recibió el comando y falló (o se perdió la conexión antes de
+    la respuesta). Puede que ya lo ejecutara en parte: no se repite.
+    """
+
+
+class DaemonRunning(Exception):
+    pass
+
+
+def daemon_address() -> Tuple[str, str]:
+    """(dirección, familia) de multiprocessing.connection."""
+    if sys.platform == "win32":
+        user = os.environ.get("USERNAME", "user")
+        return rf"\\.\pipe\yvolo-{user}", "AF_PIPE"
+    return str(appdata_dir() / SOCKET_FILE), "AF_UNIX"
+
+
+def _key_path() -> Path:
+    return appdata_dir() / KEY_FILE
+
+
+def _read_key() -> Optional[bytes]:
+    try:
+        key = _key_path().read_bytes()
+    except OSError:
+        return None
+    return key or None
+
+
+def _write_key() -> bytes:
+    """Clave nueva en cada arranque; mkstemp la crea solo legible por el usuario."""
+    path = _key_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    key = os.urandom(32)
+    fd, tmp = tempfile.mkstemp(prefix=".daemon.", suffix=".tmp", dir=str(path.parent))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(key)
+        os.replace(tmp, path)
+    except Exception:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    return key
+
+
+# =========================
+# Cliente
+# =========================
+
+
+def connect() -> Optional[Connection]:
+    """Conexión con el demonio o None si no está corriendo."""
+    address, family = daemon_address()
+    if family == "AF_UNIX" and not os.path.exists(address):
+        return None
+    key = _read_key()
+    if key is None:
+        return None
+    try:
+        return Client(address, family, authkey=key)
+    except (OSError, EOFError, AuthenticationError):
+        # Socket huérfano de un demonio muerto o clave de otro arranque
+        return None
+
+
+def forward(command: str, **kwargs: Any) -> Optional[Any]:
+    """
+    Ejecuta command en el demonio. None si no hay demonio, no se pudo
+    conectar o enviar, o es de otra versión: el comando no llegó a ejecutarse
+    y quien llama lo ejecuta en su proceso. Después de enviarlo, tanto los
+    errores del comando como una conexión perdida llegan como DaemonError.
+    """
+    conn = connect()
+    if conn is None:
+        return None
+    try:
+        try:
+            conn.send(("call", PROTOCOL, command, kwargs))
+        except OSError:
+            return None
+        try:
+            status, payload = conn.recv()
+        except (OSError, EOFError) as e:
+            raise DaemonError(f"conexión perdida con el demonio: {e}") from e
+    finally:
+        conn.close()
+    if status == "protocol":
+        return None
+    if status != "ok":
+        raise DaemonError(str(payload))
+    return payload
+
+
+def is_running() -> bool:
+    try:
+        return forward("ping") is not None
+    except DaemonError:
+        return False
+
+
+# =========================
+# Servidor
+# =========================
+
+Handler = Callable[..., Any]
+
+
+class DaemonServer:
+    """
+    Uso:
+        server = DaemonServer()
+        server.serve_forever()      # hasta "shutdown" o stop()
+
+    Cada conexión es un comando y se atiende en su propio hilo.
+    """
+
+    def __init__(
+        self,
+        remote_queue: Optional["RemoteQueue"] = None,
+        watch: bool = True,
+    ) -> None:
+        self.address, self.family = daemon_address()
+        self._remote_queue = remote_queue
+        self._watch = watch
+        self._watcher: Any = None
+        self._listener: Optional[Listener] = None
+        self._key = b""
+        self._stop = threading.Event()
+        self.ready = threading.Event()
+        self.started = time.time()
+        self.requests = 0
+        self._handlers: Dict[str, Handler] = {
+            "ping": self._ping,
+            "create": self._create,
+            "wait_remote": self._wait_remote,
+            "projects": self._projects,
+            "shutdown": self._shutdown,
+        }
+
+    # ---------- ciclo de vida ----------
+
+    def _claim_address(self) -> None:
+        if is_running():
+            raise DaemonRunning(f"Ya hay un demonio escuchando en {self.address}")
+        if self.family == "AF_UNIX":
+            try:
+                os.unlink(self.address)
+            except OSError:
+                pass
+
+    def warm(self) -> None:
+        """Carga lo que la CLI leería en cada arranque."""
+        from .config import CONFIG
+        from .git_utils import gh_auth_ok
+        from .paths import projects_base_dir
+        from .project_catalog import default_catalog
+        from .remote_queue import default_queue
+        from .staging import cleanup_stale_async
+        from .templates import root_templates
+
+        CONFIG.get()
+        try:
+            root_templates()
+        except OSError:
+            pass  # no romper flujo: create informará del fichero que falte
+        if self._remote_queue is None:
+            self._remote_queue = default_queue()
+        self._remote_queue.start()
+        try:
+            default_catalog().refresh()
+        except Exception:
+            pass
+        cleanup_stale_async(projects_base_dir())
+        # gh auth status tarda: en segundo plano, queda en la caché de git_utils
+        threading.Thread(target=gh_auth_ok, name="yvolo-gh-auth", daemon=True).start()
+
+        if self._watch:
+            from .watcher import FileWatcher, watch_app_state
+
+            self._watcher = FileWatcher()
+            watch_app_state(self._watcher)
+            self._watcher.start()
+
+    def serve_forever(self) -> None:
+        self._claim_address()
+        Path(appdata_dir()).mkdir(parents=True, exist_ok=True)
+        self._key = _write_key()
+        self._listener = Listener(self.address, self.family, authkey=self._key)
+        try:
+            self.warm()
+            self.ready.set()
+            while not self._stop.is_set():
+                try:
+                    conn = self._listener.accept()
+                except (OSError, EOFError, AuthenticationError):
+                    continue
+                if self._stop.is_set():
+                    conn.close()
+                    break
+                threading.Thread(target=self._serve, args=(conn,), name="yvolo-daemon", daemon=True).start()
+        finally:
+            self._close()
+
+    def stop(self) -> None:
+        if self._stop.is_set():
+            return
+        self._stop.set()
+        # Despertar accept() con una conexión propia
+        try:
+            Client(self.address, self.family, authkey=self._key).close()
+        except Exception:
+            pass
+
+    def _close(self) -> None:
+        if self._watcher is not None:
+            self._watcher.stop()
+        if self._remote_queue is not None:
+            self._remote_queue.stop(wait=False)
+        if self._listener is not None:
+            try:
+                self._listener.close()
+            except OSError:
+                pass
+        try:
+            _key_path().unlink()
+        except OSError:
+            pass
+
+    # ---------- peticiones ----------
+
+    def _serve(self, conn: Connection) -> None:
+        try:
+            request = conn.recv()
+            kind, protocol, command, kwargs = request
+            if kind != "call" or protocol != PROTOCOL:
+                conn.send(("protocol", PROTOCOL))
+                return
+            handler = self._handlers.get(command)
+            if handler is None:
+                conn.send(("error", f"Comando desconocido: {command}"))
+                return
+            self.requests += 1
+            try:
+                reply = ("ok", handler(**kwargs))
+            except Exception as e:
+                reply = ("error", f"{type(e).__name__}: {e}")
+            conn.send(reply)
+        except (OSError, EOFError, ValueError, TypeError):
+            pass  # cliente que se fue o petición mal formada
+        finally:
+            conn.close()
+
+    def _ping(self) -> Dict[str, Any]:
+        return {
+            "pid": os.getpid(),
+            "protocol": PROTOCOL,
+            "uptime": time.time() - self.started,
+            "requests": self.requests,
+        }
+
+    def _create(
+        self,
+        project_name: str,
+        project_type: str = "Vacío",
+        open_vscode: bool = True,
+        tasks: Optional[list] = None,
+    ) -> Dict[str, Any]:
+        from .project_creator import create_new_project
+
+        queue = self._remote_queue
+        before = len(queue.status()) if queue is not None else 0
+        try:
+            ok, msg = create_new_project(
+                project_name=project_name,
+                project_type=project_type,
+                open_vscode=open_vscode,
+                tasks=list(tasks or []),
+                remote_queue=queue,
+            )
+        except Exception as e:
+            ok, msg = False, f"Error creando proyecto: {e}"
+        return {"ok": ok, "msg": msg, "remote_before": before}
+
+    def _wait_remote(self, before: int = 0, timeout: Optional[float] = None) -> str:
+        from .remote_queue import format_status
+
+        queue = self._remote_queue
+        if queue is None or queue.idle():
+            return ""
+        queue.drain(timeout)
+        return format_status(queue.status()[before:])
+
+    def _projects(self) -> str:
+        from .project_catalog import default_catalog, format_report
+
+        catalog = default_catalog()
+        catalog.refresh()
+        return format_report(catalog)
+
+    def _shutdown(self) -> bool:
+        # Responder antes de cerrar el listener
+        threading.Timer(0.05, self.stop).start()
+        return True
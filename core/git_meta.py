@@ -0,0 +1,183 @@
+# C:\Users\Usuario\Desktop\proyectos\yvolo\core\git_meta.py
+from __future__ import annotations
+
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+# Lectura de metadatos git sin lanzar el binario.
+# Solo cubre lo que yvolo consulta (HEAD, remotos); para escribir se usa git.
+
+_SECTION_RE = re.compile(r'^\s*\[\s*([A-Za-z0-9.-]+)(?:\s+"((?:[^"\\]|\\.)*)")?\s*\]\s*(.*)$')
+_KEY_RE = re.compile(r"^\s*([A-Za-z][A-Za-z0-9-]*)\s*(?:=\s*(.*))?$")
+
+GitConfig = Dict[str, Dict[str, str]]
+
+
+class UnsupportedGitConfig(Exception):
+    """La config usa algo que no interpretamos (include, insteadOf...): usar git."""
+
+
+def find_git_dir(project_dir: str) -> Optional[Path]:
+    """
+    Igual que git: busca .git en la carpeta y sus padres.
+    Soporta el fichero .git con "gitdir: <ruta>" (worktrees, submódulos).
+    """
+    current = Path(project_dir).resolve()
+    for folder in (current, *current.parents):
+        dot_git = folder / ".git"
+        if dot_git.is_dir():
+            return dot_git
+        if dot_git.is_file():
+            try:
+                content = dot_git.read_text(encoding="utf-8").strip()
+            except OSError:
+                return None
+            if content.startswith("gitdir:"):
+                target = Path(content[len("gitdir:"):].strip())
+                if not target.is_absolute():
+                    target = folder / target
+                return target
+            return None
+    return None
+
+
+def common_dir(git_dir: Path) -> Path:
+    """En worktrees la config compartida vive en el directorio "commondir"."""
+    marker = git_dir / "commondir"
+    try:
+        rel = marker.read_text(encoding="utf-8").strip()
+    except OSError:
+        return git_dir
+    target = Path(rel)
+    return target if target.is_absolute() else (git_dir / target).resolve()
+
+
+def _unquote(value: str) -> str:
+    value = value.strip()
+    out = []
+    in_quotes = False
+    i = 0
+    while i < len(value):
+        c = value[i]
+        if c == '"':
+            in_quotes = not in_quotes
+        elif c == "\\" and i + 1 < len(value):
+            i += 1
+            out.append({"n": "\n", "t": "\t", "b": "\b"}.get(value[i], value[i]))
+        elif c in "#;" and not in_quotes:
+            break
+        else:
+            out.append(c)
+        i += 1
+    return "".join(out).strip()
+
+
+def parse_git_config(text: str) -> GitConfig:
+    """
+    Claves: "remote.origin" -> {"url": ...}. Sección y clave en minúsculas,
+    subsección tal cual (como git).
+    """
+    config: GitConfig = {}
+    section: Optional[Dict[str, str]] = None
+
+    for raw in text.splitlines():
+        line = raw.strip()
+        if not line or line[0] in "#;":
+            continue
+        m = _SECTION_RE.match(line)
+        if m:
+            name = m.group(1).lower()
+            if m.group(2) is not None:
+                name = f"{name}.{m.group(2)}"
+            if name.split(".", 1)[0] in ("include", "includeif"):
+                raise UnsupportedGitConfig(name)
+            section = config.setdefault(name, {})
+            line = m.group(3).strip()
+            if not line:
+                continue
+        if section is None:
+            continue
+        km = _KEY_RE.match(line)
+        if not km:
+            continue
+        key = km.group(1).lower()
+        if key in ("insteadof", "pushinsteadof"):
+            raise UnsupportedGitConfig(key)
+        section[key] = _unquote(km.group(2)) if km.group(2) is not None else "true"
+
+    return config
+
+
+class GitMetaCache:
+    """
+    Caché por fichero (config, HEAD) con clave (mtime_ns, size).
+    Compartida entre hilos.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._files: Dict[str, Tuple[Tuple[int, int], object]] = {}
+
+    def _cached(self, path: Path, parse):
+        key = str(path)
+        try:
+            st = os.stat(key)
+        except OSError:
+            return None
+        sig = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            entry = self._files.get(key)
+            if entry is not None and entry[0] == sig:
+                return entry[1]
+        value = parse(path.read_text(encoding="utf-8", errors="replace"))
+        with self._lock:
+            self._files[key] = (sig, value)
+        return value
+
+    def config(self, git_dir: Path) -> GitConfig:
+        value = self._cached(git_dir / "config", parse_git_config)
+        return value if value is not None else {}
+
+    def head(self, git_dir: Path) -> str:
+        """Nombre de rama ("main") o sha si HEAD está desacoplado."""
+        value = self._cached(git_dir / "HEAD", lambda t: t.strip())
+        if not value:
+            return ""
+        if value.startswith("ref:"):
+            ref = value[4:].strip()
+            return ref[len("refs/heads/"):] if ref.startswith("refs/heads/") else ref
+        return value
+
+    def remotes(self, git_dir: Path) -> Dict[str, str]:
+        out: Dict[str, str] = {}
+        for name, values in self.config(git_dir).items():
+            if name.startswith("remote.") and "url" in values:
+                out[name[len("remote."):]] = values["url"]
+        return out
+
+    def clear(self) -> None:
+        with self._lock:
+            self._files.clear()
+
+
+GIT_META = GitMetaCache()
+
+
+def read_origin(project_dir: str) -> Optional[str]:
+    """
+    URL de origin leída de .git/config.
+        ""   -> no hay repo o no hay origin
+        None -> no se puede leer en Python; el llamador debe usar git
+    """
+    git_dir = find_git_dir(project_dir)
+    if git_dir is None:
+        return ""
+    try:
+        return GIT_META.remotes(common_dir(git_dir)).get("origin", "")
+    except UnsupportedGitConfig:
+        return None
+    except OSError:
+        return None
@@ -3,6 +3,19 @@ from __future__ import annotations
 
 import os
 import subprocess
+import threading
+import time
+from typing import List, Optional, Tuple
+
+from .git_meta import read_origin
+from .tracing import span
+
+# Resultado de "gh auth status" reutilizado durante este tiempo (segundos)
+GH_AUTH_TTL = 300.0
+GH_AUTH_FAIL_TTL = 30.0
+
+_gh_auth_lock = threading.Lock()
+_gh_auth_cache: Optional[Tuple[bool, float]] = None
 
 
 def git_init_if_needed(project_dir: str) -> None:
@@ -14,13 +27,14 @@ def git_init_if_needed(project_dir: str) -> None:
         return
 
     try:
-        subprocess.run(
-            ["git", "init"],
-            cwd=project_dir,
-            check=False,
-            capture_output=True,
-            text=True,
-        )
+        with span("git.init"):
+            subprocess.run(
+                ["git", "init"],
+                cwd=project_dir,
+                check=False,
+                capture_output=True,
+                text=True,
+            )
     except Exception:
         # no romper flujo
         pass
@@ -29,14 +43,21 @@ def git_init_if_needed(project_dir: str) -> None:
 def git_get_origin(project_dir: str) -> str:
     """
     Devuelve URL del remoto origin si existe, si no string vacío.
+    Lee .git/config directamente; solo lanza git si la config no es legible en Python.
     """
+    with span("git.read_origin"):
+        url = read_origin(project_dir)
+    if url is not None:
+        return url
+
     try:
-        r = subprocess.run(
-            ["git", "remote", "get-url", "origin"],
-            cwd=project_dir,
-            capture_output=True,
-            text=True,
-        )
+        with span("git.remote_get_url"):
+            r = subprocess.run(
+                ["git", "remote", "get-url", "origin"],
+                cwd=project_dir,
+                capture_output=True,
+                text=True,
+            )
         if r.returncode == 0:
             return r.stdout.strip()
     except Exception:
@@ -44,6 +65,137 @@ def git_get_origin(project_dir: str) -> str:
     return ""
 
 
+def git_remotes(project_dir: str, timeout: Optional[float] = 30.0) -> List[str]:
+    """
+    Nombres de los remotos según git (git remote).
+    Para configs que git_meta no interpreta (include, insteadOf...); lista
+    vacía si git falla.
+    """
+    try:
+        with span("git.remote"):
+            r = subprocess.run(
+                ["git", "remote"],
+                cwd=project_dir,
+                capture_output=True,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+                timeout=timeout,
+            )
+    except Exception:
+        # no romper flujo
+        return []
+    if r.returncode != 0:
+        return []
+    return [line.strip() for line in r.stdout.splitlines() if line.strip()]
+
+
+def gh_auth_ok(max_age: Optional[float] = None) -> bool:
+    """
+    "gh auth status" cacheado en el proceso.
+    OK se reutiliza GH_AUTH_TTL segundos; un fallo, GH_AUTH_FAIL_TTL.
+    """
+    global _gh_auth_cache
+
+    now = time.monotonic()
+    with _gh_auth_lock:
+        if _gh_auth_cache is not None:
+            ok, checked_at = _gh_auth_cache
+            ttl = max_age if max_age is not None else (GH_AUTH_TTL if ok else GH_AUTH_FAIL_TTL)
+            if now - checked_at < ttl:
+                return ok
+
+        try:
+            with span("gh.auth_status") as sp:
+                chk = subprocess.run(
+                    ["gh", "auth", "status"],
+                    capture_output=True,
+                    text=True,
+                )
+                sp.set(returncode=chk.returncode)
+            ok = chk.returncode == 0
+        except Exception:
+            ok = False
+
+        _gh_auth_cache = (ok, time.monotonic())
+        return ok
+
+
+def gh_auth_invalidate() -> None:
+    global _gh_auth_cache
+    with _gh_auth_lock:
+        _gh_auth_cache = None
+
+
+def gh_repo_create(
+    project_dir: str,
+    project_name: str,
+    timeout: Optional[float] = None,
+) -> Tuple[bool, str]:
+    """
+    gh repo create <project_name> --public --source . --remote origin --push --confirm
+
+    Devuelve:
+        (ok, mensaje de error)
+    """
+    if not gh_auth_ok():
+        return False, "gh no disponible o no autenticado"
+
+    cmd = [
+        "gh",
+        "repo",
+        "create",
+        project_name,
+        "--public",
+        "--source",
+        ".",
+        "--remote",
+        "origin",
+        "--push",
+        "--confirm",
+    ]
+    try:
+        with span("gh.repo_create") as sp:
+            r = subprocess.run(
+                cmd,
+                cwd=project_dir,
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+            )
+            sp.set(returncode=r.returncode)
+    except subprocess.TimeoutExpired:
+        return False, f"gh repo create superó {timeout:.0f}s"
+    except Exception as e:
+        return False, str(e)
+
+    if r.returncode != 0:
+        # Puede ser sesión caducada: volver a comprobar en el próximo intento
+        gh_auth_invalidate()
+        return False, (r.stderr or r.stdout or "").strip() or f"gh salió con código {r.returncode}"
+    return True, ""
+
+
+def git_push_origin(project_dir: str, timeout: Optional[float] = None) -> Tuple[bool, str]:
+    try:
+        with span("git.push") as sp:
+            r = subprocess.run(
+                ["git", "push", "-u", "origin", "HEAD"],
+                cwd=project_dir,
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+            )
+            sp.set(returncode=r.returncode)
+    except subprocess.TimeoutExpired:
+        return False, f"git push superó {timeout:.0f}s"
+    except Exception as e:
+        return False, str(e)
+    if r.returncode != 0:
+        return False, (r.stderr or r.stdout or "").strip()
+    return True, ""
+
+
 def git_try_create_remote_with_gh(project_dir: str, project_name: str) -> str:
     """
     Intenta:
@@ -56,44 +208,41 @@ def git_try_create_remote_with_gh(project_dir: str, project_name: str) -> str:
     Devuelve:
         URL del remoto origin si éxito, si no string vacío.
     """
-
-    # comprobar gh auth
-    try:
-        chk = subprocess.run(
-            ["gh", "auth", "status"],
-            cwd=project_dir,
-            capture_output=True,
-            text=True,
-        )
-        if chk.returncode != 0:
-            return ""
-    except Exception:
+    ok, _err = gh_repo_create(project_dir, project_name)
+    if not ok:
         return ""
+    return git_get_origin(project_dir)
 
-    # crear repo
-    try:
-        cmd = [
-            "gh",
-            "repo",
-            "create",
-            project_name,
-            "--public",
-            "--source",
-            ".",
-            "--remote",
-            "origin",
-            "--push",
-            "--confirm",
-        ]
-        r = subprocess.run(
-            cmd,
-            cwd=project_dir,
-            capture_output=True,
-            text=True,
-        )
-        if r.returncode != 0:
-            return ""
-    except Exception:
-        return ""
 
-    return git_get_origin(project_dir)
+def git_status_porcelain(project_dir: str, timeout: Optional[float] = 30.0) -> Tuple[bool, str]:
+    """
+    git status --porcelain=v2 --branch (cambios, rama, upstream y ahead/behind
+    en una sola llamada).
+
+    GIT_OPTIONAL_LOCKS=0: status no reescribe .git/index, así consultar no
+    cambia la firma con la que core.repo_status cachea el resultado.
+
+    Devuelve:
+        (ok, salida) o (False, mensaje de error)
+    """
+    env = dict(os.environ, GIT_OPTIONAL_LOCKS="0")
+    try:
+        with span("git.status") as sp:
+            r = subprocess.run(
+                ["git", "status", "--porcelain=v2", "--branch", "--untracked-files=normal"],
+                cwd=project_dir,
+                capture_output=True,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+                timeout=timeout,
+                env=env,
+            )
+            sp.set(returncode=r.returncode)
+    except subprocess.TimeoutExpired:
+        return False, f"git status superó {timeout:.0f}s"
+    except Exception as e:
+        return False, str(e)
+    if r.returncode != 0:
+        return False, (r.stderr or r.stdout or "").strip() or f"git salió con código {r.returncode}"
+    return True, r.stdout
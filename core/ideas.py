@@ -0,0 +1,222 @@
+# C:\Users\Usuario\Desktop\proyectos\yvolo\core\ideas.py
+from __future__ import annotations
+
+import multiprocessing
+import os
+import re
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Callable, List, NamedTuple, Optional, Tuple
+
+from .paths import projects_base_dir
+from .roadmap import (
+    DESCRIPTION_PREFIX,
+    FIELD_CRITICA,
+    FIELD_DEPENDENCIAS,
+    FIELD_IMPLEMENTADA,
+    Roadmap,
+    RoadmapEntry,
+    parse_roadmap,
+    save_roadmap,
+)
+
+# "Procesar Ideas": las ideas de #Ideas marcadas como listas pasan a #Tareas.
+#
+#   - Descripción: Exportar a CSV
+#     - detalle
+#     Critica: No critica
+#     Lista: Sí
+#
+# La idea se quita de #Ideas y se añade al final de #Tareas con el formato
+# estándar (Critica / Implementada: No implementada / Dependencias); la línea
+# "Lista:" desaparece. Cada proyecto se procesa en un proceso aparte.
+
+FIELD_LISTA = "Lista"
+READY_VALUES = ("sí", "si")
+
+_LISTA_RE = re.compile(rf"^[ \t]*{FIELD_LISTA}:[ \t]*([^\r\n]*)", re.M)
+_FIELD_LINE_RE = re.compile(
+    rf"^[ \t]*(?:{FIELD_CRITICA}|{FIELD_IMPLEMENTADA}|{FIELD_DEPENDENCIAS}|{FIELD_LISTA}):"
+)
+# Filtro previo sobre los bytes: sin "Lista:" no hace falta parsear la hoja
+_LISTA_BYTES = f"{FIELD_LISTA}:".encode("utf-8")
+
+HOJA = "hoja_de_ruta.txt"
+
+# Con menos hojas candidatas que esto no compensa arrancar procesos
+POOL_MIN = 16
+
+
+class IdeasResult(NamedTuple):
+    project: str
+    promoted: List[str]
+    error: str = ""
+
+
+class IdeasReport(NamedTuple):
+    scanned: int
+    results: List[IdeasResult]
+    seconds: float
+    workers: int
+    cancelled: bool = False
+
+    @property
+    def promoted(self) -> int:
+        return sum(len(r.promoted) for r in self.results)
+
+    @property
+    def errors(self) -> List[IdeasResult]:
+        return [r for r in self.results if r.error]
+
+
+def is_ready(entry: RoadmapEntry) -> bool:
+    m = _LISTA_RE.search(entry.raw)
+    return m is not None and m.group(1).strip().lower() in READY_VALUES
+
+
+def idea_to_task(entry: RoadmapEntry, newline: str = "\n") -> str:
+    """Texto de la tarea: descripción y detalle de la idea, campos estándar."""
+    nl = newline
+    lines = entry.raw.splitlines()
+    detail = [line for line in lines[1:] if line.strip() and not _FIELD_LINE_RE.match(line)]
+    critica = entry.critica or "No critica"
+    dependencias = entry.dependencias or "Ninguna"
+    body = "".join(f"{line}{nl}" for line in detail)
+    return (
+        f"{DESCRIPTION_PREFIX} {entry.description}{nl}"
+        f"{body}"
+        f"  {FIELD_CRITICA}: {critica}{nl}"
+        f"  {FIELD_IMPLEMENTADA}: No implementada{nl}"
+        f"  {FIELD_DEPENDENCIAS}: {dependencias}{nl}"
+        f"{nl}"
+    )
+
+
+def promote_ready_ideas(roadmap: Roadmap) -> List[str]:
+    """Pasa a #Tareas las ideas listas. Devuelve sus descripciones."""
+    ready = [e for e in roadmap.ideas if is_ready(e)]
+    if ready:
+        roadmap.move_ideas_to_tasks(ready, [idea_to_task(e, roadmap.newline) for e in ready])
+    return [e.description for e in ready]
+
+
+def process_project(hoja: str) -> IdeasResult:
+    """Trabajo de cada proceso: una hoja de ruta. Nunca lanza."""
+    path = Path(hoja)
+    project = path.parent.name
+    try:
+        data = path.read_bytes()
+        if _LISTA_BYTES not in data:
+            return IdeasResult(project, [])
+        roadmap = parse_roadmap(data.decode("utf-8"))
+        promoted = promote_ready_ideas(roadmap)
+        if promoted:
+            save_roadmap(path, roadmap)
+        return IdeasResult(project, promoted)
+    except Exception as e:
+        return IdeasResult(project, [], f"{type(e).__name__}: {e}")
+
+
+def candidate_roadmaps(base: Optional[Path] = None) -> Tuple[int, List[Path]]:
+    """
+    (proyectos encontrados, hojas que contienen alguna línea "Lista:").
+    La lectura previa es barata y evita mandar a los procesos hojas sin
+    nada que promover.
+    """
+    base = Path(base) if base is not None else projects_base_dir()
+    scanned = 0
+    out: List[Path] = []
+    try:
+        entries = list(os.scandir(base))
+    except OSError:
+        return 0, []
+    for entry in entries:
+        if not entry.is_dir() or entry.name.startswith("."):
+            continue
+        hoja = Path(entry.path) / HOJA
+        try:
+            data = hoja.read_bytes()
+        except OSError:
+            continue
+        scanned += 1
+        if _LISTA_BYTES in data:
+            out.append(hoja)
+    return scanned, sorted(out)
+
+
+def default_workers() -> int:
+    return max(1, min(8, os.cpu_count() or 1))
+
+
+Progress = Callable[[int, int, IdeasResult], None]
+
+
+def process_all_ideas(
+    base: Optional[Path] = None,
+    workers: Optional[int] = None,
+    progress: Optional[Progress] = None,
+    cancel_event: Optional[threading.Event] = None,
+    pool_min: int = POOL_MIN,
+) -> IdeasReport:
+    """
+    Procesa todas las hojas de ruta de la carpeta de proyectos.
+    progress(hechas, total, resultado) se llama desde el hilo que llama a
+    esta función, en orden de llegada.
+    """
+    start = time.perf_counter()
+    scanned, hojas = candidate_roadmaps(base)
+    total = len(hojas)
+    results: List[IdeasResult] = []
+
+    def cancelled() -> bool:
+        return cancel_event is not None and cancel_event.is_set()
+
+    def done(result: IdeasResult) -> None:
+        results.append(result)
+        if progress is not None:
+            try:
+                progress(len(results), total, result)
+            except Exception:
+                pass  # no romper flujo
+
+    workers = min(workers or default_workers(), total) or 1
+    if total < pool_min or workers == 1:
+        workers = 1
+        for hoja in hojas:
+            if cancelled():
+                break
+            done(process_project(str(hoja)))
+    else:
+        # spawn también en Linux: fork desde un proceso con hilos (Tk, watcher) no es seguro
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+            pending = {pool.submit(process_project, str(h)) for h in hojas}
+            while pending:
+                finished, pending = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    if not future.cancelled():
+                        done(future.result())
+                if cancelled():
+                    for future in pending:
+                        future.cancel()
+
+    return IdeasReport(scanned, results, time.perf_counter() - start, workers, cancelled())
+
+
+def format_report(report: IdeasReport, max_lines: int = 30) -> str:
+    changed = [r for r in report.results if r.promoted]
+    lines = [
+        f"{report.promoted} idea(s) pasadas a tareas en {len(changed)} proyecto(s) "
+        f"({report.scanned} revisados, {report.seconds:.1f} s, {report.workers} proceso(s))."
+    ]
+    if report.cancelled:
+        lines.append("Cancelado: quedan proyectos sin procesar.")
+    for r in changed[:max_lines]:
+        lines.append(f"- {r.project}: " + "; ".join(r.promoted))
+    if len(changed) > max_lines:
+        lines.append(f"... y {len(changed) - max_lines} proyecto(s) más")
+    for r in report.errors[:max_lines]:
+        lines.append(f"ERROR {r.project}: {r.error}")
+    return "\n".join(lines)
@@ -41,3 +41,7 @@ def yvolo_root_file(filename: str) -> Path:
 
 def projects_base_dir() -> Path:
     return Path.home() / "Desktop" / "proyectos"
+
+
+def backups_base_dir() -> Path:
+    return Path.home() / "Desktop" / "backups"
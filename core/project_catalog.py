@@ -0,0 +1,333 @@
+# C:\Users\Usuario\Desktop\proyectos\yvolo\core\project_catalog.py
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from .paths import appdata_dir, projects_base_dir
+from .roadmap import load_roadmap
+
+# Índice persistente de los proyectos de Desktop\proyectos (SQLite en appdata).
+#
+# Una fila por proyecto con lo que muestra yvolo (tipo, repo_git, backup,
+# tareas por estado). refresh() solo vuelve a leer las hojas de ruta cuya firma
+# (mtime_ns, size) ha cambiado; las comprobaciones de colisión y los listados
+# son consultas al índice, no recorridos de la carpeta.
+
+HOJA_NAME = "hoja_de_ruta.txt"
+UNKNOWN_TYPE = ""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    name TEXT PRIMARY KEY COLLATE NOCASE,
+    path TEXT NOT NULL,
+    type TEXT NOT NULL DEFAULT '',
+    repo_git TEXT NOT NULL DEFAULT '',
+    backup TEXT NOT NULL DEFAULT '',
+    tasks_total INTEGER NOT NULL DEFAULT 0,
+    tasks_done INTEGER NOT NULL DEFAULT 0,
+    tasks_critical_open INTEGER NOT NULL DEFAULT 0,
+    ideas INTEGER NOT NULL DEFAULT 0,
+    hoja_mtime_ns INTEGER NOT NULL DEFAULT -1,
+    hoja_size INTEGER NOT NULL DEFAULT -1,
+    refreshed REAL NOT NULL DEFAULT 0
+);
+"""
+
+Signature = Tuple[int, int]
+NO_HOJA: Signature = (-1, -1)
+
+
+def catalog_file() -> Path:
+    return appdata_dir() / "projects.sqlite3"
+
+
+class ProjectRecord(NamedTuple):
+    name: str
+    path: str
+    type: str
+    repo_git: str
+    backup: str
+    tasks_total: int
+    tasks_done: int
+    tasks_critical_open: int
+    ideas: int
+
+    @property
+    def tasks_open(self) -> int:
+        return self.tasks_total - self.tasks_done
+
+
+_COLUMNS = ", ".join(ProjectRecord._fields)
+
+
+def _hoja_signature(project_dir: Path) -> Signature:
+    try:
+        st = os.stat(project_dir / HOJA_NAME)
+    except OSError:
+        return NO_HOJA
+    return st.st_mtime_ns, st.st_size
+
+
+_EMPTY_SUMMARY: Dict[str, Any] = {
+    "repo_git": "",
+    "backup": "",
+    "tasks_total": 0,
+    "tasks_done": 0,
+    "tasks_critical_open": 0,
+    "ideas": 0,
+}
+
+
+def _summarize_hoja(project_dir: Path) -> Dict[str, Any]:
+    """Campos de la fila sacados de hoja_de_ruta.txt (vacíos si no se puede leer)."""
+    try:
+        roadmap = load_roadmap(project_dir / HOJA_NAME)
+    except (OSError, UnicodeDecodeError):
+        return dict(_EMPTY_SUMMARY)
+    tasks = roadmap.tasks
+    return {
+        "repo_git": roadmap.info.repo_git if roadmap.info is not None else "",
+        "backup": roadmap.info.backup if roadmap.info is not None else "",
+        "tasks_total": len(tasks),
+        "tasks_done": sum(1 for t in tasks if t.is_implemented),
+        "tasks_critical_open": sum(1 for t in tasks if t.is_critical and not t.is_implemented),
+        "ideas": len(roadmap.ideas),
+    }
+
+
+def infer_type(project_dir: Path) -> str:
+    """
+    Tipo de un proyecto que yvolo no ha registrado: la plantilla de
+    project_templates cuyos ficheros están todos presentes (la más grande).
+    """
+    from .scaffold import EMPTY_TYPE, MANIFESTS, RENDER_SUFFIX, available_types, template_dir
+
+    best, best_size = EMPTY_TYPE, 0
+    for project_type in available_types():
+        root = template_dir(project_type)
+        manifest = MANIFESTS.get(root) if root is not None else None
+        if manifest is None or not manifest.files:
+            continue
+        paths = [e.path[: -len(RENDER_SUFFIX)] if e.render else e.path for e in manifest.files]
+        if len(paths) > best_size and all((project_dir / p).is_file() for p in paths):
+            best, best_size = project_type, len(paths)
+    return best
+
+
+def _is_project_entry(entry: os.DirEntry) -> bool:
+    # Ocultas (.yvolo_staging...) no son proyectos
+    return not entry.name.startswith(".") and entry.is_dir(follow_symlinks=False)
+
+
+class ProjectCatalog:
+    """
+    Catálogo SQLite. Una conexión por instancia, compartida entre hilos con
+    un lock (la crea el hilo que llegue primero). WAL para que la UI y un
+    proceso CLI puedan usarlo a la vez.
+    """
+
+    def __init__(self, db_path: Optional[Path] = None, base: Optional[Path] = None) -> None:
+        self.db_path = Path(db_path) if db_path is not None else catalog_file()
+        self._base = Path(base) if base is not None else None
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self.parsed = 0  # hojas releídas (para tests y benchmarks)
+
+    @property
+    def base(self) -> Path:
+        return self._base if self._base is not None else projects_base_dir()
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), timeout=5.0, check_same_thread=False, isolation_level=None)
+            try:
+                conn.execute("PRAGMA journal_mode=WAL")
+            except sqlite3.DatabaseError:
+                pass
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ---------- escritura ----------
+
+    def _upsert(self, conn: sqlite3.Connection, name: str, path: Path, project_type: str, sig: Signature) -> None:
+        if sig == NO_HOJA:
+            fields = _EMPTY_SUMMARY
+        else:
+            fields = _summarize_hoja(path)
+            self.parsed += 1
+        conn.execute(
+            "INSERT INTO projects (name, path, type, repo_git, backup, tasks_total, tasks_done,"
+            " tasks_critical_open, ideas, hoja_mtime_ns, hoja_size, refreshed)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+            " ON CONFLICT(name) DO UPDATE SET path=excluded.path,"
+            " type=CASE WHEN excluded.type != '' THEN excluded.type ELSE projects.type END,"
+            " repo_git=excluded.repo_git, backup=excluded.backup, tasks_total=excluded.tasks_total,"
+            " tasks_done=excluded.tasks_done, tasks_critical_open=excluded.tasks_critical_open,"
+            " ideas=excluded.ideas, hoja_mtime_ns=excluded.hoja_mtime_ns, hoja_size=excluded.hoja_size,"
+            " refreshed=excluded.refreshed",
+            (
+                name,
+                str(path),
+                project_type,
+                fields["repo_git"],
+                fields["backup"],
+                fields["tasks_total"],
+                fields["tasks_done"],
+                fields["tasks_critical_open"],
+                fields["ideas"],
+                sig[0],
+                sig[1],
+                time.time(),
+            ),
+        )
+
+    def record(self, project_dir: Path, project_type: str = UNKNOWN_TYPE) -> None:
+        """Alta/actualización de un proyecto concreto (p.ej. recién creado)."""
+        project_dir = Path(project_dir)
+        with self._lock:
+            conn = self._db()
+            self._upsert(conn, project_dir.name, project_dir, project_type, _hoja_signature(project_dir))
+
+    def forget(self, name: str) -> None:
+        with self._lock:
+            self._db().execute("DELETE FROM projects WHERE name = ?", (name,))
+
+    def refresh(self) -> Dict[str, int]:
+        """
+        Sincroniza con la carpeta de proyectos: altas, bajas y hojas cambiadas.
+        Un scandir + un stat por proyecto; solo se parsean las hojas cuya
+        firma no coincide con la guardada.
+        """
+        base = self.base
+        try:
+            entries = [e for e in os.scandir(base) if _is_project_entry(e)]
+        except OSError:
+            entries = []
+
+        stats = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0}
+        with self._lock:
+            conn = self._db()
+            known: Dict[str, Tuple[str, Signature, str]] = {
+                row[0]: (row[1], (row[2], row[3]), row[4])
+                for row in conn.execute("SELECT name, path, hoja_mtime_ns, hoja_size, type FROM projects")
+            }
+            conn.execute("BEGIN")
+            try:
+                seen = set()
+                for entry in entries:
+                    path = Path(entry.path)
+                    sig = _hoja_signature(path)
+                    seen.add(entry.name)
+                    old = known.get(entry.name)
+                    if old is not None and old[0] == str(path) and old[1] == sig:
+                        stats["unchanged"] += 1
+                        continue
+                    project_type = old[2] if old is not None and old[2] else infer_type(path)
+                    self._upsert(conn, entry.name, path, project_type, sig)
+                    stats["updated" if old is not None else "added"] += 1
+                for name in known.keys() - seen:
+                    conn.execute("DELETE FROM projects WHERE name = ?", (name,))
+                    stats["removed"] += 1
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        return stats
+
+    # ---------- consultas ----------
+
+    def get(self, name: str) -> Optional[ProjectRecord]:
+        with self._lock:
+            row = self._db().execute(f"SELECT {_COLUMNS} FROM projects WHERE name = ?", (name,)).fetchone()
+        return ProjectRecord(*row) if row is not None else None
+
+    def contains(self, name: str) -> bool:
+        return self.get(name) is not None
+
+    def existing(self, names: List[str]) -> List[str]:
+        """De names, los que ya están en el catálogo (sin distinguir mayúsculas)."""
+        if not names:
+            return []
+        with self._lock:
+            conn = self._db()
+            found = set()
+            # SQLite limita los parámetros por consulta
+            for i in range(0, len(names), 500):
+                chunk = names[i : i + 500]
+                marks = ",".join("?" * len(chunk))
+                found.update(
+                    r[0].lower() for r in conn.execute(f"SELECT name FROM projects WHERE name IN ({marks})", chunk)
+                )
+        return [n for n in names if n.lower() in found]
+
+    def projects(self, order: str = "name") -> List[ProjectRecord]:
+        column = order if order in ProjectRecord._fields else "name"
+        with self._lock:
+            rows = self._db().execute(f"SELECT {_COLUMNS} FROM projects ORDER BY {column} COLLATE NOCASE").fetchall()
+        return [ProjectRecord(*r) for r in rows]
+
+    def totals(self) -> Dict[str, int]:
+        with self._lock:
+            row = self._db().execute(
+                "SELECT COUNT(*), COALESCE(SUM(tasks_total), 0), COALESCE(SUM(tasks_done), 0),"
+                " COALESCE(SUM(tasks_critical_open), 0), COALESCE(SUM(ideas), 0) FROM projects"
+            ).fetchone()
+        return dict(zip(("projects", "tasks_total", "tasks_done", "tasks_critical_open", "ideas"), row))
+
+
+_catalog: Optional[ProjectCatalog] = None
+_catalog_lock = threading.Lock()
+
+
+def default_catalog() -> ProjectCatalog:
+    global _catalog
+    with _catalog_lock:
+        if _catalog is None or _catalog.db_path != catalog_file():
+            _catalog = ProjectCatalog()
+        return _catalog
+
+
+def record_project(project_dir: Path, project_type: str) -> None:
+    """Registra un proyecto recién creado; un fallo del índice no rompe la creación."""
+    try:
+        default_catalog().record(project_dir, project_type)
+    except Exception:
+        # no romper flujo: refresh() lo recogerá
+        pass
+
+
+def format_projects(records: List[ProjectRecord]) -> str:
+    if not records:
+        return "No hay proyectos."
+    width = max(len(r.name) for r in records)
+    lines = [f"{'proyecto':<{width}}  {'tipo':<8}  {'tareas':>11}  {'críticas':>8}  {'ideas':>5}  repo"]
+    for r in records:
+        lines.append(
+            f"{r.name:<{width}}  {r.type or '?':<8}  {r.tasks_done:>5}/{r.tasks_total:<5}  "
+            f"{r.tasks_critical_open:>8}  {r.ideas:>5}  {r.repo_git or '-'}"
+        )
+    return "\n".join(lines)
+
+
+def format_report(catalog: ProjectCatalog) -> str:
+    """Salida de --projects: tabla y totales."""
+    t = catalog.totals()
+    return (
+        f"{format_projects(catalog.projects())}\n\n"
+        f"{t['projects']} proyecto(s), {t['tasks_done']}/{t['tasks_total']} tareas implementadas, "
+        f"{t['tasks_critical_open']} críticas pendientes, {t['ideas']} ideas."
+    )
@@ -3,11 +3,20 @@ from __future__ import annotations
 
 import os
 import re
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import List, Tuple
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple
 
-from .paths import projects_base_dir, yvolo_root_file
+from .paths import projects_base_dir
+from .project_catalog import record_project
+from .staging import ProjectLock, ProjectLocked, discard, new_staging_dir, publish
+from .scaffold import hardlinks_enabled, materialize, place_file
+from .templates import TEMPLATE_CACHE, HojaTemplate, root_promp_path, root_templates
+from .tracing import span
+
+if TYPE_CHECKING:
+    from .remote_queue import RemoteQueue
 from .git_utils import (
     git_init_if_needed,
     git_get_origin,
@@ -15,6 +24,16 @@ from .git_utils import (
 )
 
 
+# Etapas de creación, en orden, tal y como se notifican a progress()
+STAGES: Tuple[str, ...] = ("dirs", "templates", "git", "remote", "scaffold", "editor")
+
+ProgressCallback = Callable[[str, str], None]
+
+
+class CreationCancelled(Exception):
+    pass
+
+
 def sanitize_project_name(name: str) -> str:
     name = (name or "").strip()
     name = re.sub(r"\s+", "_", name)
@@ -49,34 +68,31 @@ def _apply_hoja_template(
     backup_value: str,
     tasks: List[str],
 ) -> str:
-    text = template_text.replace("\r\n", "\n")
-
-    # Insert tasks after #Tareas
-    if "#Tareas" not in text:
-        raise ValueError("La plantilla hoja_de_ruta.txt no contiene #Tareas")
+    return HojaTemplate(template_text).render(project_name, repo_url, backup_value, tasks)
 
-    parts = text.split("#Tareas", 1)
-    head = parts[0] + "#Tareas\n"
-    rest = parts[1].lstrip("\n")
 
-    tasks_block = _format_tasks(tasks)
-    if tasks_block:
-        text = head + tasks_block + "\n" + rest
+def _place_promp(promp_content: str, target: Path) -> None:
+    try:
+        src = root_promp_path()
+        same = TEMPLATE_CACHE.text(src) == promp_content
+    except OSError:
+        same = False
+    if same:
+        place_file(src, target, hardlinks_enabled())
     else:
-        text = head + rest
+        _write_text(target, promp_content)
+
 
-    # Replace ProyectoInfo fields
-    def replace_line(prefix: str, value: str, s: str) -> str:
-        pattern = rf"(?m)^{re.escape(prefix)}\s*.*$"
-        if re.search(pattern, s):
-            return re.sub(pattern, f"{prefix} {value}".rstrip(), s)
-        return s
+def load_templates() -> Tuple[str, HojaTemplate]:
+    """
+    Plantillas de la raíz de yvolo (caché de proceso, ver core.templates).
 
-    text = replace_line("repo_git:", repo_url, text)
-    text = replace_line("name_project:", project_name, text)
-    text = replace_line("backup:", backup_value, text)
+    Devuelve:
+        (promp_maestro, plantilla hoja_de_ruta ya partida)
 
-    return text
+    Lanza FileNotFoundError si falta alguna.
+    """
+    return root_templates()
 
 
 def create_new_project(
@@ -84,7 +100,51 @@ def create_new_project(
     project_type: str,
     open_vscode: bool,
     tasks: List[str],
+    templates: Optional[Tuple[str, HojaTemplate]] = None,
+    progress: Optional[ProgressCallback] = None,
+    cancel_event: Optional[threading.Event] = None,
+    remote_queue: Optional["RemoteQueue"] = None,
 ) -> Tuple[bool, str]:
+    """
+    templates:
+        (promp_maestro, hoja_de_ruta) ya cargadas con load_templates().
+        Si es None se toman de la caché de plantillas.
+
+    progress:
+        progress(stage, mensaje) al empezar cada etapa de STAGES.
+        Se llama desde el hilo que ejecuta la creación.
+
+    cancel_event:
+        Si se activa, la creación se detiene en la siguiente etapa.
+        Hasta el rename final todo ocurre en staging, así que cancelar
+        nunca deja una carpeta de proyecto a medias.
+
+    remote_queue:
+        Si se indica, el repo remoto (gh repo create --push) se encola y se
+        crea después; repo_git: se rellena al terminar. Si es None se crea
+        en línea, como antes.
+    """
+
+    # Cada etapa es un span (core.tracing) hasta que empieza la siguiente
+    current_span: List[Any] = [None]
+
+    def end_stage() -> None:
+        if current_span[0] is not None:
+            current_span[0].__exit__(None, None, None)
+            current_span[0] = None
+
+    def stage(name_: str, message: str) -> None:
+        if cancel_event is not None and cancel_event.is_set():
+            raise CreationCancelled()
+        end_stage()
+        current_span[0] = span(f"stage.{name_}").__enter__()
+        if progress is not None:
+            try:
+                progress(name_, message)
+            except Exception:
+                # no romper flujo por la UI
+                pass
+
     name = sanitize_project_name(project_name)
     if not name:
         return False, "Nombre de proyecto inválido."
@@ -95,74 +155,99 @@ def create_new_project(
     if project_dir.exists():
         return False, f"Ya existe: {project_dir}"
 
-    try:
-        project_dir.mkdir(parents=True, exist_ok=False)
+    if templates is None:
+        try:
+            with span("templates.load"):
+                templates = load_templates()
+        except FileNotFoundError as e:
+            return False, str(e)
 
-        # Copiar promp_maestro exacto
-        promp_template = yvolo_root_file("promp_maestro.txt")
-        if not promp_template.exists():
-            return False, "No existe promp_maestro.txt en raíz de yvolo."
+    promp_content, hoja_template = templates
 
-        promp_content = promp_template.read_text(encoding="utf-8")
-        _write_text(project_dir / "promp_maestro.txt", promp_content)
+    # Todo se construye en una carpeta de staging y se publica con un único
+    # rename: si algo falla, el proyecto final nunca llega a existir
+    lock = ProjectLock(base, name)
+    try:
+        lock.acquire()
+    except ProjectLocked:
+        return False, f"Ya se está creando {name} en otro proceso."
+    except OSError as e:
+        return False, f"Error creando proyecto: {e}"
 
-        # Generar hoja_de_ruta desde plantilla base
-        hoja_template_path = yvolo_root_file("hoja_de_ruta.txt")
-        if not hoja_template_path.exists():
-            return False, "No existe hoja_de_ruta.txt en raíz de yvolo."
+    staging: Optional[Path] = None
+    root_span = span("create_new_project", project=name, type=project_type).__enter__()
+    try:
+        stage("dirs", f"Creando carpeta {project_dir}")
+        staging = new_staging_dir(base, name)
 
-        hoja_template = hoja_template_path.read_text(encoding="utf-8")
+        # Copiar promp_maestro exacto (clonado del de la raíz si es el mismo)
+        stage("templates", "Copiando promp_maestro.txt")
+        _place_promp(promp_content, staging / "promp_maestro.txt")
 
         backup_value = f"Desktop\\backups\\backup_{name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip"
 
         # Git
-        git_init_if_needed(str(project_dir))
-
-        repo_url = git_get_origin(str(project_dir))
-        if not repo_url:
-            repo_url = git_try_create_remote_with_gh(str(project_dir), name)
-
-        hoja_final = _apply_hoja_template(
-            hoja_template,
-            project_name=name,
-            repo_url=repo_url,
-            backup_value=backup_value,
-            tasks=tasks,
-        )
-
-        _write_text(project_dir / "hoja_de_ruta.txt", hoja_final)
-
-        # Scaffold mínimo según tipo (sin tocar plantillas)
-        if project_type == "Python":
-            (project_dir / "src").mkdir(exist_ok=True)
-            _write_text(
-                project_dir / "src" / "main.py",
-                f"def main():\n    print('Hola desde {name}')\n\nif __name__ == '__main__':\n    main()\n",
-            )
-        elif project_type == "Flask":
-            (project_dir / "templates").mkdir(exist_ok=True)
-            (project_dir / "static").mkdir(exist_ok=True)
-            _write_text(
-                project_dir / "app.py",
-                "from flask import Flask\napp = Flask(__name__)\n\n@app.get('/')\ndef home():\n    return 'Hola'\n\nif __name__ == '__main__':\n    app.run(debug=True)\n",
+        stage("git", "Inicializando repositorio git")
+        git_init_if_needed(str(staging))
+
+        repo_url = git_get_origin(str(staging))
+        if not repo_url and remote_queue is None:
+            stage("remote", "Creando repositorio remoto con gh")
+            repo_url = git_try_create_remote_with_gh(str(staging), name)
+        elif not repo_url:
+            # Se encola al final, cuando el proyecto local ya está publicado
+            stage("remote", "El repositorio remoto se creará en segundo plano")
+
+        stage("scaffold", "Generando hoja_de_ruta.txt y estructura")
+
+        with span("hoja.render", tasks=len(tasks)):
+            hoja_final = hoja_template.render(
+                project_name=name,
+                repo_url=repo_url,
+                backup_value=backup_value,
+                tasks=tasks,
             )
 
+        _write_text(staging / "hoja_de_ruta.txt", hoja_final)
+
+        # Estructura según tipo: carpeta project_templates/<tipo> (ver core.scaffold)
+        with span("scaffold.materialize", type=project_type):
+            materialize(project_type, staging, name)
+
+        # Última oportunidad de cancelar: después del rename ya no hay vuelta atrás
+        if cancel_event is not None and cancel_event.is_set():
+            raise CreationCancelled()
+        with span("staging.publish"):
+            publish(staging, project_dir)
+        staging = None
+        record_project(project_dir, project_type)
+
+        remote_note = ""
+        if not repo_url and remote_queue is not None:
+            remote_queue.enqueue(str(project_dir), name)
+            remote_note = " (repositorio remoto en cola)"
+
         # VSCode
         if open_vscode:
+            stage("editor", "Abriendo VSCode")
             try:
                 import subprocess
-                subprocess.run(["code", "."], cwd=str(project_dir), check=False)
+                with span("editor.code"):
+                    subprocess.run(["code", "."], cwd=str(project_dir), check=False)
             except Exception:
                 pass
 
-        return True, f"Proyecto creado: {project_dir}"
+        return True, f"Proyecto creado: {project_dir}{remote_note}"
 
     except Exception as e:
-        # rollback: if project folder was partially created, remove it
-        try:
-            if project_dir.exists():
-                import shutil
-                shutil.rmtree(project_dir, ignore_errors=True)
-        except Exception:
-            pass
+        # rollback: solo existe el staging; la carpeta final no se toca
+        if staging is not None:
+            discard(staging)
+        if isinstance(e, CreationCancelled):
+            return False, "Creación cancelada."
         return False, f"Error creando proyecto: {e}"
+
+    finally:
+        end_stage()
+        root_span.__exit__(None, None, None)
+        lock.release()
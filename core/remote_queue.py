@@ -0,0 +1,578 @@
+# C:\Users\Usuario\Desktop\proyectos\yvolo\core\remote_queue.py
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from .config import CONFIG
+from .git_utils import gh_auth_ok, gh_repo_create, git_get_origin, git_push_origin
+from .paths import appdata_dir
+from .roadmap import update_info_fields
+from .staging import _pid_alive
+from .tracing import span
+
+STATUS_PENDING = "pending"
+STATUS_RUNNING = "running"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+# Los fallidos se conservan para retry_failed() y --remote-status
+FAILED_KEEP = 7 * 24 * 3600.0
+
+# La UI, la CLI y el demonio comparten remote_queue.json. Cada proceso relee
+# el fichero cada SYNC_INTERVAL (solo si cambió su firma) y, antes de escribir,
+# toma un lock de fichero, relee y mezcla por id (gana el updated_at más
+# reciente). Un trabajo "running" lleva el dueño (pid:instancia) y un latido;
+# solo vuelve a "pending" si el dueño murió o su latido caducó.
+SYNC_INTERVAL = 2.0
+HEARTBEAT_EVERY = 30.0
+HEARTBEAT_STALE = 10 * HEARTBEAT_EVERY
+
+Listener = Callable[["RemoteJob"], None]
+
+
+def queue_file() -> Path:
+    return appdata_dir() / "remote_queue.json"
+
+
+@contextmanager
+def _file_lock(path: Path) -> Iterator[None]:
+    """Lock exclusivo entre procesos (bloqueante) sobre path."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a+b") as f:
+        if os.name == "nt":
+            import msvcrt
+
+            f.seek(0)
+            while True:
+                try:
+                    # LK_LOCK reintenta durante ~10 s y luego lanza OSError
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+class RemoteJob:
+    __slots__ = (
+        "id",
+        "project_dir",
+        "project_name",
+        "status",
+        "attempts",
+        "next_attempt",
+        "last_error",
+        "repo_url",
+        "created_at",
+        "updated_at",
+        "owner",
+        "heartbeat",
+    )
+
+    def __init__(self, project_dir: str, project_name: str, job_id: Optional[str] = None) -> None:
+        now = time.time()
+        self.id = job_id or uuid.uuid4().hex[:12]
+        self.project_dir = project_dir
+        self.project_name = project_name
+        self.status = STATUS_PENDING
+        self.attempts = 0
+        self.next_attempt = 0.0
+        self.last_error = ""
+        self.repo_url = ""
+        self.created_at = now
+        self.updated_at = now
+        # Solo con status running: "pid:instancia" y último latido
+        self.owner = ""
+        self.heartbeat = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {k: getattr(self, k) for k in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RemoteJob":
+        job = cls(str(data["project_dir"]), str(data["project_name"]), str(data["id"]))
+        for k in cls.__slots__:
+            if k in data:
+                setattr(job, k, data[k])
+        return job
+
+    @property
+    def settled(self) -> bool:
+        return self.status in (STATUS_DONE, STATUS_FAILED)
+
+    @property
+    def owner_pid(self) -> int:
+        try:
+            return int(str(self.owner).split(":", 1)[0])
+        except ValueError:
+            return 0
+
+
+class RemoteQueue:
+    """
+    Cola persistente de creación de repos remotos (gh repo create --push).
+
+    - Se ejecuta después de escribir el proyecto local.
+    - concurrency trabajos a la vez, cada uno con timeout.
+    - Reintentos con backoff exponencial hasta max_attempts.
+    - Al terminar bien, escribe repo_git: en #ProyectoInfo.
+    - Estado en JSON (appdata) compartido entre procesos: cada escritura
+      relee y mezcla bajo un lock de fichero, y un trabajo lo ejecuta solo
+      el proceso que lo marca "running". Los "running" de un proceso muerto
+      (o sin latido) vuelven a "pending". Lo ya terminado en otros procesos
+      se poda al cargar (ver prune_settled); lo de este proceso sigue en
+      status() hasta el siguiente arranque.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        concurrency: int = 2,
+        timeout: float = 120.0,
+        max_attempts: int = 5,
+        backoff_base: float = 5.0,
+        backoff_max: float = 600.0,
+    ) -> None:
+        self.path = Path(path) if path is not None else queue_file()
+        self.concurrency = max(1, int(concurrency))
+        self.timeout = float(timeout)
+        self.max_attempts = max(1, int(max_attempts))
+        self.backoff_base = float(backoff_base)
+        self.backoff_max = float(backoff_max)
+
+        self._cond = threading.Condition()
+        self._jobs: Dict[str, RemoteJob] = {}
+        self._running = 0
+        self._listeners: List[Listener] = []
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._stopping = False
+
+        # Identidad de esta instancia como dueña de trabajos "running"
+        self._owner = f"{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        # Ids presentes en disco en la última lectura/escritura: si faltan
+        # en la siguiente, otro proceso los podó
+        self._synced: Set[str] = set()
+        self._removed: Set[str] = set()
+        self._file_sig: Optional[Tuple[int, int]] = None
+        self._dirty = False
+        self._last_heartbeat = 0.0
+        self._changed: List[RemoteJob] = []
+
+        with self._cond:
+            with self._synced_write():
+                pass
+        self.prune_settled()
+        self._changed.clear()
+
+    # ---------- persistencia ----------
+
+    def _lock_path(self) -> Path:
+        return self.path.with_name(self.path.name + ".lock")
+
+    def _stat_sig(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _read_disk(self) -> Optional[Dict[str, RemoteJob]]:
+        """Trabajos del fichero; None si no se puede leer (no tocar memoria)."""
+        sig = self._stat_sig()
+        try:
+            with self.path.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            self._file_sig = None
+            return {}
+        except (OSError, ValueError):
+            return None
+        self._file_sig = sig
+        jobs: Dict[str, RemoteJob] = {}
+        for item in data.get("jobs", []) if isinstance(data, dict) else []:
+            try:
+                job = RemoteJob.from_dict(item)
+            except (KeyError, TypeError):
+                continue
+            jobs[job.id] = job
+        return jobs
+
+    def _merge(self, disk: Dict[str, RemoteJob]) -> None:
+        # Llamar con self._cond adquirido
+        changed = False
+        for job_id, theirs in disk.items():
+            if job_id in self._removed:
+                continue
+            mine = self._jobs.get(job_id)
+            if mine is None:
+                self._jobs[job_id] = mine = theirs
+            elif theirs.updated_at > mine.updated_at:
+                # En el mismo objeto: _run_job guarda una referencia
+                for k in RemoteJob.__slots__:
+                    setattr(mine, k, getattr(theirs, k))
+            else:
+                continue
+            changed = True
+            if self._listeners:
+                self._changed.append(mine)
+        for job_id in [k for k in self._jobs if k not in disk and k in self._synced]:
+            job = self._jobs[job_id]
+            if not (job.status == STATUS_RUNNING and job.owner == self._owner):
+                del self._jobs[job_id]
+        self._synced = set(disk)
+        if changed:
+            self._cond.notify_all()
+
+    def _refresh(self) -> None:
+        """Relee el fichero si lo cambió otro proceso (sin lock: se escribe con os.replace)."""
+        # Llamar con self._cond adquirido
+        if self._stat_sig() == self._file_sig:
+            return
+        disk = self._read_disk()
+        if disk is not None:
+            self._merge(disk)
+
+    def _orphaned(self, job: RemoteJob, now: float) -> bool:
+        if job.status != STATUS_RUNNING or job.owner == self._owner:
+            return False
+        if not job.owner or not _pid_alive(job.owner_pid):
+            return True
+        return now - float(job.heartbeat or 0.0) > HEARTBEAT_STALE
+
+    def _reclaim(self) -> None:
+        # Llamar con self._cond adquirido
+        now = time.time()
+        for job in self._jobs.values():
+            if self._orphaned(job, now):
+                job.status = STATUS_PENDING
+                job.owner = ""
+                job.updated_at = now
+                self._dirty = True
+
+    @contextmanager
+    def _synced_write(self) -> Iterator[None]:
+        """
+        Lock de fichero + releer y mezclar; lo que se cambie dentro se
+        guarda al salir (si se marcó self._dirty). Llamar con self._cond.
+        """
+        with _file_lock(self._lock_path()):
+            disk = self._read_disk()
+            if disk is not None:
+                self._merge(disk)
+            self._reclaim()
+            yield
+            if self._dirty:
+                self._write()
+
+    def _write(self) -> None:
+        # Llamar con self._cond y el lock de fichero adquiridos
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = json.dumps({"jobs": [j.to_dict() for j in self._jobs.values()]}, ensure_ascii=False, indent=2)
+        fd, tmp = tempfile.mkstemp(prefix=".remote_queue.", suffix=".tmp", dir=str(self.path.parent))
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp, self.path)
+        except Exception:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            return
+        self._file_sig = self._stat_sig()
+        self._synced = set(self._jobs)
+        self._removed.clear()
+        self._dirty = False
+
+    def _save(self) -> None:
+        # Llamar con self._cond adquirido
+        self._dirty = True
+        with self._synced_write():
+            pass
+
+    def _flush_changed(self) -> None:
+        # Avisar de lo que trajeron otros procesos (sin self._cond)
+        with self._cond:
+            changed, self._changed = self._changed, []
+        for job in changed:
+            self._notify(job)
+
+    # ---------- API ----------
+
+    def enqueue(self, project_dir: str, project_name: str) -> str:
+        with self._cond:
+            with self._synced_write():
+                for job in self._jobs.values():
+                    if job.project_dir == str(project_dir) and not job.settled:
+                        return job.id
+                job = RemoteJob(str(project_dir), project_name)
+                self._jobs[job.id] = job
+                self._dirty = True
+            self._cond.notify_all()
+        self._notify(job)
+        return job.id
+
+    def status(self, job_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        with self._cond:
+            self._refresh()
+            jobs = [self._jobs[job_id]] if job_id in self._jobs else (
+                [] if job_id is not None else list(self._jobs.values())
+            )
+            return [j.to_dict() for j in jobs]
+
+    def retry_failed(self) -> int:
+        with self._cond:
+            with self._synced_write():
+                n = 0
+                for job in self._jobs.values():
+                    if job.status == STATUS_FAILED:
+                        job.status = STATUS_PENDING
+                        job.attempts = 0
+                        job.next_attempt = 0.0
+                        job.updated_at = time.time()
+                        n += 1
+                if n:
+                    self._dirty = True
+            if n:
+                self._cond.notify_all()
+            return n
+
+    def prune_settled(self, keep_failed: float = FAILED_KEEP) -> int:
+        """Quita los trabajos terminados bien y los fallidos de hace más de keep_failed s."""
+        cutoff = time.time() - keep_failed
+        with self._cond:
+            with self._synced_write():
+                settled = [
+                    k
+                    for k, j in self._jobs.items()
+                    if j.status == STATUS_DONE or (j.status == STATUS_FAILED and j.updated_at < cutoff)
+                ]
+                for k in settled:
+                    del self._jobs[k]
+                    self._removed.add(k)
+                if settled:
+                    self._dirty = True
+            return len(settled)
+
+    def subscribe(self, callback: Listener) -> Callable[[], None]:
+        with self._cond:
+            self._listeners.append(callback)
+
+        def unsubscribe() -> None:
+            with self._cond:
+                if callback in self._listeners:
+                    self._listeners.remove(callback)
+
+        return unsubscribe
+
+    def _notify(self, job: RemoteJob) -> None:
+        with self._cond:
+            listeners = list(self._listeners)
+        for cb in listeners:
+            try:
+                cb(job)
+            except Exception:
+                pass
+
+    def _busy(self) -> bool:
+        # Pendientes, o en marcha aquí o en otro proceso
+        return self._running > 0 or any(
+            j.status in (STATUS_PENDING, STATUS_RUNNING) for j in self._jobs.values()
+        )
+
+    def idle(self) -> bool:
+        with self._cond:
+            self._refresh()
+            return not self._busy()
+
+    # ---------- ejecución ----------
+
+    def start(self) -> None:
+        with self._cond:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopping = False
+            self._executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="yvolo-remote")
+            self._thread = threading.Thread(target=self._loop, name="yvolo-remote-queue", daemon=True)
+            self._thread.start()
+
+    def stop(self, wait: bool = False) -> None:
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+            thread, executor = self._thread, self._executor
+            self._thread = None
+            self._executor = None
+        if thread is not None and wait:
+            thread.join()
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """
+        Procesa hasta que no quede nada pendiente (incluidos reintentos y lo
+        que esté ejecutando otro proceso). Devuelve False si vence timeout.
+        """
+        self.start()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while True:
+                self._refresh()
+                if not self._busy():
+                    return True
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(min(remaining, 1.0) if remaining is not None else 1.0)
+
+    def _needs_write(self, now: float) -> bool:
+        if self._running and now - self._last_heartbeat >= HEARTBEAT_EVERY:
+            return True
+        for job in self._jobs.values():
+            if job.status == STATUS_PENDING and job.next_attempt <= now and self._running < self.concurrency:
+                return True
+            if self._orphaned(job, now):
+                return True
+        return False
+
+    def _claim(self, now: float) -> None:
+        # Llamar dentro de _synced_write: el estado está recién mezclado
+        for job in self._jobs.values():
+            if job.status == STATUS_RUNNING and job.owner == self._owner:
+                job.heartbeat = now
+                job.updated_at = now
+                self._dirty = True
+            elif job.status == STATUS_PENDING and job.next_attempt <= now and self._running < self.concurrency:
+                job.status = STATUS_RUNNING
+                job.owner = self._owner
+                job.heartbeat = now
+                job.updated_at = now
+                self._running += 1
+                self._dirty = True
+                self._executor.submit(self._run_job, job)
+        self._last_heartbeat = now
+
+    def _loop(self) -> None:
+        while True:
+            with self._cond:
+                if self._stopping:
+                    return
+                self._refresh()
+                now = time.time()
+                if self._needs_write(now):
+                    with self._synced_write():
+                        self._claim(now)
+                next_due: Optional[float] = None
+                for job in self._jobs.values():
+                    if job.status == STATUS_PENDING and job.next_attempt > now:
+                        next_due = job.next_attempt if next_due is None else min(next_due, job.next_attempt)
+                wait = SYNC_INTERVAL if next_due is None else min(SYNC_INTERVAL, max(0.0, next_due - now))
+                self._cond.wait(wait)
+            self._flush_changed()
+
+    def _backoff(self, attempts: int) -> float:
+        return min(self.backoff_max, self.backoff_base * (2 ** (attempts - 1)))
+
+    def _run_job(self, job: RemoteJob) -> None:
+        error = ""
+        url = ""
+        retryable = True
+        job_span = span("remote.job", project=job.project_name, attempt=job.attempts + 1).__enter__()
+        try:
+            url = git_get_origin(job.project_dir)
+            if not url and not gh_auth_ok():
+                # Reintentar no arregla la sesión: queda en failed (ver retry_failed)
+                ok, error, retryable = False, "gh no disponible o no autenticado", False
+            elif url:
+                # Reintento tras crear el repo pero fallar el push
+                ok, error = git_push_origin(job.project_dir, timeout=self.timeout)
+            else:
+                ok, error = gh_repo_create(job.project_dir, job.project_name, timeout=self.timeout)
+                url = git_get_origin(job.project_dir) if ok else ""
+                if ok and not url:
+                    ok, error = False, "gh no configuró origin"
+
+            if ok:
+                hoja = Path(job.project_dir) / "hoja_de_ruta.txt"
+                if hoja.exists():
+                    update_info_fields(hoja, repo_git=url)
+        except Exception as e:
+            ok, error = False, str(e)
+        job_span.set(ok=ok)
+        job_span.__exit__(None, None, None)
+
+        with self._cond:
+            self._running -= 1
+            job.attempts += 1
+            job.owner = ""
+            job.updated_at = time.time()
+            if ok:
+                job.status = STATUS_DONE
+                job.repo_url = url
+                job.last_error = ""
+            elif not retryable or job.attempts >= self.max_attempts:
+                job.status = STATUS_FAILED
+                job.last_error = error
+            else:
+                job.status = STATUS_PENDING
+                job.last_error = error
+                job.next_attempt = time.time() + self._backoff(job.attempts)
+            self._save()
+            self._cond.notify_all()
+        self._notify(job)
+
+
+_default_queue: Optional[RemoteQueue] = None
+_default_lock = threading.Lock()
+
+
+def default_queue() -> RemoteQueue:
+    """
+    Cola compartida del proceso. Parámetros opcionales en settings.json:
+        "remote_queue": {"concurrency": 2, "timeout": 120, "max_attempts": 5, "backoff": 5}
+    """
+    global _default_queue
+    with _default_lock:
+        if _default_queue is None:
+            cfg = CONFIG.get().get("remote_queue", {})
+            if not isinstance(cfg, dict):
+                cfg = {}
+            _default_queue = RemoteQueue(
+                concurrency=cfg.get("concurrency", 2),
+                timeout=cfg.get("timeout", 120.0),
+                max_attempts=cfg.get("max_attempts", 5),
+                backoff_base=cfg.get("backoff", 5.0),
+            )
+        return _default_queue
+
+
+def format_status(jobs: List[Dict[str, Any]]) -> str:
+    if not jobs:
+        return "Cola de remotos vacía."
+    lines = []
+    for j in jobs:
+        extra = j["repo_url"] or j["last_error"]
+        lines.append(f"[{j['status']:<7}] {j['project_name']}  intentos={j['attempts']}  {extra}".rstrip())
+    return "\n".join(lines)
@@ -0,0 +1,320 @@
+# C:\Users\Usuario\Desktop\proyectos\yvolo\core\repo_status.py
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from .git_meta import GIT_META, UnsupportedGitConfig, common_dir, find_git_dir
+from .git_utils import git_remotes, git_status_porcelain
+from .paths import appdata_dir, projects_base_dir
+
+# Estado git de todos los proyectos (cambios sin commit, sin remoto, sin push).
+#
+# Cada resultado se guarda con la firma (mtime_ns, size) de lo que git mira
+# para responder: .git/index, HEAD, la ref de la rama y la de su upstream,
+# packed-refs, config y la propia carpeta del proyecto. Si la firma no cambia
+# no se vuelve a lanzar git. Editar un fichero ya versionado no toca ninguna
+# de esas firmas: por eso el resultado caduca igualmente tras max_age.
+
+STATUS_MAX_AGE = 120.0
+
+Signature = List[Optional[List[int]]]
+
+
+def status_file() -> Path:
+    return appdata_dir() / "git_status.json"
+
+
+class RepoStatus(NamedTuple):
+    name: str
+    path: str
+    is_repo: bool
+    branch: str = ""
+    changed: int = 0
+    untracked: int = 0
+    has_remote: bool = False
+    upstream: str = ""
+    ahead: int = 0
+    behind: int = 0
+    has_commits: bool = False
+    error: str = ""
+
+    @property
+    def dirty(self) -> bool:
+        return bool(self.changed or self.untracked)
+
+    @property
+    def unpushed(self) -> bool:
+        # Sin upstream todavía no se ha hecho push de la rama
+        return self.ahead > 0 or (self.has_remote and self.has_commits and not self.upstream)
+
+    @property
+    def problems(self) -> List[str]:
+        if self.error:
+            return ["error"]
+        if not self.is_repo:
+            return ["sin git"]
+        out = []
+        if self.dirty:
+            out.append("sucio")
+        if not self.has_remote:
+            out.append("sin remoto")
+        elif self.unpushed:
+            out.append("sin push")
+        if self.behind:
+            out.append("por detrás")
+        return out
+
+    @property
+    def summary(self) -> str:
+        if self.error.strip():
+            return f"error: {self.error.strip().splitlines()[0]}"
+        return ", ".join(self.problems) or "ok"
+
+
+class ScanReport(NamedTuple):
+    statuses: List[RepoStatus]
+    queried: int
+    seconds: float
+
+
+def parse_porcelain(name: str, path: str, text: str, has_remote: bool) -> RepoStatus:
+    """Salida de git status --porcelain=v2 --branch."""
+    branch = upstream = ""
+    ahead = behind = changed = untracked = 0
+    has_commits = True
+    for line in text.splitlines():
+        if line.startswith("# branch.oid "):
+            has_commits = line[len("# branch.oid "):].strip() != "(initial)"
+        elif line.startswith("# branch.head "):
+            branch = line[len("# branch.head "):].strip()
+        elif line.startswith("# branch.upstream "):
+            upstream = line[len("# branch.upstream "):].strip()
+        elif line.startswith("# branch.ab "):
+            for part in line[len("# branch.ab "):].split():
+                if part.startswith("+"):
+                    ahead = int(part[1:])
+                elif part.startswith("-"):
+                    behind = int(part[1:])
+        elif line[:2] in ("1 ", "2 ", "u "):
+            changed += 1
+        elif line.startswith("? "):
+            untracked += 1
+    return RepoStatus(
+        name, path, True, branch, changed, untracked, has_remote, upstream, ahead, behind, has_commits
+    )
+
+
+def _stat(path: Path) -> Optional[List[int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def repo_signature(project_dir: Path) -> Optional[Signature]:
+    """Firma de lo que cambia el resultado de git status; None si no es repo."""
+    git_dir = find_git_dir(str(project_dir))
+    if git_dir is None:
+        return None
+    shared = common_dir(git_dir)
+    files = [git_dir / "index", git_dir / "HEAD", shared / "packed-refs", shared / "config"]
+    branch = GIT_META.head(git_dir)
+    if branch:
+        files.append(shared / "refs" / "heads" / branch)
+        try:
+            tracking = GIT_META.config(shared).get(f"branch.{branch}", {})
+        except (UnsupportedGitConfig, OSError):
+            tracking = {}
+        remote, merge = tracking.get("remote", ""), tracking.get("merge", "")
+        if remote and merge.startswith("refs/heads/"):
+            files.append(shared / "refs" / "remotes" / remote / merge[len("refs/heads/"):])
+    return [_stat(project_dir)] + [_stat(f) for f in files]
+
+
+def query_status(project_dir: Path) -> RepoStatus:
+    """Lanza git para un proyecto. Nunca lanza excepciones."""
+    name, path = project_dir.name, str(project_dir)
+    git_dir = find_git_dir(path)
+    if git_dir is None:
+        return RepoStatus(name, path, False)
+    try:
+        has_remote = bool(GIT_META.remotes(common_dir(git_dir)))
+    except (UnsupportedGitConfig, OSError):
+        # Config que git_meta no interpreta (include, insteadOf...): preguntar a git
+        has_remote = bool(git_remotes(path))
+    ok, out = git_status_porcelain(path)
+    if not ok:
+        return RepoStatus(name, path, True, has_remote=has_remote, error=out)
+    try:
+        return parse_porcelain(name, path, out, has_remote)
+    except ValueError as e:
+        return RepoStatus(name, path, True, has_remote=has_remote, error=str(e))
+
+
+def list_projects(base: Optional[Path] = None) -> List[Path]:
+    base = Path(base) if base is not None else projects_base_dir()
+    try:
+        entries = list(os.scandir(base))
+    except OSError:
+        return []
+    return sorted(
+        (Path(e.path) for e in entries if e.is_dir() and not e.name.startswith(".")),
+        key=lambda p: p.name.lower(),
+    )
+
+
+def default_workers() -> int:
+    # Cada consulta es un git status: proceso externo, sobre todo E/S
+    return min(16, (os.cpu_count() or 1) * 4)
+
+
+Progress = Callable[[int, int, RepoStatus], None]
+
+
+class RepoStatusCache:
+    """
+    Resultados por ruta de proyecto, persistidos en appdata/git_status.json.
+    scan() solo lanza git para los proyectos cuya firma cambió o cuyo
+    resultado caducó; el resto sale de la caché con unos pocos stat.
+    """
+
+    def __init__(self, path: Optional[Path] = None, max_age: float = STATUS_MAX_AGE) -> None:
+        self.path = Path(path) if path is not None else status_file()
+        self.max_age = float(max_age)
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self._entries is None:
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+                self._entries = data if isinstance(data, dict) else {}
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+
+    def _save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(prefix=".git_status.", suffix=".tmp", dir=str(self.path.parent))
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f)
+            os.replace(tmp, self.path)
+        except Exception:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+    def _cached(self, key: str, sig: Optional[Signature], now: float) -> Optional[RepoStatus]:
+        entry = self._load().get(key)
+        if entry is None or entry.get("sig") != sig or now - entry.get("checked", 0) > self.max_age:
+            return None
+        try:
+            return RepoStatus(**entry["status"])
+        except (KeyError, TypeError):
+            return None
+
+    def scan(
+        self,
+        base: Optional[Path] = None,
+        workers: Optional[int] = None,
+        force: bool = False,
+        progress: Optional[Progress] = None,
+    ) -> ScanReport:
+        start = time.perf_counter()
+        now = time.time()
+        projects = list_projects(base)
+        total = len(projects)
+        done = 0
+        results: Dict[str, RepoStatus] = {}
+        stale: List[Tuple[Path, Optional[Signature]]] = []
+
+        def report(status: RepoStatus) -> None:
+            nonlocal done
+            done += 1
+            results[status.path] = status
+            if progress is not None:
+                try:
+                    progress(done, total, status)
+                except Exception:
+                    pass  # no romper flujo
+
+        with self._lock:
+            for project in projects:
+                sig = repo_signature(project)
+                cached = None if force else self._cached(str(project), sig, now)
+                if cached is not None:
+                    report(cached)
+                elif sig is None:
+                    # Sin .git no hay nada que consultar
+                    status = RepoStatus(project.name, str(project), False)
+                    self._load()[str(project)] = {"sig": None, "checked": now, "status": status._asdict()}
+                    report(status)
+                else:
+                    stale.append((project, sig))
+
+            if stale:
+                n = min(workers or default_workers(), len(stale))
+                with ThreadPoolExecutor(max_workers=n, thread_name_prefix="yvolo-git-status") as pool:
+                    futures = {pool.submit(query_status, p): sig for p, sig in stale}
+                    for future in as_completed(futures):
+                        status = future.result()
+                        if not status.error:
+                            self._load()[status.path] = {
+                                "sig": futures[future],
+                                "checked": now,
+                                "status": status._asdict(),
+                            }
+                        report(status)
+
+            # Proyectos borrados: fuera de la caché
+            entries = self._load()
+            known = {str(p) for p in projects}
+            base_prefix = str(Path(base) if base is not None else projects_base_dir())
+            for key in [k for k in entries if k not in known and str(Path(k).parent) == base_prefix]:
+                del entries[key]
+
+            try:
+                self._save()
+            except OSError:
+                pass  # no romper flujo: la próxima vez se vuelve a consultar
+
+        statuses = [results[str(p)] for p in projects]
+        return ScanReport(statuses, len(stale), time.perf_counter() - start)
+
+
+_cache: Optional[RepoStatusCache] = None
+_cache_lock = threading.Lock()
+
+
+def default_cache() -> RepoStatusCache:
+    global _cache
+    with _cache_lock:
+        if _cache is None or _cache.path != status_file():
+            _cache = RepoStatusCache()
+        return _cache
+
+
+def format_statuses(statuses: List[RepoStatus], only_problems: bool = False) -> str:
+    rows = [s for s in statuses if s.problems] if only_problems else list(statuses)
+    if not rows:
+        return "Todos los proyectos están limpios y subidos." if statuses else "No hay proyectos."
+    width = max(len(s.name) for s in rows)
+    # Cabecera en ASCII: la consola de Windows (cp1252) no tiene flechas
+    lines = [f"{'proyecto':<{width}}  {'rama':<12}  {'cambios':>7}  {'adel.':>5} {'atr.':>5}  estado"]
+    for s in rows:
+        lines.append(
+            f"{s.name:<{width}}  {s.branch or '-':<12}  {s.changed + s.untracked:>7}  "
+            f"{s.ahead:>5} {s.behind:>5}  {s.summary}"
+        )
+    return "\n".join(lines)
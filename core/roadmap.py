@@ -0,0 +1,468 @@
+# C:\Users\Usuario\Desktop\proyectos\yvolo\core\roadmap.py
+from __future__ import annotations
+
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+SECTION_TASKS = "#Tareas"
+SECTION_IDEAS = "#Ideas"
+SECTION_INFO = "#ProyectoInfo"
+
+FIELD_CRITICA = "Critica"
+FIELD_IMPLEMENTADA = "Implementada"
+FIELD_DEPENDENCIAS = "Dependencias"
+ENTRY_FIELDS = (FIELD_CRITICA, FIELD_IMPLEMENTADA, FIELD_DEPENDENCIAS)
+
+DESCRIPTION_PREFIX = "- Descripción:"
+
+_HEADER_RE = re.compile(r"^#\w+[ \t\r]*(?:\n|$)", re.M)
+_DELIMITER_RE = re.compile(r"^-{3,}[ \t\r]*$", re.M)
+_ENTRY_START_RE = re.compile(r"\n-")
+# Un solo patrón para todo el cuerpo de la sección: mucho más rápido que uno por entrada
+_FIELD_RE = re.compile(r"\n[ \t]*(Critica|Implementada|Dependencias):[ \t]*([^\n]*)")
+
+
+def _ending(line: str) -> str:
+    if line.endswith("\r\n"):
+        return "\r\n"
+    if line.endswith("\n"):
+        return "\n"
+    return ""
+
+
+def _split_lines(text: str) -> List[str]:
+    # Solo "\n" separa líneas (str.splitlines también corta en \x0c, \u2028...)
+    parts = text.split("\n")
+    lines = [p + "\n" for p in parts[:-1]]
+    if parts[-1]:
+        lines.append(parts[-1])
+    return lines
+
+
+def status_key(value: str) -> str:
+    return (value or "").strip().lower()
+
+
+class RoadmapEntry:
+    """
+    Una tarea o idea: "- Descripción: ..." más sus líneas de detalle.
+    raw conserva el texto original (con fines de línea) para el round-trip.
+    """
+
+    __slots__ = ("number", "raw", "description", "critica", "implementada", "dependencias")
+
+    def __init__(self, raw: str, number: int = 0, parse_fields: bool = True) -> None:
+        self.number = number
+        self.raw = raw
+        self.critica = ""
+        self.implementada = ""
+        self.dependencias = ""
+
+        first = raw.partition("\n")[0]
+        if first.startswith(DESCRIPTION_PREFIX):
+            self.description = first[len(DESCRIPTION_PREFIX):].strip()
+        else:
+            self.description = first[1:].strip()
+
+        if parse_fields:
+            for m in _FIELD_RE.finditer(raw):
+                setattr(self, m.group(1).lower(), m.group(2).rstrip())
+
+    @property
+    def is_critical(self) -> bool:
+        return status_key(self.critica) in ("critica", "crítica")
+
+    @property
+    def is_implemented(self) -> bool:
+        return status_key(self.implementada) == "implementada"
+
+    def _set_field(self, field: str, value: str, newline: str) -> None:
+        if field not in ENTRY_FIELDS:
+            raise KeyError(field)
+        value = (value or "").strip()
+        start = self.raw.find("\n") + 1 or len(self.raw)
+        m = re.compile(rf"^([ \t]*){field}:.*?(\r?)$", re.M).search(self.raw, start)
+        if m is not None:
+            new = f"{m.group(1)}{field}: {value}{m.group(2)}"
+            self.raw = self.raw[: m.start()] + new + self.raw[m.end():]
+        else:
+            # Insertar antes de las líneas en blanco finales de la entrada
+            body = self.raw.rstrip("\r\n")
+            tail = self.raw[len(body):]
+            if tail.startswith(newline):
+                tail = tail[len(newline):]
+            self.raw = f"{body}{newline}  {field}: {value}{newline}{tail}"
+        setattr(self, field.lower(), value)
+
+
+class RoadmapSection:
+    """
+    header: línea "#Tareas" / "#Ideas" original
+    lead:   texto antes de la primera entrada
+    trail:  delimitador "-----" y lo que le siga hasta la próxima sección
+    """
+
+    __slots__ = ("name", "header", "lead", "entries", "trail")
+
+    def __init__(self, name: str, header: str) -> None:
+        self.name = name
+        self.header = header
+        self.lead = ""
+        self.entries: List[RoadmapEntry] = []
+        self.trail = ""
+
+    def chunks(self) -> Iterable[str]:
+        yield self.header
+        yield self.lead
+        for e in self.entries:
+            yield e.raw
+        yield self.trail
+
+    def parse_body(self, body: str) -> None:
+        m = _DELIMITER_RE.search(body)
+        if m is not None:
+            self.trail = body[m.start():]
+            body = body[: m.start()]
+
+        starts = [m.start() + 1 for m in _ENTRY_START_RE.finditer(body)]
+        if body[:1] == "-":
+            starts.insert(0, 0)
+        if not starts:
+            self.lead = body
+            return
+
+        self.lead = body[: starts[0]]
+        starts.append(len(body))
+        entries = [
+            RoadmapEntry(body[starts[i]:starts[i + 1]], parse_fields=False)
+            for i in range(len(starts) - 1)
+        ]
+
+        # Asignar cada campo a su entrada recorriendo ambas listas en orden
+        i = 0
+        last = len(entries) - 1
+        for m in _FIELD_RE.finditer(body, starts[0]):
+            pos = m.start()
+            while i < last and starts[i + 1] <= pos:
+                i += 1
+            setattr(entries[i], m.group(1).lower(), m.group(2).rstrip())
+        self.entries = entries
+
+
+class ProjectInfo:
+    """
+    Bloque #ProyectoInfo: líneas "clave: valor" entre delimitadores.
+    """
+
+    __slots__ = ("header", "lines", "_index")
+
+    def __init__(self, header: str, lines: List[str]) -> None:
+        self.header = header
+        self.lines = lines
+        self._index: Dict[str, int] = {}
+        for i, line in enumerate(lines):
+            key, sep, _value = line.partition(":")
+            if sep and key and not key[0].isspace() and " " not in key.strip():
+                self._index.setdefault(key.strip(), i)
+
+    def get(self, key: str, default: str = "") -> str:
+        idx = self._index.get(key)
+        if idx is None:
+            return default
+        return self.lines[idx].partition(":")[2].strip()
+
+    def fields(self) -> Dict[str, str]:
+        return {k: self.get(k) for k in self._index}
+
+    def set(self, key: str, value: str, newline: str = "\n") -> None:
+        new_line = f"{key}: {value}".rstrip()
+        idx = self._index.get(key)
+        if idx is not None:
+            old = self.lines[idx]
+            self.lines[idx] = new_line + (_ending(old) or newline)
+            return
+
+        # Añadir antes del delimitador final (o al final del bloque)
+        pos = len(self.lines)
+        for i in range(len(self.lines) - 1, -1, -1):
+            if _DELIMITER_RE.match(self.lines[i]):
+                pos = i
+                break
+        if pos > 0 and not _ending(self.lines[pos - 1]):
+            self.lines[pos - 1] += newline
+        self.lines.insert(pos, new_line + newline)
+        self._index = {k: (i + 1 if i >= pos else i) for k, i in self._index.items()}
+        self._index[key] = pos
+
+    @property
+    def repo_git(self) -> str:
+        return self.get("repo_git")
+
+    @property
+    def name_project(self) -> str:
+        return self.get("name_project")
+
+    @property
+    def backup(self) -> str:
+        return self.get("backup")
+
+
+class Roadmap:
+    """
+    Modelo en memoria de hoja_de_ruta.txt.
+
+    serialize() devuelve exactamente el texto parseado si no hay cambios.
+    Los índices por estado / criticidad se construyen bajo demanda.
+    """
+
+    __slots__ = ("head", "sections", "info", "newline", "_by_status", "_by_critica")
+
+    def __init__(self) -> None:
+        self.head = ""
+        self.sections: List[RoadmapSection] = []
+        self.info: Optional[ProjectInfo] = None
+        self.newline = "\n"
+        self._by_status: Optional[Dict[str, List[RoadmapEntry]]] = None
+        self._by_critica: Optional[Dict[str, List[RoadmapEntry]]] = None
+
+    # ---------- acceso ----------
+
+    def section(self, name: str) -> Optional[RoadmapSection]:
+        for s in self.sections:
+            if s.name == name:
+                return s
+        return None
+
+    @property
+    def tasks(self) -> List[RoadmapEntry]:
+        s = self.section(SECTION_TASKS)
+        return s.entries if s is not None else []
+
+    @property
+    def ideas(self) -> List[RoadmapEntry]:
+        s = self.section(SECTION_IDEAS)
+        return s.entries if s is not None else []
+
+    def task(self, number: int) -> Optional[RoadmapEntry]:
+        tasks = self.tasks
+        if 1 <= number <= len(tasks):
+            return tasks[number - 1]
+        return None
+
+    def _build_indexes(self) -> None:
+        by_status: Dict[str, List[RoadmapEntry]] = {}
+        by_critica: Dict[str, List[RoadmapEntry]] = {}
+        for e in self.tasks:
+            by_status.setdefault(status_key(e.implementada), []).append(e)
+            by_critica.setdefault(status_key(e.critica), []).append(e)
+        self._by_status = by_status
+        self._by_critica = by_critica
+
+    def tasks_by_status(self, implementada: str) -> List[RoadmapEntry]:
+        if self._by_status is None:
+            self._build_indexes()
+        return list(self._by_status.get(status_key(implementada), []))
+
+    def tasks_by_critica(self, critica: str) -> List[RoadmapEntry]:
+        if self._by_critica is None:
+            self._build_indexes()
+        return list(self._by_critica.get(status_key(critica), []))
+
+    def status_counts(self) -> Dict[str, int]:
+        if self._by_status is None:
+            self._build_indexes()
+        return {k: len(v) for k, v in self._by_status.items()}
+
+    # ---------- edición ----------
+
+    def _invalidate(self) -> None:
+        self._by_status = None
+        self._by_critica = None
+
+    def _renumber(self) -> None:
+        for i, e in enumerate(self.tasks, start=1):
+            e.number = i
+
+    def insert_tasks(
+        self,
+        position: int,
+        descriptions: Iterable[str],
+        critica: str = "No critica",
+        implementada: str = "No implementada",
+        dependencias: str = "Ninguna",
+    ) -> List[RoadmapEntry]:
+        """
+        Inserta tareas nuevas en #Tareas (position 0 = al principio).
+        Las descripciones vacías se ignoran.
+        """
+        section = self.section(SECTION_TASKS)
+        if section is None:
+            raise ValueError("La hoja de ruta no contiene #Tareas")
+
+        new_entries = []
+        for d in descriptions:
+            d = (d or "").strip()
+            if d:
+                new_entries.append(
+                    RoadmapEntry(format_entry(d, critica, implementada, dependencias, self.newline))
+                )
+
+        if new_entries:
+            section.entries[position:position] = new_entries
+            self._renumber()
+            self._invalidate()
+        return new_entries
+
+    def move_ideas_to_tasks(self, ideas: List[RoadmapEntry], raws: List[str]) -> List[RoadmapEntry]:
+        """
+        Quita ideas de #Ideas y añade raws (ya con formato de tarea) al final
+        de #Tareas.
+        """
+        tasks = self.section(SECTION_TASKS)
+        section = self.section(SECTION_IDEAS)
+        if tasks is None or section is None:
+            raise ValueError("La hoja de ruta no contiene #Tareas e #Ideas")
+
+        drop = {id(e) for e in ideas}
+        section.entries = [e for e in section.entries if id(e) not in drop]
+        new_entries = [RoadmapEntry(raw) for raw in raws]
+        tasks.entries.extend(new_entries)
+        self._renumber()
+        self._invalidate()
+        return new_entries
+
+    def set_task_field(self, entry: RoadmapEntry, field: str, value: str) -> None:
+        entry._set_field(field, value, self.newline)
+        self._invalidate()
+
+    # ---------- serialización ----------
+
+    def chunks(self) -> Iterable[str]:
+        yield self.head
+        for s in self.sections:
+            yield from s.chunks()
+        if self.info is not None:
+            yield self.info.header
+            yield from self.info.lines
+
+    def serialize(self) -> str:
+        return "".join(self.chunks())
+
+
+def format_entry(
+    description: str,
+    critica: str = "No critica",
+    implementada: str = "No implementada",
+    dependencias: str = "Ninguna",
+    newline: str = "\n",
+) -> str:
+    nl = newline
+    return (
+        f"{DESCRIPTION_PREFIX} {description}{nl}"
+        f"  {FIELD_CRITICA}: {critica}{nl}"
+        f"  {FIELD_IMPLEMENTADA}: {implementada}{nl}"
+        f"  {FIELD_DEPENDENCIAS}: {dependencias}{nl}"
+        f"{nl}"
+    )
+
+
+def parse_roadmap(text: str) -> Roadmap:
+    roadmap = Roadmap()
+    first_nl = text.find("\n")
+    if first_nl > 0 and text[first_nl - 1] == "\r":
+        roadmap.newline = "\r\n"
+
+    headers = list(_HEADER_RE.finditer(text))
+    roadmap.head = text[: headers[0].start()] if headers else text
+
+    for i, m in enumerate(headers):
+        end = headers[i + 1].start() if i + 1 < len(headers) else len(text)
+        name = m.group(0).strip()
+        if name == SECTION_INFO:
+            # #ProyectoInfo es por regla el último bloque
+            roadmap.info = ProjectInfo(m.group(0), _split_lines(text[m.end():]))
+            break
+        section = RoadmapSection(name, m.group(0))
+        section.parse_body(text[m.end():end])
+        roadmap.sections.append(section)
+
+    roadmap._renumber()
+    return roadmap
+
+
+def peek_tasks(text: str, limit: int) -> List[RoadmapEntry]:
+    """
+    Primeras ~limit tareas de #Tareas sin parsear el resto del fichero.
+    Para enseñar algo enseguida mientras parse_roadmap() trabaja en segundo plano.
+    """
+    header = None
+    for m in _HEADER_RE.finditer(text):
+        if m.group(0).strip() == SECTION_TASKS:
+            header = m
+            break
+    if header is None:
+        return []
+
+    # Cortar tras limit entradas y, dentro de ese trozo, en la siguiente
+    # cabecera: buscarla en todo el texto recorrería el fichero entero
+    end = len(text)
+    count = 0
+    for m in _ENTRY_START_RE.finditer(text, header.end()):
+        count += 1
+        if count > limit:
+            end = m.start() + 1
+            break
+    nxt = _HEADER_RE.search(text, header.end(), end)
+    if nxt is not None:
+        end = nxt.start()
+
+    section = RoadmapSection(SECTION_TASKS, header.group(0))
+    section.parse_body(text[header.end():end])
+    for i, e in enumerate(section.entries, start=1):
+        e.number = i
+    return section.entries[:limit]
+
+
+def load_roadmap(path: Path) -> Roadmap:
+    # Bytes -> str sin traducir fines de línea (round-trip exacto)
+    return parse_roadmap(Path(path).read_bytes().decode("utf-8"))
+
+
+def save_roadmap(path: Path, roadmap: Roadmap) -> None:
+    """
+    Escritura atómica: fichero temporal en la misma carpeta + os.replace.
+    """
+    path = Path(path)
+    fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=str(path.parent))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(roadmap.serialize().encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except Exception:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def update_info_fields(path: Path, **fields: str) -> None:
+    """
+    Actualiza campos de #ProyectoInfo (repo_git, backup...).
+    Lo normal es localizar el bloque leyendo solo el final del fichero (ver
+    roadmap_tail). Si el bloque no está al final o está repetido, se parsea
+    y se guarda con roadmap_writer.
+    """
+    # Imports diferidos: ambos módulos importan este
+    from .roadmap_tail import update_info_tail
+    from .roadmap_writer import writer_for
+
+    if update_info_tail(path, **fields):
+        return
+    with writer_for(path) as writer:
+        writer.set_info(**fields)
@@ -0,0 +1,208 @@
+# C:\Users\Usuario\Desktop\proyectos\yvolo\core\roadmap_tail.py
+from __future__ import annotations
+
+import mmap
+import os
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import BinaryIO, NamedTuple, Optional, Tuple
+
+from .roadmap import ProjectInfo, _split_lines
+from .roadmap_writer import _atomic_write
+
+# #ProyectoInfo es por regla el último bloque de hoja_de_ruta.txt: para leer
+# o cambiar repo_git / name_project / backup basta con el final del fichero.
+# Se lee hacia atrás por bloques (4 KiB, luego más) hasta encontrar la
+# cabecera; el coste no depende de cuántas tareas tenga la hoja.
+#
+# parse_roadmap se queda con el PRIMER #ProyectoInfo. Si hay más de uno
+# (bloque duplicado a mano) aquí se devuelve None y quien llama usa el camino
+# completo, para no leer ni escribir un bloque que ningún lector ve. Saberlo
+# exige buscar la cabecera en el resto del fichero (búsqueda de bytes, sin
+# parsear); el resultado se guarda por firma (dev, inodo, mtime_ns, tamaño) y
+# las escrituras de este módulo, que no tocan lo anterior al bloque, lo
+# mantienen: solo se repite tras un cambio de fuera.
+#
+# Escritura: hasta REPLACE_MAX se reescribe el fichero entero en un temporal
+# + os.replace (atómico, como roadmap_writer). Por encima se escribe solo el
+# bloque en su sitio: un corte a mitad puede dañar esas pocas líneas finales,
+# nunca #Tareas ni #Ideas.
+
+TAIL_BLOCK = 4096
+# Si la cabecera no aparece en este final, quien llama usa el parseo completo
+MAX_TAIL = 1024 * 1024
+REPLACE_MAX = 4 * 1024 * 1024
+# Reintentos si otro proceso reemplaza el fichero mientras se escribe
+_ATTEMPTS = 3
+
+_INFO_HEADER_RE = re.compile(rb"^#ProyectoInfo[ \t\r]*(?:\n|$)", re.M)
+_INFO_MARK = b"\n#ProyectoInfo"
+
+FileId = Tuple[int, int, int, int]
+
+# ruta -> (firma, offset): sin otra cabecera antes de offset
+_PREFIX_CACHE_MAX = 64
+_prefix_checked: "OrderedDict[str, Tuple[FileId, int]]" = OrderedDict()
+_prefix_lock = threading.Lock()
+
+
+class InfoBlock(NamedTuple):
+    # Posición (bytes) de la línea "#ProyectoInfo"
+    offset: int
+    info: ProjectInfo
+    newline: str
+    raw: bytes
+
+
+def _file_id(st: os.stat_result) -> FileId:
+    return st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size
+
+
+def _prefix_key(path: str) -> str:
+    return os.path.normcase(os.path.abspath(path))
+
+
+def _remember_prefix(key: str, file_id: FileId, offset: int) -> None:
+    with _prefix_lock:
+        _prefix_checked[key] = (file_id, offset)
+        _prefix_checked.move_to_end(key)
+        while len(_prefix_checked) > _PREFIX_CACHE_MAX:
+            _prefix_checked.popitem(last=False)
+
+
+def _header_before(f: BinaryIO, end: int) -> bool:
+    """¿Hay otra cabecera #ProyectoInfo antes de end? Búsqueda de bytes, sin parsear."""
+    if end <= 0:
+        return False
+    key = _prefix_key(f.name)
+    file_id = _file_id(os.fstat(f.fileno()))
+    with _prefix_lock:
+        cached = _prefix_checked.get(key)
+    if cached is not None and cached[0] == file_id and cached[1] >= end:
+        return False
+    if _scan_header_before(f, end):
+        return True
+    _remember_prefix(key, file_id, end)
+    return False
+
+
+def _scan_header_before(f: BinaryIO, end: int) -> bool:
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if _INFO_HEADER_RE.match(mm, 0):
+            return True
+        i = mm.find(_INFO_MARK, 0, end)
+        while i != -1:
+            if _INFO_HEADER_RE.match(mm, i + 1):
+                return True
+            i = mm.find(_INFO_MARK, i + 1, end)
+    return False
+
+
+def _find_block(f: BinaryIO) -> Optional[InfoBlock]:
+    size = f.seek(0, os.SEEK_END)
+    block = TAIL_BLOCK
+    while True:
+        start = max(0, size - block)
+        # Un byte de más delante: saber si la cabecera empieza línea
+        read_from = max(0, start - 1)
+        f.seek(read_from)
+        data = f.read(size - read_from)
+        matches = [m for m in _INFO_HEADER_RE.finditer(data) if m.start() > 0 or read_from == 0]
+        if matches:
+            if len(matches) > 1:
+                return None
+            match = matches[0]
+            offset = read_from + match.start()
+            if _header_before(f, read_from):
+                return None
+            raw = data[match.start():]
+            header_end = match.end() - match.start()
+            header = raw[:header_end].decode("utf-8")
+            info = ProjectInfo(header, _split_lines(raw[header_end:].decode("utf-8")))
+            newline = "\r\n" if header.endswith("\r\n") else "\n"
+            return InfoBlock(offset, info, newline, raw)
+        if start == 0 or block >= MAX_TAIL:
+            return None
+        block *= 4
+
+
+def read_info_block(path: Path) -> Optional[InfoBlock]:
+    with Path(path).open("rb") as f:
+        return _find_block(f)
+
+
+def read_info(path: Path) -> Optional[ProjectInfo]:
+    """#ProyectoInfo leído desde el final; None si no está al final o está repetido."""
+    block = read_info_block(path)
+    return block.info if block is not None else None
+
+
+def _render(block: InfoBlock, fields: dict) -> bytes:
+    info = block.info
+    for key, value in fields.items():
+        info.set(key, value, block.newline)
+    return (info.header + "".join(info.lines)).encode("utf-8")
+
+
+def update_info_tail(path: Path, **fields: str) -> bool:
+    """
+    Cambia campos de #ProyectoInfo sin leer ni parsear las tareas.
+    Hojas pequeñas: copia + os.replace. Grandes: seek a la cabecera, write y
+    truncate. Si otro proceso reemplaza el fichero mientras tanto (p.ej.
+    save_roadmap), se repite sobre el nuevo.
+
+    False si el bloque no está al final, está repetido o el fichero no para
+    de cambiar: quien llama usa el camino completo (core.roadmap.update_info_fields
+    lo hace).
+    """
+    path = Path(path)
+    for _ in range(_ATTEMPTS):
+        replace_data: Optional[bytes] = None
+        with path.open("r+b") as f:
+            opened = _file_id(os.fstat(f.fileno()))
+            block = _find_block(f)
+            if block is None:
+                return False
+            new = _render(block, fields)
+            if new == block.raw:
+                return True
+
+            if opened[3] <= REPLACE_MAX:
+                f.seek(0)
+                replace_data = f.read(block.offset) + new
+            else:
+                # Solo lo que cambia a partir del primer byte distinto
+                same = 0
+                limit = min(len(new), len(block.raw))
+                while same < limit and new[same] == block.raw[same]:
+                    same += 1
+                f.seek(block.offset + same)
+                f.write(new[same:])
+                f.truncate()
+                f.flush()
+                os.fsync(f.fileno())
+                try:
+                    current = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                if _file_id(current)[:2] != opened[:2]:
+                    continue  # se escribió en un fichero ya reemplazado
+                # Lo anterior al bloque no cambió: la comprobación sigue valiendo
+                _remember_prefix(_prefix_key(str(path)), _file_id(os.fstat(f.fileno())), block.offset)
+                return True
+
+        # Fuera del with: en Windows no se puede reemplazar un fichero abierto
+        try:
+            if _file_id(os.stat(path)) != opened:
+                continue
+        except FileNotFoundError:
+            continue
+        _atomic_write(path, replace_data)
+        try:
+            _remember_prefix(_prefix_key(str(path)), _file_id(os.stat(path)), block.offset)
+        except OSError:
+            pass
+        return True
+    return False
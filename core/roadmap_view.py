@@ -0,0 +1,140 @@
+# C:\Users\Usuario\Desktop\proyectos\yvolo\core\roadmap_view.py
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import Iterable, List, NamedTuple, Optional, Set
+
+from .roadmap import SECTION_TASKS, RoadmapEntry, parse_roadmap, peek_tasks, status_key
+from .task_graph import TaskGraph, parse_dependencies
+
+# Modelo del visor de hoja de ruta (ui.roadmap_viewer), sin Tk:
+# filas planas y filtros que se calculan en un hilo aparte.
+
+FILTER_ALL = "Todas"
+
+CRITICA_VALUES = (FILTER_ALL, "Critica", "No critica")
+IMPLEMENTADA_VALUES = (FILTER_ALL, "Implementada", "No implementada")
+
+DEPS_NONE = "Sin dependencias"
+DEPS_SOME = "Con dependencias"
+DEPS_UNBLOCKED = "Desbloqueadas"
+DEPENDENCIAS_VALUES = (FILTER_ALL, DEPS_NONE, DEPS_SOME, DEPS_UNBLOCKED)
+
+
+class TaskRow(NamedTuple):
+    number: int
+    description: str
+    critica: str
+    implementada: str
+    dependencias: str
+    critical: bool
+    implemented: bool
+    has_deps: bool
+
+
+class RoadmapFilter(NamedTuple):
+    critica: str = FILTER_ALL
+    implementada: str = FILTER_ALL
+    dependencias: str = FILTER_ALL
+    text: str = ""
+
+    @property
+    def is_default(self) -> bool:
+        return self == RoadmapFilter()
+
+
+def task_rows(entries: Iterable[RoadmapEntry]) -> List[TaskRow]:
+    rows = []
+    for e in entries:
+        deps = e.dependencias.strip()
+        rows.append(
+            TaskRow(
+                e.number,
+                e.description,
+                e.critica,
+                e.implementada,
+                deps,
+                e.is_critical,
+                e.is_implemented,
+                bool(parse_dependencies(deps)),
+            )
+        )
+    return rows
+
+
+class RoadmapModel(NamedTuple):
+    rows: List[TaskRow]
+    # Tareas pendientes con todas sus dependencias implementadas
+    unblocked: Set[int]
+
+
+_HEADER_RE = re.compile(r"^#\w+", re.M)
+
+
+def _tasks_closed(text: str) -> bool:
+    """True si en text ya empieza otra sección después de #Tareas."""
+    start = text.find(SECTION_TASKS)
+    return start >= 0 and _HEADER_RE.search(text, start + len(SECTION_TASKS)) is not None
+
+
+# Lectura inicial para la primera pantalla; se duplica si no alcanza
+FIRST_READ = 64 * 1024
+
+
+def read_first_rows(path: Path, limit: int) -> List[TaskRow]:
+    """
+    Primera pantalla: solo se lee el principio del fichero y se parsean las
+    primeras limit tareas. Se pide una de más para saber que la última
+    está completa (no cortada por el final del trozo leído).
+    """
+    size = FIRST_READ
+    with Path(path).open("rb") as f:
+        data = b""
+        while True:
+            chunk = f.read(size - len(data))
+            data += chunk
+            eof = len(chunk) == 0 or len(data) < size
+            # Cortar en un fin de línea: no partir caracteres UTF-8
+            cut = len(data) if eof else data.rfind(b"\n") + 1
+            text = data[:cut].decode("utf-8")
+            entries = peek_tasks(text, limit + 1)
+            if eof or len(entries) > limit or _tasks_closed(text):
+                return task_rows(entries[:limit])
+            size *= 2
+
+
+def load_model(path: Path) -> RoadmapModel:
+    roadmap = parse_roadmap(Path(path).read_bytes().decode("utf-8"))
+    return RoadmapModel(task_rows(roadmap.tasks), set(TaskGraph.from_roadmap(roadmap).unblocked()))
+
+
+def filter_rows(model: RoadmapModel, flt: RoadmapFilter) -> List[int]:
+    """Índices (en model.rows) de las filas que pasan el filtro, en orden."""
+    if flt.is_default:
+        return list(range(len(model.rows)))
+
+    want_critical: Optional[bool] = None
+    if flt.critica != FILTER_ALL:
+        want_critical = status_key(flt.critica) in ("critica", "crítica")
+    want_implemented: Optional[bool] = None
+    if flt.implementada != FILTER_ALL:
+        want_implemented = status_key(flt.implementada) == "implementada"
+    text = flt.text.strip().lower()
+
+    out = []
+    for i, r in enumerate(model.rows):
+        if want_critical is not None and r.critical != want_critical:
+            continue
+        if want_implemented is not None and r.implemented != want_implemented:
+            continue
+        if flt.dependencias == DEPS_NONE and r.has_deps:
+            continue
+        if flt.dependencias == DEPS_SOME and not r.has_deps:
+            continue
+        if flt.dependencias == DEPS_UNBLOCKED and r.number not in model.unblocked:
+            continue
+        if text and text not in r.description.lower():
+            continue
+        out.append(i)
+    return out
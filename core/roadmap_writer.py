@@ -0,0 +1,316 @@
+# C:\Users\Usuario\Desktop\proyectos\yvolo\core\roadmap_writer.py
+from __future__ import annotations
+
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from itertools import accumulate
+from operator import attrgetter
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+from .roadmap import SECTION_TASKS, Roadmap, RoadmapEntry, RoadmapSection, parse_roadmap
+
+# Escritura incremental de hoja_de_ruta.txt.
+#
+# Cada edición (cambiar un campo de una tarea, añadir tareas al final de
+# #Tareas, cambiar una línea de #ProyectoInfo) se aplica al modelo y se anota
+# como un parche (inicio, fin, texto nuevo) sobre los bytes leídos. commit()
+# junta todos los parches en una sola escritura: los tramos sin cambios se
+# copian tal cual de los bytes anteriores (sin serializar el modelo ni volver
+# a codificar el fichero entero) y se sustituye con temporal + os.replace.
+#
+# El writer conserva el modelo y las posiciones entre commits: mientras nadie
+# más toque el fichero (firma mtime_ns/size) no se vuelve a parsear.
+
+Signature = Tuple[int, int]
+_raw = attrgetter("raw")
+
+
+def _blen(text: str) -> int:
+    return len(text.encode("utf-8"))
+
+
+def _signature(path: Path) -> Signature:
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=str(path.parent))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except Exception:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+class _Patch:
+    __slots__ = ("start", "end", "render")
+
+    def __init__(self, start: int, end: int, render: Callable[[], str]) -> None:
+        self.start = start
+        self.end = end
+        self.render = render
+
+
+class RoadmapWriter:
+    """
+    Uso:
+        with RoadmapWriter(hoja) as w:          # un solo write al salir
+            w.set_task_field(3, "Implementada", "Implementada")
+            w.append_tasks(["nueva tarea"])
+            w.set_info(backup="Desktop\\backups\\x.zip")
+
+    Si el fichero cambia por fuera entre la primera edición y commit(), se
+    relee y se vuelven a aplicar las ediciones pendientes.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self._lock = threading.RLock()
+        self._data = b""
+        self._sig: Optional[Signature] = None
+        self._roadmap: Optional[Roadmap] = None
+        # Por sección (id): longitud en bytes de cada entrada y sumas acumuladas
+        # desde el principio del fichero
+        self._layout: Dict[int, Tuple[List[int], List[int]]] = {}
+        self._info_start = 0
+        self._patches: Dict[Hashable, _Patch] = {}
+        self._ops: List[Tuple[str, Tuple[Any, ...], Dict[str, Any]]] = []
+        # Tareas existentes (índice en #Tareas) cambiadas en la tanda actual
+        self._touched: Set[int] = set()
+        # Tareas añadidas en la tanda actual (van todas en un mismo parche)
+        self._appended: List[RoadmapEntry] = []
+        self._last_appended: List[RoadmapEntry] = []
+        self.loads = 0
+        self.writes = 0
+
+    # ---------- estado ----------
+
+    def _load(self) -> None:
+        self._data = self.path.read_bytes()
+        self._sig = _signature(self.path)
+        self._roadmap = parse_roadmap(self._data.decode("utf-8"))
+        self._layout = {}
+        self._compute_layout()
+        self._touched = set()
+        self._appended = []
+        self.loads += 1
+
+    def _fresh(self) -> Roadmap:
+        """Modelo al día con el disco (solo se relee si cambió la firma)."""
+        if self._roadmap is None or _signature(self.path) != self._sig:
+            self._load()
+            self._patches.clear()
+        return self._roadmap  # type: ignore[return-value]
+
+    @property
+    def roadmap(self) -> Roadmap:
+        """Modelo actual, con las ediciones pendientes aplicadas."""
+        with self._lock:
+            if self._patches:
+                return self._roadmap  # type: ignore[return-value]
+            return self._fresh()
+
+    def _compute_layout(self) -> None:
+        # Posiciones sobre los bytes actuales: se calculan al leer y tras cada
+        # commit, nunca con ediciones pendientes (desplazarían los tramos).
+        # Las longitudes ya conocidas se reutilizan: tras un commit solo se
+        # vuelven a sumar, sin codificar otra vez cada entrada.
+        roadmap = self._roadmap
+        assert roadmap is not None
+        layout: Dict[int, Tuple[List[int], List[int]]] = {}
+        pos = _blen(roadmap.head)
+        for s in roadmap.sections:
+            start = pos + _blen(s.header) + _blen(s.lead)
+            known = self._layout.get(id(s))
+            lens = known[0] if known is not None else [_blen(e.raw) for e in s.entries]
+            sums = list(accumulate(lens, initial=start))
+            layout[id(s)] = (lens, sums)
+            pos = sums[-1] + _blen(s.trail)
+        self._layout = layout
+        self._info_start = pos
+
+    def _update_lengths(self) -> None:
+        """Tras escribir: longitudes de las tareas cambiadas y añadidas."""
+        roadmap = self._roadmap
+        assert roadmap is not None
+        section = roadmap.section(SECTION_TASKS)
+        if section is None or (not self._touched and not self._appended):
+            return
+        lens = self._layout[id(section)][0]
+        for i in self._touched:
+            lens[i] = _blen(section.entries[i].raw)
+        lens.extend(_blen(e.raw) for e in self._appended)
+
+    def _entry_span(self, section: RoadmapSection, index: int) -> Tuple[int, int]:
+        sums = self._layout[id(section)][1]
+        return sums[index], sums[index + 1]
+
+    def _entries_end(self, section: RoadmapSection) -> int:
+        return self._layout[id(section)][1][-1]
+
+    def _record(self, op: str, *args: Any, **kwargs: Any) -> None:
+        if not self._patches:
+            self._fresh()
+            self._ops.clear()
+        getattr(self, f"_do_{op}")(*args, **kwargs)
+        # Solo se anotan las que se aplicaron (para repetirlas si hay que releer)
+        self._ops.append((op, args, kwargs))
+
+    # ---------- ediciones ----------
+
+    def set_task_field(self, number: int, field: str, value: str) -> None:
+        """Critica / Implementada / Dependencias de la tarea number (1..n)."""
+        with self._lock:
+            self._record("set_task_field", number, field, value)
+
+    def append_tasks(
+        self,
+        descriptions: Iterable[str],
+        critica: str = "No critica",
+        implementada: str = "No implementada",
+        dependencias: str = "Ninguna",
+    ) -> List[RoadmapEntry]:
+        with self._lock:
+            self._record("append_tasks", list(descriptions), critica, implementada, dependencias)
+            return self._last_appended
+
+    def set_info(self, **fields: str) -> None:
+        """Líneas de #ProyectoInfo (repo_git, backup...)."""
+        with self._lock:
+            self._record("set_info", **fields)
+
+    def _do_set_task_field(self, number: int, field: str, value: str) -> None:
+        roadmap = self._roadmap
+        assert roadmap is not None
+        entry = roadmap.task(number)
+        section = roadmap.section(SECTION_TASKS)
+        if entry is None or section is None:
+            raise IndexError(f"No existe la tarea {number}")
+        key = ("entry", id(entry))
+        # Las tareas añadidas en esta tanda ya las escribe el parche de append
+        if key not in self._patches and not any(entry is e for e in self._appended):
+            start, end = self._entry_span(section, number - 1)
+            self._patches[key] = _Patch(start, end, lambda e=entry: e.raw)
+            self._touched.add(number - 1)
+        roadmap.set_task_field(entry, field, value)
+
+    def _do_append_tasks(self, descriptions: List[str], critica: str, implementada: str, dependencias: str) -> None:
+        roadmap = self._roadmap
+        assert roadmap is not None
+        section = roadmap.section(SECTION_TASKS)
+        if section is None:
+            raise ValueError("La hoja de ruta no contiene #Tareas")
+        key = ("append", id(section))
+        if key not in self._patches:
+            pos = self._entries_end(section)
+            self._patches[key] = _Patch(pos, pos, lambda: "".join(map(_raw, self._appended)))
+        new = roadmap.insert_tasks(len(section.entries), descriptions, critica, implementada, dependencias)
+        self._appended.extend(new)
+        self._last_appended = new
+
+    def _do_set_info(self, **fields: str) -> None:
+        roadmap = self._roadmap
+        assert roadmap is not None
+        if roadmap.info is None:
+            raise ValueError("La hoja de ruta no contiene #ProyectoInfo")
+        if ("info",) not in self._patches:
+            info = roadmap.info
+            # #ProyectoInfo es el último bloque: el parche llega hasta el final
+            self._patches[("info",)] = _Patch(
+                self._info_start, len(self._data), lambda: info.header + "".join(info.lines)
+            )
+        for key, value in fields.items():
+            roadmap.info.set(key, value, roadmap.newline)
+
+    # ---------- escritura ----------
+
+    def pending(self) -> int:
+        return len(self._patches)
+
+    def commit(self) -> bool:
+        """Una sola escritura con todos los parches. False si no había nada."""
+        with self._lock:
+            if not self._patches:
+                return False
+            if _signature(self.path) != self._sig:
+                # Cambió por fuera: releer y repetir las ediciones sobre el texto nuevo
+                ops = list(self._ops)
+                self._load()
+                self._patches.clear()
+                for op, args, kwargs in ops:
+                    getattr(self, f"_do_{op}")(*args, **kwargs)
+
+            data = memoryview(self._data)
+            pieces: List[Any] = []
+            pos = 0
+            for patch in sorted(self._patches.values(), key=lambda p: (p.start, p.end)):
+                pieces.append(data[pos : patch.start])
+                pieces.append(patch.render().encode("utf-8"))
+                pos = patch.end
+            pieces.append(data[pos:])
+            new_data = b"".join(pieces)
+
+            _atomic_write(self.path, new_data)
+            self._data = new_data
+            self._sig = _signature(self.path)
+            self._update_lengths()
+            self._compute_layout()
+            self._patches.clear()
+            self._ops.clear()
+            self._touched = set()
+            self._appended = []
+            self.writes += 1
+            return True
+
+    def discard(self) -> None:
+        """Olvida las ediciones pendientes (el modelo se relee en la próxima)."""
+        with self._lock:
+            self._patches.clear()
+            self._ops.clear()
+            self._touched = set()
+            self._appended = []
+            self._roadmap = None
+
+    def __enter__(self) -> "RoadmapWriter":
+        self._lock.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            if exc_type is None:
+                self.commit()
+            else:
+                self.discard()
+        finally:
+            self._lock.release()
+
+
+# Writers recientes por ruta: ediciones seguidas sobre la misma hoja no la reparsean
+_WRITERS: "OrderedDict[str, RoadmapWriter]" = OrderedDict()
+_WRITERS_MAX = 8
+_writers_lock = threading.Lock()
+
+
+def writer_for(path: Path) -> RoadmapWriter:
+    key = str(Path(path).resolve())
+    with _writers_lock:
+        writer = _WRITERS.get(key)
+        if writer is None:
+            writer = RoadmapWriter(Path(key))
+            _WRITERS[key] = writer
+            if len(_WRITERS) > _WRITERS_MAX:
+                _WRITERS.popitem(last=False)
+        else:
+            _WRITERS.move_to_end(key)
+        return writer
@@ -0,0 +1,325 @@
+# C:\Users\Usuario\Desktop\proyectos\yvolo\core\scaffold.py
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from .paths import is_frozen_exe, yvolo_root_file
+
+# Tipos de proyecto como carpetas de plantilla:
+#
+#   project_templates/<Tipo>/
+#       manifest.json        carpetas y ficheros (tamaño, sha256, render)
+#       src/main.py.tmpl     *.tmpl: se sustituye {{project_name}} y se quita .tmpl
+#       app.py               el resto se clona/enlaza/copia tal cual
+#
+# El manifiesto se genera con `python ui_main.py --template-manifests` y evita
+# recorrer la plantilla en cada creación. Un tipo sin carpeta (p.ej. "Vacío")
+# no genera estructura.
+
+TEMPLATES_DIR = "project_templates"
+MANIFEST_NAME = "manifest.json"
+RENDER_SUFFIX = ".tmpl"
+PLACEHOLDER = "{{project_name}}"
+EMPTY_TYPE = "Vacío"
+
+# Por debajo de esto no compensa arrancar hilos
+PARALLEL_MIN_FILES = 32
+HASH_CHUNK = 1024 * 1024
+
+Signature = Tuple[int, int]
+
+
+class ManifestEntry(NamedTuple):
+    path: str  # relativo, con "/"
+    size: int
+    sha256: str
+    render: bool
+
+
+class Manifest(NamedTuple):
+    dirs: List[str]
+    files: List[ManifestEntry]
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "version": 1,
+            "dirs": self.dirs,
+            "files": [e._asdict() for e in self.files],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, object]) -> "Manifest":
+        files = [
+            ManifestEntry(str(f["path"]), int(f["size"]), str(f["sha256"]), bool(f.get("render", False)))
+            for f in data.get("files", [])  # type: ignore[union-attr]
+        ]
+        return cls([str(d) for d in data.get("dirs", [])], files)  # type: ignore[union-attr]
+
+
+def templates_root() -> Path:
+    return yvolo_root_file(TEMPLATES_DIR)
+
+
+def template_dir(project_type: str) -> Optional[Path]:
+    """None si el nombre no es una carpeta simple (viene de manifiestos de lote)."""
+    if not project_type or project_type in (".", "..") or "/" in project_type or "\\" in project_type:
+        return None
+    return templates_root() / project_type
+
+
+def available_types() -> List[str]:
+    """"Vacío" (sin estructura) + una entrada por carpeta de plantilla."""
+    try:
+        found = sorted(e.name for e in os.scandir(templates_root()) if e.is_dir())
+    except OSError:
+        found = []
+    return [EMPTY_TYPE] + [t for t in found if t != EMPTY_TYPE]
+
+
+def _sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def build_manifest(root: Path, keep_dirs: Optional[List[str]] = None) -> Manifest:
+    """
+    Recorre la plantilla. keep_dirs conserva carpetas vacías declaradas a mano
+    (git no guarda carpetas vacías, así que solo existen en el manifiesto).
+    """
+    dirs = set(keep_dirs or [])
+    files: List[ManifestEntry] = []
+    for current, subdirs, names in os.walk(root):
+        # compileall/python dejan cachés dentro de las plantillas .py
+        subdirs[:] = sorted(d for d in subdirs if d != "__pycache__")
+        rel_dir = Path(current).relative_to(root).as_posix()
+        if rel_dir != ".":
+            dirs.add(rel_dir)
+        for n in sorted(names):
+            if (rel_dir == "." and n == MANIFEST_NAME) or n.endswith(".pyc"):
+                continue
+            path = Path(current) / n
+            rel = n if rel_dir == "." else f"{rel_dir}/{n}"
+            files.append(ManifestEntry(rel, path.stat().st_size, _sha256(path), n.endswith(RENDER_SUFFIX)))
+    return Manifest(sorted(dirs), files)
+
+
+def write_manifest(root: Path) -> Manifest:
+    path = root / MANIFEST_NAME
+    keep: List[str] = []
+    try:
+        keep = Manifest.from_dict(json.loads(path.read_text(encoding="utf-8"))).dirs
+        # Solo se conservan las que siguen sin existir en disco (vacías a propósito)
+        keep = [d for d in keep if not (root / d).is_dir()]
+    except (OSError, ValueError, KeyError):
+        pass
+    manifest = build_manifest(root, keep)
+    path.write_text(json.dumps(manifest.to_dict(), indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    return manifest
+
+
+def write_all_manifests(root: Optional[Path] = None) -> List[Path]:
+    root = root if root is not None else templates_root()
+    written = []
+    for entry in sorted(os.scandir(root), key=lambda e: e.name):
+        if entry.is_dir():
+            write_manifest(Path(entry.path))
+            written.append(Path(entry.path) / MANIFEST_NAME)
+    return written
+
+
+class ManifestCache:
+    """
+    Manifiestos por carpeta de plantilla, clave (mtime_ns, size) de manifest.json.
+    Sin manifest.json se recorre la carpeta (y se cachea igual).
+    En el exe no se vuelve a hacer stat, como TemplateCache.
+    """
+
+    def __init__(self, verify: Optional[bool] = None) -> None:
+        self.verify = (not is_frozen_exe()) if verify is None else verify
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Tuple[Optional[Signature], Manifest]] = {}
+
+    @staticmethod
+    def _signature(path: Path) -> Optional[Signature]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def get(self, root: Path) -> Optional[Manifest]:
+        """None si la plantilla no existe."""
+        key = str(root)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and not self.verify:
+                return cached[1]
+
+        manifest_path = root / MANIFEST_NAME
+        sig = self._signature(manifest_path)
+        if cached is not None and sig == cached[0] and sig is not None:
+            return cached[1]
+
+        if sig is not None:
+            manifest = Manifest.from_dict(json.loads(manifest_path.read_text(encoding="utf-8")))
+        elif root.is_dir():
+            manifest = build_manifest(root)
+        else:
+            return None
+
+        with self._lock:
+            self._entries[key] = (sig, manifest)
+        return manifest
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+MANIFESTS = ManifestCache()
+
+
+# ---------- clonar / enlazar / copiar ----------
+
+LINK_REFLINK = "reflink"
+LINK_HARDLINK = "hardlink"
+LINK_COPY = "copy"
+
+_FICLONE = 0x40049409  # linux/fs.h
+
+# (dev origen, dev destino) -> estrategias que ya fallaron: con 5000 ficheros
+# no se reintenta la que no funciona en ese par de volúmenes
+_unsupported: Dict[Tuple[int, int], set] = {}
+_unsupported_lock = threading.Lock()
+
+
+def _reflink(src: Path, dst: Path) -> None:
+    if sys.platform.startswith("linux"):
+        import fcntl
+
+        with src.open("rb") as fs:
+            fd = os.open(str(dst), os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+            try:
+                fcntl.ioctl(fd, _FICLONE, fs.fileno())
+            except OSError:
+                os.close(fd)
+                os.unlink(dst)
+                raise
+            os.close(fd)
+        return
+    if sys.platform == "darwin":
+        import ctypes
+        import ctypes.util
+
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        if libc.clonefile(os.fsencode(src), os.fsencode(dst), 0) != 0:
+            raise OSError(ctypes.get_errno(), "clonefile")
+        return
+    # Windows: el block cloning de ReFS no está expuesto; se copia
+    raise OSError("reflink no soportado")
+
+
+def _mark_unsupported(key: Tuple[int, int], strategy: str) -> None:
+    with _unsupported_lock:
+        _unsupported.setdefault(key, set()).add(strategy)
+
+
+def place_file(src: Path, dst: Path, allow_hardlink: bool = False) -> str:
+    """
+    dst a partir de src: reflink (copia en escritura), hardlink si se permite
+    y copia normal como último recurso. Devuelve la estrategia usada.
+
+    El hardlink comparte el fichero con la plantilla (editar uno edita el
+    otro), por eso solo se usa si se pide expresamente.
+    """
+    try:
+        key = (os.stat(src).st_dev, os.stat(dst.parent).st_dev)
+    except OSError:
+        key = (-1, -1)
+    failed = _unsupported.get(key, ())
+
+    if LINK_REFLINK not in failed:
+        try:
+            _reflink(src, dst)
+            return LINK_REFLINK
+        except (OSError, AttributeError):
+            _mark_unsupported(key, LINK_REFLINK)
+
+    if allow_hardlink and LINK_HARDLINK not in failed:
+        try:
+            os.link(src, dst)
+            return LINK_HARDLINK
+        except OSError:
+            _mark_unsupported(key, LINK_HARDLINK)
+
+    shutil.copyfile(src, dst)
+    return LINK_COPY
+
+
+def hardlinks_enabled() -> bool:
+    """settings.json: "template_hardlinks": true (por defecto no)."""
+    from .config import CONFIG
+
+    try:
+        return bool(CONFIG.get().get("template_hardlinks", False))
+    except Exception:
+        return False
+
+
+def materialize(
+    project_type: str,
+    dest: Path,
+    project_name: str,
+    root: Optional[Path] = None,
+    allow_hardlink: Optional[bool] = None,
+    workers: int = 8,
+) -> Dict[str, int]:
+    """
+    Vuelca la plantilla del tipo en dest (que ya existe).
+    Devuelve cuántos ficheros se colocaron con cada estrategia (+ "render").
+    """
+    src_root = root if root is not None else template_dir(project_type)
+    counts: Dict[str, int] = {}
+    if src_root is None:
+        return counts
+    manifest = MANIFESTS.get(src_root)
+    if manifest is None:
+        return counts
+
+    if allow_hardlink is None:
+        allow_hardlink = hardlinks_enabled()
+
+    for d in manifest.dirs:
+        (dest / d).mkdir(parents=True, exist_ok=True)
+
+    def place(entry: ManifestEntry) -> str:
+        src = src_root / entry.path
+        if entry.render:
+            target = dest / entry.path[: -len(RENDER_SUFFIX)]
+            text = src.read_text(encoding="utf-8").replace(PLACEHOLDER, project_name)
+            with target.open("w", encoding="utf-8", newline="") as f:
+                f.write(text)
+            return "render"
+        return place_file(src, dest / entry.path, allow_hardlink)
+
+    files = manifest.files
+    if len(files) < PARALLEL_MIN_FILES or workers <= 1:
+        used = [place(e) for e in files]
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="yvolo-scaffold") as pool:
+            used = list(pool.map(place, files))
+
+    for u in used:
+        counts[u] = counts.get(u, 0) + 1
+    return counts
@@ -0,0 +1,391 @@
+# C:\Users\Usuario\Desktop\proyectos\yvolo\core\snapshots.py
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from .backup import (
+    CHUNK_SIZE,
+    DEFAULT_EXCLUDES,
+    STORED_SUFFIXES,
+    BackupCancelled,
+    BackupProgress,
+    _append_compressed,
+    atomic_zip,
+    backup_name,
+    default_workers,
+    empty_dir_info,
+    iter_project_files,
+    record_backup,
+)
+from .backup_catalog import KIND_SNAPSHOT, KIND_ZIP, file_checksum, register_backup
+from .paths import backups_base_dir
+
+# Almacén por contenido:
+#
+#   Desktop\backups\store\objects\ab\abcdef...   (sha256 del contenido)
+#   Desktop\backups\store\snapshots\<proyecto>\<fecha>.json
+#
+# Cada objeto es un stream deflate crudo, el mismo que va dentro de un zip,
+# así que exportar un snapshot a backup_<nombre>_<fecha>.zip es copiar bytes.
+
+SNAPSHOT_TS_FORMAT = "%Y%m%d_%H%M%S"
+
+FileEntry = Dict[str, Any]
+
+
+class SnapshotResult(NamedTuple):
+    manifest: Path
+    files: int
+    new_objects: int
+    reused: int
+    bytes_in: int
+    bytes_new: int
+    seconds: float
+
+
+def store_root() -> Path:
+    return backups_base_dir() / "store"
+
+
+def _entry_key(entry: FileEntry) -> Tuple[int, int]:
+    return int(entry["size"]), int(entry["mtime_ns"])
+
+
+class BackupStore:
+    """
+    Backups deduplicados: el contenido se guarda una vez (sha256), compartido
+    entre snapshots y proyectos. Un snapshot es un manifiesto JSON pequeño.
+
+    Si (size, mtime) de un fichero coincide con el snapshot anterior del
+    proyecto no se vuelve a leer ni hashear.
+    """
+
+    def __init__(self, root: Optional[Path] = None) -> None:
+        self.root = Path(root) if root is not None else store_root()
+        self.objects_dir = self.root / "objects"
+        self.snapshots_dir = self.root / "snapshots"
+
+    # ---------- objetos ----------
+
+    def object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / digest[2:]
+
+    def has_object(self, digest: str) -> bool:
+        return self.object_path(digest).is_file()
+
+    def _store_file(self, path: str, arcname: str, level: int, chunk_size: int) -> Tuple[FileEntry, bool]:
+        """
+        Hash + deflate en una sola lectura a un temporal del almacén.
+        Si el objeto ya existía se descarta el temporal.
+
+        Devuelve:
+            (entrada del manifiesto sin path/mtime, objeto_nuevo)
+        """
+        if os.path.splitext(arcname)[1].lower() in STORED_SUFFIXES:
+            level = 0
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+        sha = hashlib.sha256()
+        crc = 0
+        size = 0
+
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(prefix=".obj_", suffix=".tmp", dir=str(self.objects_dir))
+        try:
+            with os.fdopen(fd, "wb") as out, open(path, "rb") as f:
+                while True:
+                    data = f.read(chunk_size)
+                    if not data:
+                        break
+                    sha.update(data)
+                    crc = zlib.crc32(data, crc)
+                    size += len(data)
+                    out.write(compressor.compress(data))
+                out.write(compressor.flush())
+                csize = out.tell()
+
+            digest = sha.hexdigest()
+            target = self.object_path(digest)
+            if target.is_file():
+                os.unlink(tmp)
+                csize = target.stat().st_size
+                new = False
+            else:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(tmp, target)
+                new = True
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+        return {"hash": digest, "size": size, "crc": crc, "csize": csize}, new
+
+    # ---------- snapshots ----------
+
+    def project_dir(self, project_name: str) -> Path:
+        return self.snapshots_dir / project_name
+
+    def list_snapshots(self, project_name: str) -> List[Path]:
+        """Manifiestos del proyecto, del más antiguo al más reciente."""
+        folder = self.project_dir(project_name)
+        try:
+            return sorted(p for p in folder.iterdir() if p.suffix == ".json")
+        except OSError:
+            return []
+
+    def latest(self, project_name: str) -> Optional[Path]:
+        snaps = self.list_snapshots(project_name)
+        return snaps[-1] if snaps else None
+
+    @staticmethod
+    def load_manifest(path: Path) -> Dict[str, Any]:
+        with Path(path).open("r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _previous_index(self, project_name: str) -> Dict[str, FileEntry]:
+        latest = self.latest(project_name)
+        if latest is None:
+            return {}
+        try:
+            return {e["path"]: e for e in self.load_manifest(latest).get("files", [])}
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}
+
+    def _write_manifest(self, project_name: str, created: datetime, manifest: Dict[str, Any]) -> Path:
+        folder = self.project_dir(project_name)
+        folder.mkdir(parents=True, exist_ok=True)
+        stem = created.strftime(SNAPSHOT_TS_FORMAT)
+        target = folder / f"{stem}.json"
+        n = 1
+        while target.exists():
+            target = folder / f"{stem}_{n}.json"
+            n += 1
+
+        fd, tmp = tempfile.mkstemp(prefix=".snap_", suffix=".tmp", dir=str(folder))
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp, target)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+        return target
+
+    def snapshot(
+        self,
+        project_dir: Path,
+        workers: Optional[int] = None,
+        excludes: Sequence[str] = DEFAULT_EXCLUDES,
+        level: int = 6,
+        chunk_size: int = CHUNK_SIZE,
+        progress: Optional[BackupProgress] = None,
+        cancel_event: Optional[threading.Event] = None,
+    ) -> SnapshotResult:
+        """
+        Guarda un snapshot del proyecto.
+        Solo se leen los ficheros nuevos o con (size, mtime) distinto al
+        snapshot anterior; el resto reutiliza su entrada.
+        """
+        t0 = time.perf_counter()
+        project_dir = Path(project_dir).resolve()
+        if not project_dir.is_dir():
+            raise FileNotFoundError(f"No existe el proyecto: {project_dir}")
+
+        name = project_dir.name
+        created = datetime.now()
+        previous = self._previous_index(name)
+        workers = max(1, workers or default_workers())
+        store_prefix = os.path.normcase(str(self.root))
+
+        files: List[FileEntry] = []
+        dirs: List[str] = []
+        todo: List[Tuple[int, str, str, Tuple[int, int]]] = []
+
+        for path, arcname, empty_dir in iter_project_files(project_dir, excludes):
+            if cancel_event is not None and cancel_event.is_set():
+                raise BackupCancelled()
+            if os.path.normcase(path).startswith(store_prefix):
+                continue
+            if empty_dir:
+                dirs.append(arcname)
+                continue
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            key = (st.st_size, st.st_mtime_ns)
+            old = previous.get(arcname)
+            if old is not None and _entry_key(old) == key and self.has_object(old["hash"]):
+                files.append(dict(old))
+            else:
+                todo.append((len(files), path, arcname, key))
+                files.append({})
+
+        reused = len(files) - len(todo)
+        new_objects = 0
+        bytes_new = 0
+        done = reused
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="yvolo-snapshot") as pool:
+            futures = [(i, arcname, key, pool.submit(self._store_file, path, arcname, level, chunk_size))
+                       for i, path, arcname, key in todo]
+            try:
+                for i, arcname, key, fut in futures:
+                    if cancel_event is not None and cancel_event.is_set():
+                        raise BackupCancelled()
+                    entry, new = fut.result()
+                    entry["path"] = arcname
+                    entry["mtime_ns"] = key[1]
+                    files[i] = entry
+                    done += 1
+                    if new:
+                        new_objects += 1
+                        bytes_new += entry["csize"]
+                    if progress is not None:
+                        try:
+                            progress(done, bytes_new)
+                        except Exception:
+                            pass
+            finally:
+                for _, _, _, fut in futures:
+                    fut.cancel()
+
+        # Ficheros que desaparecieron entre stat y lectura
+        files = [f for f in files if f]
+        manifest = {
+            "project": name,
+            "source": str(project_dir),
+            "created": created.strftime(SNAPSHOT_TS_FORMAT),
+            "files": files,
+            "dirs": dirs,
+        }
+        path = self._write_manifest(name, created, manifest)
+        bytes_in = sum(int(f["size"]) for f in files)
+        register_backup(self.root.parent, name, KIND_SNAPSHOT, path, created, bytes_in, file_checksum(path))
+        return SnapshotResult(
+            manifest=path,
+            files=len(files),
+            new_objects=new_objects,
+            reused=reused,
+            bytes_in=bytes_in,
+            bytes_new=bytes_new,
+            seconds=time.perf_counter() - t0,
+        )
+
+    # ---------- exportar ----------
+
+    def export_zip(self, manifest_path: Path, dest_dir: Optional[Path] = None) -> Path:
+        """
+        Snapshot -> backup_<nombre>_<fecha>.zip (formato del promp maestro).
+        No recomprime: los objetos ya son streams deflate.
+        """
+        manifest = self.load_manifest(manifest_path)
+        created = datetime.strptime(manifest["created"], SNAPSHOT_TS_FORMAT)
+        dest_dir = Path(dest_dir) if dest_dir is not None else backups_base_dir()
+        target = dest_dir / backup_name(manifest["project"], created)
+
+        with atomic_zip(target) as zf:
+            for entry in manifest.get("files", []):
+                date_time = max(time.localtime(entry["mtime_ns"] / 1e9)[:6], (1980, 1, 1, 0, 0, 0))
+                zinfo = zipfile.ZipInfo(entry["path"], date_time)
+                zinfo.external_attr = 0o644 << 16
+                zinfo.compress_type = zipfile.ZIP_DEFLATED
+                zinfo.CRC = int(entry["crc"])
+                zinfo.file_size = int(entry["size"])
+                zinfo.compress_size = int(entry["csize"])
+                with self.object_path(entry["hash"]).open("rb") as data:
+                    _append_compressed(zf, zinfo, data)
+            for arcname in manifest.get("dirs", []):
+                zf.writestr(empty_dir_info(arcname), b"")
+
+        register_backup(
+            target.parent, manifest["project"], KIND_ZIP, target, created, target.stat().st_size, file_checksum(target)
+        )
+        return target
+
+    def collect_garbage(self, grace: float = 3600.0) -> int:
+        """
+        Borra objetos que ningún manifiesto referencia.
+        Los más recientes que grace segundos se respetan: pueden ser de un
+        snapshot en curso cuyo manifiesto aún no está escrito.
+        """
+        referenced = set()
+        try:
+            projects = list(self.snapshots_dir.iterdir())
+        except OSError:
+            projects = []
+        for folder in projects:
+            for manifest_path in self.list_snapshots(folder.name):
+                try:
+                    referenced.update(e["hash"] for e in self.load_manifest(manifest_path).get("files", []))
+                except (OSError, ValueError, KeyError, TypeError):
+                    # manifiesto ilegible: no arriesgar borrando nada
+                    return 0
+
+        cutoff = time.time() - grace
+        removed = 0
+        try:
+            buckets = list(os.scandir(self.objects_dir))
+        except OSError:
+            return 0
+        for bucket in buckets:
+            if not bucket.is_dir():
+                # temporales .obj_ de un proceso muerto
+                if bucket.name.startswith(".obj_") and bucket.stat().st_mtime < cutoff:
+                    os.unlink(bucket.path)
+                continue
+            with os.scandir(bucket.path) as it:
+                for obj in it:
+                    if bucket.name + obj.name in referenced or obj.stat().st_mtime >= cutoff:
+                        continue
+                    try:
+                        os.unlink(obj.path)
+                        removed += 1
+                    except OSError:
+                        pass
+        return removed
+
+
+def snapshot_project(
+    project_dir: Path,
+    export: bool = False,
+    store: Optional[BackupStore] = None,
+    **kwargs,
+) -> Tuple[bool, str]:
+    """
+    Snapshot deduplicado con el contrato (ok, mensaje) de la UI/CLI.
+    export=True genera además el zip y actualiza backup: en la hoja de ruta.
+    """
+    store = store or BackupStore()
+    try:
+        result = store.snapshot(project_dir, **kwargs)
+        lines = [
+            f"Snapshot creado: {result.manifest}",
+            f"{result.files} ficheros ({result.reused} sin cambios), "
+            f"{result.new_objects} objetos nuevos ({result.bytes_new / (1024 * 1024):.1f} MB) "
+            f"en {result.seconds:.2f}s",
+        ]
+        if export:
+            zip_path = store.export_zip(result.manifest)
+            record_backup(project_dir, zip_path)
+            lines.append(f"Exportado: {zip_path}")
+    except BackupCancelled:
+        return False, "Backup cancelado."
+    except Exception as e:
+        return False, f"Error creando snapshot: {e}"
+    return True, "\n".join(lines)
@@ -0,0 +1,292 @@
+# C:\Users\Usuario\Desktop\proyectos\yvolo\core\staging.py
+from __future__ import annotations
+
+import os
+import shutil
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+# Creación en dos fases:
+#   1) el proyecto se construye en <base>\.yvolo_staging\<nombre>.<pid>.<id>
+#   2) se publica con un único rename a <base>\<nombre>
+# El staging está en la misma carpeta base, así que el rename es atómico
+# (mismo sistema de ficheros). Un lock por nombre evita dos creaciones
+# simultáneas del mismo proyecto.
+
+STAGING_DIR = ".yvolo_staging"
+LOCK_SUFFIX = ".lock"
+
+# Staging o lock sin proceso vivo, o más viejo que esto, se considera basura
+STALE_AFTER = 24 * 3600.0
+# Un lock sin pid solo es huérfano pasado este margen
+LOCK_GRACE = 10.0
+TMP_SUFFIX = ".tmp"
+
+
+class ProjectLocked(Exception):
+    pass
+
+
+def staging_root(base: Path) -> Path:
+    return Path(base) / STAGING_DIR
+
+
+def _pid_alive(pid: int) -> bool:
+    if pid <= 0:
+        return False
+    if pid == os.getpid():
+        return True
+    if os.name == "nt":
+        import ctypes
+
+        kernel32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
+        handle = kernel32.OpenProcess(0x1000, False, pid)  # PROCESS_QUERY_LIMITED_INFORMATION
+        if not handle:
+            return False
+        try:
+            code = ctypes.c_ulong()
+            kernel32.GetExitCodeProcess(handle, ctypes.byref(code))
+            return code.value == 259  # STILL_ACTIVE
+        finally:
+            kernel32.CloseHandle(handle)
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    except OSError:
+        return False
+    return True
+
+
+def _file_id(st: os.stat_result) -> Tuple[int, int, int, int]:
+    return st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size
+
+
+class ProjectLock:
+    """
+    Lock exclusivo por nombre de proyecto. El fichero se escribe con el pid
+    aparte y se enlaza (os.link) en su sitio: nunca se ve vacío. Si el dueño
+    de un lock existente ya no vive, se roba.
+    """
+
+    def __init__(self, base: Path, name: str) -> None:
+        self.path = staging_root(base) / f"{name.lower()}{LOCK_SUFFIX}"
+        self.held = False
+
+    def _owner_pid(self) -> int:
+        try:
+            return int(self.path.read_text(encoding="utf-8").split()[0])
+        except (OSError, ValueError, IndexError):
+            return 0
+
+    def _break_orphaned(self, force: bool = False) -> bool:
+        """
+        Quita el lock si es huérfano (o si force). True si ya no hay lock,
+        False si lo tiene un proceso vivo.
+
+        Sin pid es un lock de otro proceso a medio escribir (sistemas de
+        ficheros sin hardlinks) salvo que lleve así más de LOCK_GRACE.
+        El lock se aparta con un rename a un nombre único y solo cuenta si
+        lo apartado es el mismo fichero (inodo, mtime, tamaño) que se juzgó: si dos procesos
+        ven el mismo lock huérfano, solo uno lo quita; el otro no se lleva
+        por delante el lock nuevo del primero.
+        """
+        try:
+            with open(self.path, "rb") as f:
+                st = os.fstat(f.fileno())
+                head = f.read(64)
+        except FileNotFoundError:
+            return True
+        except OSError:
+            return False
+        if not force:
+            try:
+                pid = int(head.split()[0])
+            except (ValueError, IndexError):
+                pid = 0
+            if pid:
+                if _pid_alive(pid):
+                    return False
+            elif time.time() - st.st_mtime <= LOCK_GRACE:
+                return False
+
+        aside = self.path.with_name(f"{self.path.name}.{os.getpid()}.{uuid.uuid4().hex[:8]}{TMP_SUFFIX}")
+        try:
+            os.rename(self.path, aside)
+        except FileNotFoundError:
+            return True  # otro proceso lo quitó antes
+        except OSError:
+            return False
+        try:
+            moved = os.stat(aside)
+            # El inodo solo no basta: el sistema de ficheros lo reutiliza enseguida
+            if _file_id(moved) == _file_id(st):
+                return True
+            # Era el lock recién creado por quien lo quitó antes: devolverlo
+            try:
+                os.link(aside, self.path)
+            except FileExistsError:
+                pass
+            except OSError:
+                try:
+                    os.rename(aside, self.path)
+                except OSError:
+                    pass
+            return False
+        finally:
+            try:
+                os.unlink(aside)
+            except OSError:
+                pass
+
+    def _create(self) -> None:
+        """Crea el lock ya con contenido. FileExistsError si existe."""
+        content = f"{os.getpid()} {time.time():.0f}\n"
+        tmp = self.path.parent / f"{self.path.name}.{os.getpid()}.{uuid.uuid4().hex[:8]}{TMP_SUFFIX}"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(content)
+        try:
+            os.link(tmp, self.path)
+            return
+        except FileExistsError:
+            raise
+        except OSError:
+            pass  # sin hardlinks (FAT, algunos recursos de red): O_EXCL
+        finally:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+        fd = os.open(str(self.path), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+
+    def acquire(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        for _ in range(2):
+            try:
+                self._create()
+            except FileExistsError:
+                if not self._break_orphaned():
+                    raise ProjectLocked(self._owner_pid())
+                continue
+            self.held = True
+            return
+        raise ProjectLocked(0)
+
+    def release(self) -> None:
+        if self.held:
+            try:
+                os.unlink(self.path)
+            except OSError:
+                pass
+            self.held = False
+
+    def __enter__(self) -> "ProjectLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.release()
+
+
+def new_staging_dir(base: Path, name: str) -> Path:
+    path = staging_root(base) / f"{name}.{os.getpid()}.{uuid.uuid4().hex[:8]}"
+    path.mkdir(parents=True)
+    return path
+
+
+def publish(staging: Path, final: Path) -> None:
+    """
+    Mueve staging a final con un solo rename.
+    Lanza FileExistsError si final ya existe (el llamador tiene el lock del
+    nombre, así que solo puede ser algo creado fuera de yvolo).
+    """
+    if final.exists():
+        raise FileExistsError(f"Ya existe: {final}")
+    os.rename(staging, final)
+
+
+def discard(staging: Path, background: bool = True) -> None:
+    """
+    Borra un staging fallido. En segundo plano por defecto: el proyecto
+    final nunca llegó a existir, así que el rollback ya está hecho.
+    Si el proceso muere antes, cleanup_stale() lo recoge.
+    """
+    if background:
+        threading.Thread(
+            target=shutil.rmtree, args=(staging,), kwargs={"ignore_errors": True}, name="yvolo-discard", daemon=True
+        ).start()
+    else:
+        shutil.rmtree(staging, ignore_errors=True)
+
+
+def _staging_pid(name: str) -> int:
+    # <nombre>.<pid>.<id>  (el nombre puede contener puntos)
+    parts = name.rsplit(".", 2)
+    try:
+        return int(parts[-2]) if len(parts) == 3 else 0
+    except ValueError:
+        return 0
+
+
+def cleanup_stale(base: Path, max_age: float = STALE_AFTER) -> List[Path]:
+    """
+    Borra staging y locks de procesos que ya no existen (o muy viejos).
+    Se llama al arrancar; no toca lo que pertenece a procesos vivos.
+    """
+    root = staging_root(base)
+    removed: List[Path] = []
+    try:
+        entries = list(os.scandir(root))
+    except OSError:
+        return removed
+
+    now = time.time()
+    for entry in entries:
+        try:
+            old = now - entry.stat(follow_symlinks=False).st_mtime > max_age
+        except OSError:
+            continue
+        path = Path(entry.path)
+        if entry.name.endswith(LOCK_SUFFIX):
+            lock = ProjectLock(base, entry.name[: -len(LOCK_SUFFIX)])
+            if lock._break_orphaned(force=old):
+                removed.append(path)
+        elif entry.name.endswith(TMP_SUFFIX):
+            # Contenido de un lock que no llegó a enlazarse
+            pid = _staging_pid(entry.name[: -len(TMP_SUFFIX)])
+            if old or not (pid and _pid_alive(pid)):
+                try:
+                    os.unlink(path)
+                    removed.append(path)
+                except OSError:
+                    pass
+        elif entry.is_dir(follow_symlinks=False):
+            pid = _staging_pid(entry.name)
+            if old or not (pid and _pid_alive(pid)):
+                shutil.rmtree(path, ignore_errors=True)
+                removed.append(path)
+    return removed
+
+
+def cleanup_stale_async(base: Optional[Path] = None) -> threading.Thread:
+    from .paths import projects_base_dir
+
+    target = base if base is not None else projects_base_dir()
+
+    def run() -> None:
+        try:
+            cleanup_stale(target)
+        except Exception:
+            # no romper flujo: es mantenimiento
+            pass
+
+    t = threading.Thread(target=run, name="yvolo-staging-cleanup", daemon=True)
+    t.start()
+    return t
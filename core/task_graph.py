@@ -0,0 +1,301 @@
+# C:\Users\Usuario\Desktop\proyectos\yvolo\core\task_graph.py
+from __future__ import annotations
+
+import heapq
+import re
+from typing import Dict, Iterable, List, Set
+
+from .roadmap import FIELD_CRITICA, FIELD_DEPENDENCIAS, FIELD_IMPLEMENTADA, Roadmap, status_key
+
+_DEP_RE = re.compile(r"(?i)tarea\s*(\d+)")
+
+
+def parse_dependencies(value: str) -> List[int]:
+    """
+    "Ninguna" -> []
+    "Tarea 1" -> [1]
+    "Tarea 1, Tarea 3" / "Tareas 1 y 3" -> [1, 3]
+    """
+    value = (value or "").strip()
+    if not value or status_key(value) == "ninguna":
+        return []
+    nums = [int(n) for n in _DEP_RE.findall(value)]
+    if not nums and value.lower().startswith("tarea"):
+        nums = [int(n) for n in re.findall(r"\d+", value)]
+    return sorted(set(nums))
+
+
+class TaskGraph:
+    """
+    Grafo de dependencias entre tareas de #Tareas (nodo = número de tarea).
+
+    Mantiene incrementalmente, por tarea, cuántas dependencias siguen sin
+    implementar, de modo que unblocked() no recorre el grafo.
+    Las referencias a tareas inexistentes no bloquean: se informan en
+    missing_references().
+    """
+
+    def __init__(self) -> None:
+        self._deps: Dict[int, Set[int]] = {}
+        # Inverso de _deps; incluye números que aún no existen como tarea
+        self._dependents: Dict[int, Set[int]] = {}
+        self._done: Dict[int, bool] = {}
+        self._critical: Dict[int, bool] = {}
+        self._missing: Dict[int, int] = {}
+        self._ready: Set[int] = set()
+
+    @classmethod
+    def from_roadmap(cls, roadmap: Roadmap) -> "TaskGraph":
+        graph = cls()
+        for t in roadmap.tasks:
+            graph.add_task(
+                t.number,
+                parse_dependencies(t.dependencias),
+                implemented=t.is_implemented,
+                critical=t.is_critical,
+            )
+        return graph
+
+    # ---------- consultas ----------
+
+    def __contains__(self, number: int) -> bool:
+        return number in self._deps
+
+    def __len__(self) -> int:
+        return len(self._deps)
+
+    def dependencies(self, number: int) -> List[int]:
+        return sorted(self._deps.get(number, ()))
+
+    def dependents(self, number: int) -> List[int]:
+        return sorted(d for d in self._dependents.get(number, ()) if d in self._deps)
+
+    def is_implemented(self, number: int) -> bool:
+        return self._done.get(number, False)
+
+    def unblocked(self) -> List[int]:
+        """Tareas sin implementar cuyas dependencias ya están implementadas."""
+        return sorted(self._ready)
+
+    def missing_references(self) -> Dict[int, List[int]]:
+        out: Dict[int, List[int]] = {}
+        for n, deps in self._deps.items():
+            unknown = [d for d in deps if d not in self._deps]
+            if unknown:
+                out[n] = sorted(unknown)
+        return out
+
+    def topological_order(self) -> List[int]:
+        """
+        Orden de ejecución (Kahn, desempate por número de tarea).
+        Las tareas que forman parte de un ciclo, o dependen de uno, no aparecen.
+        """
+        indegree = {n: sum(1 for d in deps if d in self._deps) for n, deps in self._deps.items()}
+        heap = [n for n, k in indegree.items() if k == 0]
+        heapq.heapify(heap)
+        order: List[int] = []
+        while heap:
+            n = heapq.heappop(heap)
+            order.append(n)
+            for m in self._dependents.get(n, ()):
+                if m in indegree:
+                    indegree[m] -= 1
+                    if indegree[m] == 0:
+                        heapq.heappush(heap, m)
+        return order
+
+    def cycles(self) -> List[List[int]]:
+        """Componentes fuertemente conexas con ciclo (Tarjan iterativo)."""
+        index: Dict[int, int] = {}
+        low: Dict[int, int] = {}
+        on_stack: Set[int] = set()
+        stack: List[int] = []
+        result: List[List[int]] = []
+        counter = 0
+
+        for root in sorted(self._deps):
+            if root in index:
+                continue
+            work = [(root, iter(sorted(self._deps[root])))]
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+
+            while work:
+                node, it = work[-1]
+                advanced = False
+                for dep in it:
+                    if dep not in self._deps:
+                        continue
+                    if dep not in index:
+                        index[dep] = low[dep] = counter
+                        counter += 1
+                        stack.append(dep)
+                        on_stack.add(dep)
+                        work.append((dep, iter(sorted(self._deps[dep]))))
+                        advanced = True
+                        break
+                    if dep in on_stack:
+                        low[node] = min(low[node], index[dep])
+                if advanced:
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == index[node]:
+                    comp: List[int] = []
+                    while True:
+                        m = stack.pop()
+                        on_stack.discard(m)
+                        comp.append(m)
+                        if m == node:
+                            break
+                    if len(comp) > 1 or node in self._deps[node]:
+                        result.append(sorted(comp))
+
+        return sorted(result)
+
+    def critical_path(self) -> List[int]:
+        """
+        Cadena más larga de tareas "Critica: Critica" sin implementar,
+        enlazadas por dependencias (en orden de ejecución).
+        """
+        best: Dict[int, int] = {}
+        prev: Dict[int, int] = {}
+        for n in self.topological_order():
+            if not self._critical.get(n) or self._done.get(n):
+                continue
+            best[n] = 1
+            for d in self._deps[n]:
+                if d in best and best[d] + 1 > best[n]:
+                    best[n] = best[d] + 1
+                    prev[n] = d
+
+        if not best:
+            return []
+        node = max(best, key=lambda k: (best[k], -k))
+        path = [node]
+        while node in prev:
+            node = prev[node]
+            path.append(node)
+        return path[::-1]
+
+    # ---------- edición incremental ----------
+
+    def _recount(self, number: int) -> None:
+        missing = sum(1 for d in self._deps[number] if d in self._deps and not self._done[d])
+        self._missing[number] = missing
+        if missing == 0 and not self._done[number]:
+            self._ready.add(number)
+        else:
+            self._ready.discard(number)
+
+    def _bump_dependents(self, number: int, delta: int) -> None:
+        for m in self._dependents.get(number, ()):
+            if m == number or m not in self._deps:
+                continue
+            self._missing[m] += delta
+            if self._missing[m] == 0 and not self._done[m]:
+                self._ready.add(m)
+            else:
+                self._ready.discard(m)
+
+    def add_task(
+        self,
+        number: int,
+        dependencies: Iterable[int] = (),
+        implemented: bool = False,
+        critical: bool = False,
+    ) -> None:
+        if number in self._deps:
+            self.remove_task(number)
+        deps = set(dependencies)
+        self._deps[number] = deps
+        self._done[number] = implemented
+        self._critical[number] = critical
+        for d in deps:
+            self._dependents.setdefault(d, set()).add(number)
+        self._recount(number)
+        if not implemented:
+            self._bump_dependents(number, +1)
+
+    def remove_task(self, number: int) -> None:
+        if number not in self._deps:
+            return
+        if not self._done[number]:
+            self._bump_dependents(number, -1)
+        for d in self._deps.pop(number):
+            self._dependents.get(d, set()).discard(number)
+        self._done.pop(number, None)
+        self._critical.pop(number, None)
+        self._missing.pop(number, None)
+        self._ready.discard(number)
+
+    def set_implemented(self, number: int, implemented: bool = True) -> None:
+        if number not in self._deps or self._done[number] == implemented:
+            return
+        self._done[number] = implemented
+        self._bump_dependents(number, -1 if implemented else +1)
+        self._recount(number)
+
+    def set_critical(self, number: int, critical: bool) -> None:
+        if number in self._deps:
+            self._critical[number] = critical
+
+    def set_dependencies(self, number: int, dependencies: Iterable[int]) -> None:
+        if number not in self._deps:
+            return
+        for d in self._deps[number]:
+            self._dependents.get(d, set()).discard(number)
+        self._deps[number] = set(dependencies)
+        for d in self._deps[number]:
+            self._dependents.setdefault(d, set()).add(number)
+        self._recount(number)
+
+    def apply_field(self, number: int, field: str, value: str) -> None:
+        """Refleja en el grafo una edición de campo de la hoja de ruta."""
+        if field == FIELD_IMPLEMENTADA:
+            self.set_implemented(number, status_key(value) == "implementada")
+        elif field == FIELD_CRITICA:
+            self.set_critical(number, status_key(value) in ("critica", "crítica"))
+        elif field == FIELD_DEPENDENCIAS:
+            self.set_dependencies(number, parse_dependencies(value))
+
+
+def format_triage(roadmap: Roadmap, graph: TaskGraph, limit: int = 10) -> str:
+    """Resumen en texto para la UI / CLI."""
+
+    def label(n: int) -> str:
+        t = roadmap.task(n)
+        desc = t.description if t is not None else ""
+        if len(desc) > 60:
+            desc = desc[:57] + "..."
+        return f"Tarea {n}: {desc}"
+
+    pending = sum(1 for n in range(1, len(roadmap.tasks) + 1) if not graph.is_implemented(n))
+    lines = [f"Tareas: {len(roadmap.tasks)} ({pending} sin implementar)"]
+
+    ready = graph.unblocked()
+    lines.append(f"Desbloqueadas ahora: {len(ready)}")
+    lines.extend(f"  - {label(n)}" for n in ready[:limit])
+    if len(ready) > limit:
+        lines.append(f"  ... y {len(ready) - limit} más")
+
+    path = graph.critical_path()
+    if path:
+        lines.append("Camino crítico: " + " -> ".join(str(n) for n in path))
+
+    cycles = graph.cycles()
+    if cycles:
+        lines.append("WARN ciclos: " + "; ".join(" -> ".join(str(n) for n in c) for c in cycles))
+
+    missing = graph.missing_references()
+    if missing:
+        lines.append(
+            "WARN dependencias inexistentes: "
+            + ", ".join(f"Tarea {n} -> {deps}" for n, deps in sorted(missing.items()))
+        )
+    return "\n".join(lines)
@@ -0,0 +1,184 @@
+# C:\Users\Usuario\Desktop\proyectos\yvolo\core\templates.py
+from __future__ import annotations
+
+import functools
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from .paths import is_frozen_exe, yvolo_root_file
+from .roadmap import SECTION_TASKS, ProjectInfo, format_entry, parse_roadmap
+
+PROMP_TEMPLATE = "promp_maestro.txt"
+HOJA_TEMPLATE = "hoja_de_ruta.txt"
+
+Signature = Tuple[int, int]
+
+
+class HojaTemplate:
+    """
+    Plantilla hoja_de_ruta.txt ya partida en #Tareas y #ProyectoInfo.
+    render() solo concatena: tareas nuevas + cuerpo fijo + ProyectoInfo sustituido.
+    """
+
+    __slots__ = ("head", "body", "info_header", "info_lines", "newline")
+
+    def __init__(self, template_text: str) -> None:
+        roadmap = parse_roadmap(template_text.replace("\r\n", "\n"))
+
+        section = roadmap.section(SECTION_TASKS)
+        if section is None:
+            raise ValueError("La plantilla hoja_de_ruta.txt no contiene #Tareas")
+
+        head: List[str] = [roadmap.head]
+        body: List[str] = []
+        seen_tasks = False
+        for s in roadmap.sections:
+            if s is section:
+                seen_tasks = True
+                head.append(s.header)
+                body.append(s.lead.lstrip("\n"))
+                body.extend(e.raw for e in s.entries)
+                body.append(s.trail)
+            elif seen_tasks:
+                body.extend(s.chunks())
+            else:
+                head.extend(s.chunks())
+
+        self.head = "".join(head)
+        self.body = "".join(body)
+        self.newline = roadmap.newline
+        if roadmap.info is not None:
+            self.info_header = roadmap.info.header
+            self.info_lines: Optional[List[str]] = roadmap.info.lines
+        else:
+            self.info_header = ""
+            self.info_lines = None
+
+    def render(self, project_name: str, repo_url: str, backup_value: str, tasks: List[str]) -> str:
+        tasks_block = "".join(
+            format_entry(t.strip(), newline=self.newline) for t in tasks if t and t.strip()
+        )
+
+        info = ""
+        if self.info_lines is not None:
+            block = ProjectInfo(self.info_header, list(self.info_lines))
+            block.set("repo_git", repo_url)
+            block.set("name_project", project_name)
+            block.set("backup", backup_value)
+            info = block.header + "".join(block.lines)
+
+        return self.head + tasks_block + self.body + info
+
+
+class TemplateCache:
+    """
+    Caché de plantillas para todo el proceso.
+
+    Clave: ruta + (mtime_ns, size). Un cambio en disco provoca recarga.
+    En el exe (PyInstaller) las plantillas de _MEIPASS no cambian, así que
+    tras la primera carga no se vuelve a hacer stat.
+    """
+
+    def __init__(self, verify: Optional[bool] = None) -> None:
+        self.verify = (not is_frozen_exe()) if verify is None else verify
+        self._lock = threading.Lock()
+        self._texts: Dict[str, Tuple[Signature, str]] = {}
+        self._hojas: Dict[str, Tuple[Signature, HojaTemplate]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _signature(path: str) -> Signature:
+        st = os.stat(path)
+        return st.st_mtime_ns, st.st_size
+
+    def _lookup(self, store: Dict, path: str):
+        entry = store.get(path)
+        if entry is None:
+            return None
+        if self.verify:
+            try:
+                if self._signature(path) != entry[0]:
+                    return None
+            except OSError:
+                return None
+        return entry[1]
+
+    def text(self, path: Union[str, Path]) -> str:
+        """Lanza FileNotFoundError si no existe."""
+        key = str(path)
+        with self._lock:
+            value = self._lookup(self._texts, key)
+            if value is not None:
+                self.hits += 1
+                return value
+
+            sig = self._signature(key)
+            with open(key, "r", encoding="utf-8") as f:
+                value = f.read()
+            self._texts[key] = (sig, value)
+            self.misses += 1
+            return value
+
+    def hoja(self, path: Union[str, Path]) -> HojaTemplate:
+        key = str(path)
+        with self._lock:
+            value = self._lookup(self._hojas, key)
+            if value is not None:
+                self.hits += 1
+                return value
+
+        text = self.text(key)
+        template = HojaTemplate(text)
+        with self._lock:
+            entry = self._texts.get(key)
+            if entry is not None:
+                self._hojas[key] = (entry[0], template)
+        return template
+
+    def invalidate(self, path: Union[str, Path, None] = None) -> None:
+        with self._lock:
+            if path is None:
+                self._texts.clear()
+                self._hojas.clear()
+                return
+            key = str(path)
+            self._texts.pop(key, None)
+            self._hojas.pop(key, None)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._texts)}
+
+
+TEMPLATE_CACHE = TemplateCache()
+
+
+@functools.lru_cache(maxsize=None)
+def _root_path(filename: str) -> str:
+    # app_dir() hace resolve() del módulo: resolver una sola vez
+    return str(yvolo_root_file(filename))
+
+
+def root_promp_path() -> Path:
+    return Path(_root_path(PROMP_TEMPLATE))
+
+
+def root_templates() -> Tuple[str, HojaTemplate]:
+    """
+    (promp_maestro, hoja_de_ruta) de la raíz de yvolo, desde la caché.
+    Lanza FileNotFoundError con el mensaje de usuario si falta alguna.
+    """
+    promp_path = _root_path(PROMP_TEMPLATE)
+    hoja_path = _root_path(HOJA_TEMPLATE)
+    try:
+        promp = TEMPLATE_CACHE.text(promp_path)
+    except FileNotFoundError:
+        raise FileNotFoundError("No existe promp_maestro.txt en raíz de yvolo.") from None
+    try:
+        hoja = TEMPLATE_CACHE.hoja(hoja_path)
+    except FileNotFoundError:
+        raise FileNotFoundError("No existe hoja_de_ruta.txt en raíz de yvolo.") from None
+    return promp, hoja
@@ -0,0 +1,201 @@
+# C:\Users\Usuario\Desktop\proyectos\yvolo\core\tracing.py
+from __future__ import annotations
+
+import atexit
+import json
+import math
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional
+
+from .paths import appdata_dir
+
+# Spans ligeros para saber en qué se va el tiempo al crear proyectos.
+#
+#   with span("git.init"):
+#       ...
+#
+# Desactivado (por defecto) span() devuelve siempre el mismo objeto vacío:
+# una comprobación de un bool por llamada.
+#
+# Se activa con --profile o con la variable YVOLO_PROFILE:
+#   YVOLO_PROFILE=1               traza en <appdata>/traces/trace_<fecha>.json
+#   YVOLO_PROFILE=C:\ruta\t.json  traza en esa ruta
+# La traza se abre en chrome://tracing o https://ui.perfetto.dev
+
+ENV_VAR = "YVOLO_PROFILE"
+
+# Un proceso largo (el demonio con --profile) no crece sin límite: se
+# conservan los últimos MAX_EVENTS spans (unos 50 MB como mucho)
+MAX_EVENTS = 100_000
+
+_enabled = False
+_lock = threading.Lock()
+_events: Deque[Dict[str, Any]] = deque(maxlen=MAX_EVENTS)
+_origin = time.perf_counter()
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+    def set(self, **args: Any) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("name", "args", "start")
+
+    def __init__(self, name: str, args: Dict[str, Any]) -> None:
+        self.name = name
+        self.args = args
+        self.start = 0.0
+
+    def __enter__(self) -> "_Span":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        end = time.perf_counter()
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        event = {
+            "name": self.name,
+            "cat": self.name.split(".", 1)[0],
+            "ph": "X",
+            "ts": (self.start - _origin) * 1e6,
+            "dur": (end - self.start) * 1e6,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+            "args": self.args,
+        }
+        with _lock:
+            _events.append(event)
+
+    def set(self, **args: Any) -> None:
+        """Añade datos al span (p.ej. el código de salida)."""
+        self.args.update(args)
+
+
+def enabled() -> bool:
+    return _enabled
+
+
+def enable() -> None:
+    global _enabled
+    _enabled = True
+
+
+def disable() -> None:
+    global _enabled
+    _enabled = False
+
+
+def span(name: str, **args: Any):
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name, args)
+
+
+def events() -> List[Dict[str, Any]]:
+    with _lock:
+        return list(_events)
+
+
+def reset() -> None:
+    with _lock:
+        _events.clear()
+
+
+# ---------- exportar ----------
+
+
+def default_trace_path() -> Path:
+    return appdata_dir() / "traces" / f"trace_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+
+
+def export_chrome_trace(path: Optional[Path] = None) -> Path:
+    """Formato Trace Event de Chrome (eventos "X" con duración)."""
+    path = Path(path) if path is not None else default_trace_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {"traceEvents": events(), "displayTimeUnit": "ms"}
+    with path.open("w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, default=str)
+    return path
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    # Rango más cercano: sin interpolar, el valor es una medición real
+    if not sorted_values:
+        return 0.0
+    k = math.ceil(pct / 100.0 * len(sorted_values)) - 1
+    return sorted_values[max(0, min(len(sorted_values) - 1, k))]
+
+
+def summary(evts: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Dict[str, float]]:
+    """
+    Por nombre de span: count, total, p50, p95 y max (milisegundos).
+    """
+    by_name: Dict[str, List[float]] = {}
+    for e in evts if evts is not None else events():
+        by_name.setdefault(e["name"], []).append(e["dur"] / 1000.0)
+
+    out: Dict[str, Dict[str, float]] = {}
+    for name, durations in by_name.items():
+        durations.sort()
+        out[name] = {
+            "count": len(durations),
+            "total": sum(durations),
+            "p50": _percentile(durations, 50),
+            "p95": _percentile(durations, 95),
+            "max": durations[-1],
+        }
+    return out
+
+
+def format_summary(stats: Optional[Dict[str, Dict[str, float]]] = None) -> str:
+    stats = stats if stats is not None else summary()
+    if not stats:
+        return "Sin spans registrados."
+    width = max(len(n) for n in stats)
+    lines = [f"{'span':<{width}}  {'n':>5}  {'total ms':>10}  {'p50':>9}  {'p95':>9}  {'max':>9}"]
+    for name, s in sorted(stats.items(), key=lambda kv: kv[1]["total"], reverse=True):
+        lines.append(
+            f"{name:<{width}}  {int(s['count']):>5}  {s['total']:>10.1f}  "
+            f"{s['p50']:>9.1f}  {s['p95']:>9.1f}  {s['max']:>9.1f}"
+        )
+    return "\n".join(lines)
+
+
+def configure_from_env() -> Optional[Path]:
+    """
+    Activa la traza si YVOLO_PROFILE está definida y la exporta al salir.
+    Devuelve la ruta de exportación (None si no está activa).
+    """
+    value = os.environ.get(ENV_VAR, "").strip()
+    if not value or value == "0":
+        return None
+    enable()
+    path = Path(value) if value.lower().endswith(".json") else default_trace_path()
+
+    def _export() -> None:
+        try:
+            export_chrome_trace(path)
+        except Exception:
+            # no romper la salida del proceso
+            pass
+
+    atexit.register(_export)
+    return path
@@ -0,0 +1,394 @@
+# C:\Users\Usuario\Desktop\proyectos\yvolo\core\watcher.py
+from __future__ import annotations
+
+import os
+import select
+import struct
+import sys
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+# Vigilancia de ficheros para mantener las cachés al día sin reiniciar.
+#
+# - Un hilo hace stat() por lotes de los ficheros vigilados. El intervalo se
+#   adapta: vuelve al mínimo tras un cambio y crece mientras no pasa nada.
+# - En Linux, si hay inotify (ctypes, sin dependencias), los cambios llegan
+#   al momento y solo se hace stat de los ficheros de la carpeta afectada; el
+#   sondeo queda como red de seguridad con el intervalo máximo.
+# - Los callbacks se llaman desde el hilo del watcher: la UI debe pasar por
+#   su cola de eventos (como con CONFIG.subscribe).
+
+CREATED = "created"
+MODIFIED = "modified"
+DELETED = "deleted"
+
+MIN_INTERVAL = 0.5
+MAX_INTERVAL = 5.0
+
+Signature = Optional[Tuple[int, int]]
+
+
+class ChangeEvent(NamedTuple):
+    path: Path
+    kind: str
+
+
+Callback = Callable[[ChangeEvent], None]
+
+
+def _signature(path: str) -> Signature:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+# ---------- inotify (Linux) ----------
+
+_IN_MODIFY = 0x002
+_IN_ATTRIB = 0x004
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_FROM = 0x040
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_IN_Q_OVERFLOW = 0x4000
+_WATCH_MASK = _IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+_EVENT = struct.Struct("iIII")
+
+
+class _Inotify:
+    """inotify mínimo por ctypes: una watch por carpeta con contador de uso."""
+
+    def __init__(self) -> None:
+        import ctypes
+        import ctypes.util
+
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1")
+        self.fd = fd
+        self._wd_by_dir: Dict[str, int] = {}
+        self._dir_by_wd: Dict[int, str] = {}
+        self._refs: Dict[str, int] = {}
+
+    def add(self, folder: str) -> None:
+        if folder in self._refs:
+            self._refs[folder] += 1
+            return
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(folder), _WATCH_MASK)
+        # Carpeta inexistente: la cubre el sondeo
+        self._refs[folder] = 1
+        if wd >= 0:
+            self._wd_by_dir[folder] = wd
+            self._dir_by_wd[wd] = folder
+
+    def remove(self, folder: str) -> None:
+        refs = self._refs.get(folder, 0) - 1
+        if refs > 0:
+            self._refs[folder] = refs
+            return
+        self._refs.pop(folder, None)
+        wd = self._wd_by_dir.pop(folder, None)
+        if wd is not None:
+            self._dir_by_wd.pop(wd, None)
+            self._libc.inotify_rm_watch(self.fd, wd)
+
+    def read(self) -> Optional[Set[str]]:
+        """Rutas tocadas (carpeta y carpeta/nombre). None = desbordamiento: revisar todo."""
+        touched: Set[str] = set()
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return touched
+            if not data:
+                return touched
+            pos = 0
+            while pos + _EVENT.size <= len(data):
+                wd, mask, _cookie, length = _EVENT.unpack_from(data, pos)
+                name = data[pos + _EVENT.size : pos + _EVENT.size + length].rstrip(b"\0")
+                pos += _EVENT.size + length
+                if mask & _IN_Q_OVERFLOW:
+                    return None
+                folder = self._dir_by_wd.get(wd)
+                if folder is None:
+                    continue
+                touched.add(folder)
+                if name:
+                    touched.add(os.path.join(folder, os.fsdecode(name)))
+
+    def close(self) -> None:
+        try:
+            os.close(self.fd)
+        except OSError:
+            pass
+
+
+def _open_inotify() -> Optional[_Inotify]:
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        return _Inotify()
+    except (OSError, AttributeError):
+        return None
+
+
+# ---------- watcher ----------
+
+
+class FileWatcher:
+    """
+    watch(ruta, callback) vigila un fichero o una carpeta (en una carpeta, el
+    cambio es su mtime: altas y bajas de entradas). Los eventos se comparan
+    por firma (mtime_ns, size), así que un aviso de inotify sin cambio real no
+    llega al callback.
+    """
+
+    def __init__(
+        self,
+        min_interval: float = MIN_INTERVAL,
+        max_interval: float = MAX_INTERVAL,
+        use_inotify: bool = True,
+    ) -> None:
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min_interval
+        self._use_inotify = use_inotify
+        self._inotify: Optional[_Inotify] = None
+        self._lock = threading.Lock()
+        self._watches: Dict[str, Tuple[Signature, List[Callback]]] = {}
+        self._pending: List[Callable[[], None]] = []
+        self._stop = threading.Event()
+        self._wake_r: Optional[int] = None
+        self._wake_w: Optional[int] = None
+        self._thread: Optional[threading.Thread] = None
+        self.polls = 0  # pasadas de stat completas (para tests)
+
+    @property
+    def native(self) -> bool:
+        return self._inotify is not None
+
+    # ---------- registro ----------
+
+    def _folders(self, key: str) -> List[str]:
+        folders = [os.path.dirname(key)]
+        if os.path.isdir(key):
+            folders.append(key)
+        return folders
+
+    def watch(self, path: Path, callback: Callback) -> None:
+        key = os.path.abspath(str(path))
+        with self._lock:
+            entry = self._watches.get(key)
+            if entry is not None:
+                entry[1].append(callback)
+                return
+            self._watches[key] = (_signature(key), [callback])
+            if self._inotify is not None:
+                for folder in self._folders(key):
+                    self._inotify.add(folder)
+
+    def unwatch(self, path: Path) -> None:
+        key = os.path.abspath(str(path))
+        with self._lock:
+            if self._watches.pop(key, None) is not None and self._inotify is not None:
+                for folder in self._folders(key):
+                    self._inotify.remove(folder)
+
+    def watched(self) -> List[Path]:
+        with self._lock:
+            return [Path(k) for k in self._watches]
+
+    def call_soon(self, fn: Callable[[], None]) -> None:
+        """Ejecuta fn en el hilo del watcher (antes de la siguiente pasada)."""
+        with self._lock:
+            self._pending.append(fn)
+        self._wake()
+
+    # ---------- comprobación ----------
+
+    def check(self, paths: Optional[Iterable[str]] = None) -> List[ChangeEvent]:
+        """
+        Compara firmas (todas o solo paths) y avisa de los cambios.
+        Se puede llamar a mano (tests, o sin hilo).
+        """
+        with self._lock:
+            keys = list(self._watches) if paths is None else [p for p in paths if p in self._watches]
+            current = [(k, self._watches[k][0]) for k in keys]
+
+        events: List[Tuple[ChangeEvent, List[Callback]]] = []
+        for key, old in current:
+            new = _signature(key)
+            if new == old:
+                continue
+            with self._lock:
+                entry = self._watches.get(key)
+                if entry is None:
+                    continue
+                self._watches[key] = (new, entry[1])
+                callbacks = list(entry[1])
+            kind = CREATED if old is None else DELETED if new is None else MODIFIED
+            events.append((ChangeEvent(Path(key), kind), callbacks))
+
+        for event, callbacks in events:
+            for cb in callbacks:
+                try:
+                    cb(event)
+                except Exception:
+                    # no romper flujo: un callback no para al watcher
+                    pass
+        return [e for e, _ in events]
+
+    def _run_pending(self) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, []
+        for fn in pending:
+            try:
+                fn()
+            except Exception:
+                pass
+
+    # ---------- hilo ----------
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        if self._use_inotify and self._inotify is None:
+            self._inotify = _open_inotify()
+            if self._inotify is not None:
+                with self._lock:
+                    for key in self._watches:
+                        for folder in self._folders(key):
+                            self._inotify.add(folder)
+        if self._inotify is not None:
+            self._wake_r, self._wake_w = os.pipe()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="yvolo-watcher", daemon=True)
+        self._thread.start()
+
+    def _wake(self) -> None:
+        if self._wake_w is not None:
+            try:
+                os.write(self._wake_w, b"x")
+            except OSError:
+                pass
+
+    def _wait(self, timeout: float) -> Optional[Set[str]]:
+        """
+        Espera cambios o timeout. Devuelve las rutas tocadas según inotify,
+        o None si toca una pasada completa de stat.
+        """
+        if self._inotify is None or self._wake_r is None:
+            self._stop.wait(timeout)
+            return None
+        ready, _, _ = select.select([self._inotify.fd, self._wake_r], [], [], timeout)
+        if self._wake_r in ready:
+            try:
+                os.read(self._wake_r, 1024)
+            except OSError:
+                pass
+        if self._inotify.fd in ready:
+            return self._inotify.read()
+        return set() if ready else None
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            self._run_pending()
+            touched = self._wait(self.max_interval if self.native else self.interval)
+            if self._stop.is_set():
+                break
+            self._run_pending()
+            if touched is None:
+                self.polls += 1
+                changed = self.check()
+            elif touched:
+                changed = self.check(touched)
+            else:
+                continue
+            if not self.native:
+                # Sondeo adaptativo: rápido tras un cambio, cada vez más lento sin ellos
+                self.interval = self.min_interval if changed else min(self.max_interval, self.interval * 2)
+
+    def stop(self, timeout: float = 2.0) -> None:
+        self._stop.set()
+        self._wake()
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join(timeout)
+        for fd in (self._wake_r, self._wake_w):
+            if fd is not None:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+        self._wake_r = self._wake_w = None
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+
+
+# ---------- estado de yvolo ----------
+
+
+def watch_app_state(watcher: FileWatcher, projects_base: Optional[Path] = None) -> None:
+    """
+    Conecta los ficheros de yvolo con sus cachés:
+        hoja_de_ruta.txt / promp_maestro.txt de la raíz -> plantillas y Abrir Chat
+        settings.json (candidatas)                       -> CONFIG (avisa a la UI)
+        Desktop\\proyectos y cada hoja de proyecto        -> catálogo de proyectos
+    Cada evento recarga solo lo afectado.
+    """
+    from .chat_bundle import CHAT_BUNDLES
+    from .config import CONFIG
+    from .paths import projects_base_dir, yvolo_root_file
+    from .project_catalog import HOJA_NAME, default_catalog
+    from .templates import HOJA_TEMPLATE, PROMP_TEMPLATE, TEMPLATE_CACHE
+
+    def on_root_file(event: ChangeEvent) -> None:
+        TEMPLATE_CACHE.invalidate(event.path)
+        CHAT_BUNDLES.invalidate()
+        # Dejar Abrir Chat listo otra vez
+        CHAT_BUNDLES.build()
+
+    for name in (HOJA_TEMPLATE, PROMP_TEMPLATE):
+        watcher.watch(yvolo_root_file(name), on_root_file)
+
+    def on_config(_event: ChangeEvent) -> None:
+        CONFIG.invalidate()
+        CONFIG.refresh()
+
+    for candidate in CONFIG.candidates:
+        watcher.watch(candidate, on_config)
+
+    base = Path(projects_base) if projects_base is not None else projects_base_dir()
+    catalog = default_catalog()
+    project_hojas: Set[Path] = set()
+
+    def on_project_hoja(event: ChangeEvent) -> None:
+        if event.kind != DELETED:
+            catalog.record(event.path.parent)
+
+    def sync_projects(_event: Optional[ChangeEvent] = None) -> None:
+        # Altas y bajas de proyectos: solo cambia el conjunto de hojas vigiladas
+        try:
+            current = {
+                Path(e.path) / HOJA_NAME
+                for e in os.scandir(base)
+                if not e.name.startswith(".") and e.is_dir(follow_symlinks=False)
+            }
+        except OSError:
+            current = set()
+        for hoja in current - project_hojas:
+            watcher.watch(hoja, on_project_hoja)
+        for hoja in project_hojas - current:
+            watcher.unwatch(hoja)
+        project_hojas.clear()
+        project_hojas.update(current)
+        catalog.refresh()
+
+    watcher.watch(base, sync_projects)
+    watcher.call_soon(sync_projects)
@@ -0,0 +1,9 @@
+from flask import Flask
+app = Flask(__name__)
+
+@app.get('/')
+def home():
+    return 'Hola'
+
+if __name__ == '__main__':
+    app.run(debug=True)
@@ -0,0 +1,150 @@
+import os
+import struct
+import tempfile
+import threading
+import unittest
+import zipfile
+from pathlib import Path
+from unittest.mock import patch
+
+from core.backup import (
+    BackupCancelled,
+    _append_compressed,
+    _compress_file,
+    atomic_zip,
+    backup_value,
+    create_backup,
+)
+from core.roadmap import load_roadmap
+from core.snapshots import BackupStore
+
+HOJA = (
+    "#Tareas\n"
+    "#Ideas\n"
+    "--------------------------------------------------\n"
+    "#ProyectoInfo\n"
+    "\n"
+    "repo_git:\n"
+    "name_project: demo\n"
+    "backup: Desktop\\backups\\backup_demo_1.zip\n"
+    "--------------------------------------------------\n"
+)
+
+
+class ProjectFixture:
+    """Proyecto de ejemplo con excluidos, binarios y una carpeta vacía."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        root = Path(self.tmp.name)
+        self.project = root / "demo"
+        self.dest = root / "backups"
+
+        (self.project / "src").mkdir(parents=True)
+        (self.project / "src" / "main.py").write_text("print('hola')\n" * 100, encoding="utf-8")
+        (self.project / "hoja_de_ruta.txt").write_text(HOJA, encoding="utf-8")
+        (self.project / "vacia").mkdir()
+        self.big = os.urandom(64 * 1024) * 5
+        (self.project / "datos.bin").write_bytes(self.big)
+        (self.project / "foto.png").write_bytes(b"png" * 1000)
+
+        for excluded in (".git", "__pycache__", "node_modules"):
+            (self.project / excluded).mkdir()
+            (self.project / excluded / "x").write_text("x", encoding="utf-8")
+        (self.project / "otro_env").mkdir()
+        (self.project / "otro_env" / "pyvenv.cfg").write_text("home = x\n", encoding="utf-8")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+
+class TestBackup(ProjectFixture, unittest.TestCase):
+    def test_zip_contents_and_roadmap_update(self):
+        result = create_backup(self.project, dest_dir=self.dest, workers=3, chunk_size=4096)
+
+        self.assertTrue(result.path.is_file())
+        self.assertEqual(list(self.dest.glob(".backup_*")), [])
+        with zipfile.ZipFile(result.path) as zf:
+            self.assertIsNone(zf.testzip())
+            names = set(zf.namelist())
+            self.assertEqual(
+                names,
+                {"datos.bin", "foto.png", "hoja_de_ruta.txt", "src/main.py", "vacia/"},
+            )
+            self.assertEqual(zf.read("datos.bin"), self.big)
+            self.assertEqual(zf.getinfo("foto.png").compress_type, zipfile.ZIP_STORED)
+            self.assertEqual(zf.getinfo("src/main.py").compress_type, zipfile.ZIP_DEFLATED)
+        self.assertEqual(result.files, 4)
+
+        roadmap = load_roadmap(self.project / "hoja_de_ruta.txt")
+        self.assertEqual(roadmap.info.backup, backup_value(result.path))
+
+    def test_cancel_leaves_nothing(self):
+        cancel = threading.Event()
+        cancel.set()
+        with self.assertRaises(BackupCancelled):
+            create_backup(self.project, dest_dir=self.dest, cancel_event=cancel)
+        self.assertEqual(list(self.dest.iterdir()), [])
+
+    def test_append_compressed_round_trip_with_zip64_headers(self):
+        # Límite rebajado: datos.bin (320 KiB) lleva cabeceras ZIP64
+        target = self.dest / "raw.zip"
+        for raw_append in (True, False):
+            with self.subTest(raw_append=raw_append), patch("core.backup._RAW_APPEND", raw_append), patch(
+                "zipfile.ZIP64_LIMIT", 64 * 1024
+            ):
+                with atomic_zip(target) as zf:
+                    for name in ("datos.bin", "foto.png", "src/main.py"):
+                        zinfo, spool = _compress_file(str(self.project / name), name, 6, 4096)
+                        with spool:
+                            _append_compressed(zf, zinfo, spool)
+
+                with zipfile.ZipFile(target) as zf:
+                    self.assertIsNone(zf.testzip())
+                    self.assertEqual(zf.read("datos.bin"), self.big)
+                    info = zf.getinfo("datos.bin")
+                    self.assertGreaterEqual(info.extract_version, zipfile.ZIP64_VERSION)
+                    self.assertLess(zf.getinfo("src/main.py").compress_size, zf.getinfo("src/main.py").file_size)
+                with target.open("rb") as f:
+                    f.seek(info.header_offset + 18)
+                    self.assertEqual(struct.unpack("<LL", f.read(8)), (0xFFFFFFFF, 0xFFFFFFFF))
+
+    def test_backup_value_relative_to_home(self):
+        path = Path.home() / "Desktop" / "backups" / "backup_demo_1.zip"
+        self.assertEqual(backup_value(path), "Desktop\\backups\\backup_demo_1.zip")
+
+
+class TestBackupStore(ProjectFixture, unittest.TestCase):
+    def test_second_snapshot_reuses_unchanged_files(self):
+        store = BackupStore(self.dest / "store")
+        first = store.snapshot(self.project, workers=2)
+        self.assertEqual(first.reused, 0)
+        self.assertEqual(first.files, 4)
+
+        (self.project / "src" / "main.py").write_text("print('adios')\n", encoding="utf-8")
+        second = store.snapshot(self.project, workers=2)
+        self.assertEqual(second.reused, 3)
+        self.assertEqual(second.new_objects, 1)
+        self.assertEqual(store.list_snapshots("demo"), [first.manifest, second.manifest])
+
+    def test_identical_content_is_stored_once(self):
+        store = BackupStore(self.dest / "store")
+        (self.project / "copia.bin").write_bytes(self.big)
+        result = store.snapshot(self.project)
+        self.assertEqual(result.files, 5)
+        self.assertEqual(result.new_objects, 4)
+
+    def test_export_matches_zip_format(self):
+        store = BackupStore(self.dest / "store")
+        result = store.snapshot(self.project)
+        zip_path = store.export_zip(result.manifest, dest_dir=self.dest)
+
+        self.assertRegex(zip_path.name, r"^backup_demo_\d{8}_\d{6}\.zip$")
+        with zipfile.ZipFile(zip_path) as zf:
+            self.assertIsNone(zf.testzip())
+            self.assertEqual(zf.read("datos.bin"), self.big)
+            self.assertIn("vacia/", zf.namelist())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from core.backup import create_backup
+from core.backup_catalog import KIND_SNAPSHOT, KIND_ZIP, BackupCatalog, RetentionPolicy, select_pruned
+from core.snapshots import BackupStore
+
+
+def _entry(created):
+    return {"kind": KIND_ZIP, "path": created.strftime("%Y%m%d_%H%M%S"), "created": created.strftime("%Y%m%d_%H%M%S")}
+
+
+class TestRetention(unittest.TestCase):
+    def test_keep_last_daily_weekly(self):
+        start = datetime(2026, 1, 1, 12, 0, 0)
+        # 3 backups por día durante 60 días
+        entries = [_entry(start + timedelta(days=d, hours=h)) for d in range(60) for h in (0, 1, 2)]
+        policy = RetentionPolicy(keep_last=2, keep_daily=5, keep_weekly=3)
+
+        pruned = {e["path"] for e in select_pruned(entries, policy)}
+        kept = [e for e in entries if e["path"] not in pruned]
+
+        newest = sorted(entries, key=lambda e: e["created"])[-1]
+        self.assertIn(newest, kept)
+        # 2 últimos (mismo día) + 4 días más + semanas anteriores al último día
+        self.assertEqual(len(kept), 2 + 4 + 2)
+        self.assertEqual(len(pruned) + len(kept), len(entries))
+
+    def test_zero_policy_prunes_everything(self):
+        entries = [_entry(datetime(2026, 1, d)) for d in range(1, 4)]
+        self.assertEqual(len(select_pruned(entries, RetentionPolicy(0, 0, 0))), 3)
+
+
+class TestBackupCatalog(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        root = Path(self.tmp.name)
+        self.project = root / "demo"
+        self.project.mkdir()
+        (self.project / "a.txt").write_text("hola\n", encoding="utf-8")
+        self.dest = root / "backups"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_backups_are_registered_and_latest_is_tracked(self):
+        result = create_backup(self.project, dest_dir=self.dest)
+        snap = BackupStore(self.dest / "store").snapshot(self.project)
+
+        catalog = BackupCatalog(self.dest)
+        entries = catalog.entries("demo")
+        self.assertEqual([e["kind"] for e in entries], [KIND_ZIP, KIND_SNAPSHOT])
+        self.assertEqual(entries[0]["path"], str(result.path))
+        self.assertEqual(len(entries[0]["checksum"]), 64)
+        self.assertEqual(catalog.latest("demo")["path"], str(snap.manifest))
+        self.assertEqual(catalog.latest("demo", KIND_ZIP)["path"], str(result.path))
+        self.assertIsNone(catalog.latest("otro"))
+
+    def test_prune_removes_files_and_unreferenced_objects(self):
+        store = BackupStore(self.dest / "store")
+        first = store.snapshot(self.project)
+        (self.project / "a.txt").write_text("adios\n", encoding="utf-8")
+        store.snapshot(self.project)
+
+        catalog = BackupCatalog(self.dest)
+        # dos snapshots en el mismo segundo: fechar el primero antes
+        catalog.add("demo", KIND_SNAPSHOT, first.manifest, datetime(2020, 1, 1), first.bytes_in)
+
+        removed = catalog.prune(RetentionPolicy(keep_last=1, keep_daily=0, keep_weekly=0))
+        self.assertEqual([e["path"] for e in removed], [str(first.manifest)])
+        self.assertFalse(first.manifest.exists())
+        self.assertEqual(len(catalog.entries("demo")), 1)
+        # El objeto de "hola" ya no lo referencia nadie (pero es reciente: gracia)
+        self.assertEqual(store.collect_garbage(grace=0), 1)
+
+    def test_rebuild_indexes_existing_zips(self):
+        self.dest.mkdir()
+        (self.dest / "backup_demo_20260101_101010.zip").write_bytes(b"PK")
+        (self.dest / "otra_cosa.zip").write_bytes(b"PK")
+        catalog = BackupCatalog(self.dest)
+        self.assertEqual(catalog.rebuild(), 1)
+        self.assertEqual(catalog.latest("demo")["created"], "20260101_101010")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from core.batch import BatchEntry, check_collisions, load_manifest, run_batch
+
+
+class TestBatchManifest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.base = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_load_json_manifest(self):
+        path = self.base / "m.json"
+        path.write_text(
+            json.dumps(
+                {"projects": [{"name": "uno", "type": "Python", "tasks": ["a", " ", "b"]}, {"name": "dos"}]}
+            ),
+            encoding="utf-8",
+        )
+        entries = load_manifest(path)
+        self.assertEqual(len(entries), 2)
+        self.assertEqual(entries[0].project_type, "Python")
+        self.assertEqual(entries[0].tasks, ["a", "b"])
+        self.assertEqual(entries[1].project_type, "Vacío")
+        self.assertFalse(entries[1].open_vscode)
+
+    def test_load_csv_manifest(self):
+        path = self.base / "m.csv"
+        path.write_text("name,type,tasks\nuno,Flask,t1|t2\n", encoding="utf-8")
+        entries = load_manifest(path)
+        self.assertEqual(entries, [BatchEntry("uno", "Flask", ["t1", "t2"], False)])
+
+    def test_collisions_detected_before_start(self):
+        (self.base / "existe").mkdir()
+        entries = [
+            BatchEntry("nuevo", "Vacío", [], False),
+            BatchEntry("Nuevo", "Vacío", [], False),
+            BatchEntry("existe", "Vacío", [], False),
+            BatchEntry("***", "Vacío", [], False),
+        ]
+        errors = check_collisions(entries, base=self.base)
+        self.assertEqual(len(errors), 3)
+
+    def test_unindexed_folder_collides_with_default_catalog(self):
+        # appdata vacío: el catálogo aún no conoce la carpeta existente
+        env = {"HOME": str(self.base), "USERPROFILE": str(self.base), "APPDATA": str(self.base / "AppData")}
+        with patch.dict(os.environ, env):
+            (self.base / "Desktop" / "proyectos" / "existente").mkdir(parents=True)
+            errors = check_collisions([BatchEntry("existente", "Vacío", [], False)])
+        self.assertEqual(len(errors), 1)
+        self.assertIn("ya existe", errors[0])
+
+    def test_run_batch_creates_all(self):
+        entries = [BatchEntry(f"p{i}", "Python", ["t"], False) for i in range(4)]
+        with patch("core.project_creator.projects_base_dir", return_value=self.base), patch(
+            "core.project_creator.git_try_create_remote_with_gh", return_value=""
+        ), patch.dict(os.environ, {"APPDATA": str(self.base / "AppData")}):
+            results, total = run_batch(entries, workers=2)
+
+        self.assertTrue(all(r.ok for r in results), [r.message for r in results])
+        self.assertEqual([r.name for r in results], [e.name for e in entries])
+        for e in entries:
+            self.assertTrue(os.path.isfile(self.base / e.name / "hoja_de_ruta.txt"))
+        self.assertGreaterEqual(total, 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+import unittest
+
+from benchmarks.bench_core import compare
+from benchmarks.generators import project_names, roadmap_text
+from core.roadmap import parse_roadmap
+
+
+class TestGenerators(unittest.TestCase):
+    def test_roadmap_is_deterministic_and_parses(self):
+        text = roadmap_text(200, n_ideas=10)
+        self.assertEqual(text, roadmap_text(200, n_ideas=10))
+        roadmap = parse_roadmap(text)
+        self.assertEqual(len(roadmap.tasks), 200)
+        self.assertEqual(len(roadmap.ideas), 10)
+        self.assertEqual(roadmap.serialize(), text)
+
+    def test_project_names_are_unique(self):
+        names = project_names(500)
+        self.assertEqual(len(set(names)), 500)
+
+
+class TestCompare(unittest.TestCase):
+    def test_threshold_and_noise_floor(self):
+        baseline = {"parse_roadmap[10k]": 0.100, "format_tasks[10k]": 0.001, "nueva": 1.0}
+        results = {"parse_roadmap[10k]": 0.140, "format_tasks[10k]": 0.0025, "sin_baseline": 5.0}
+        regressions = compare(results, baseline, threshold=0.25)
+        self.assertEqual(len(regressions), 1)
+        self.assertIn("parse_roadmap[10k]", regressions[0])
+
+    def test_per_benchmark_tolerance(self):
+        self.assertEqual(compare({"run_batch[50]": 0.35}, {"run_batch[50]": 0.2}, threshold=0.25), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
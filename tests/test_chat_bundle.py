@@ -0,0 +1,97 @@
+import os
+import tempfile
+import unittest
+import zipfile
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+from core.backup_catalog import KIND_ZIP, register_backup
+from core.chat_bundle import ChatBundleBuilder, powershell_filedrop_command
+
+HOJA = (
+    "#Tareas\n"
+    "#Ideas\n"
+    "--------------------------------------------------\n"
+    "#ProyectoInfo\n"
+    "\n"
+    "repo_git:\n"
+    "name_project: demo\n"
+    "backup: {backup}\n"
+    "--------------------------------------------------\n"
+)
+
+
+class TestChatBundle(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.home = self.root / "home"
+        backups = self.home / "Desktop" / "backups"
+        backups.mkdir(parents=True)
+        self.backup = backups / "backup_demo_20260101_101010.zip"
+        self.backup.write_bytes(b"PK-fake")
+
+        self.hoja = self.root / "hoja_de_ruta.txt"
+        self.promp = self.root / "promp_maestro.txt"
+        self.hoja.write_text(HOJA.format(backup="Desktop\\backups\\" + self.backup.name), encoding="utf-8")
+        self.promp.write_text("promp", encoding="utf-8")
+
+        self.home_patch = patch("core.chat_bundle.Path.home", return_value=self.home)
+        self.home_patch.start()
+        self.builder = ChatBundleBuilder(self.root / "bundles")
+
+    def tearDown(self):
+        self.home_patch.stop()
+        self.tmp.cleanup()
+
+    def test_includes_backup_and_is_cached(self):
+        bundle = self.builder.build(self.hoja, self.promp)
+        self.assertEqual(bundle.files, [self.hoja, self.promp, self.backup])
+        self.assertEqual(bundle.backup, self.backup)
+        self.assertIn(str(self.backup), bundle.command)
+
+        self.assertIs(self.builder.build(self.hoja, self.promp), bundle)
+        self.assertEqual(self.builder.builds, 1)
+
+    def test_rebuilds_only_when_content_changes(self):
+        first = self.builder.build(self.hoja, self.promp)
+        # Mismo contenido, otra fecha: mismo paquete
+        st = os.stat(self.promp)
+        os.utime(self.promp, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        self.assertEqual(self.builder.build(self.hoja, self.promp).key, first.key)
+        self.assertEqual(self.builder.builds, 1)
+
+        self.promp.write_text("promp nuevo", encoding="utf-8")
+        second = self.builder.build(self.hoja, self.promp)
+        self.assertNotEqual(second.key, first.key)
+        self.assertEqual(self.builder.builds, 2)
+
+    def test_new_catalog_backup_is_picked_up(self):
+        # El zip de backup: ya no existe: se usa el último del catálogo
+        self.backup.unlink()
+        self.assertIsNone(self.builder.build(self.hoja, self.promp).backup)
+
+        newer = self.backup.with_name("backup_demo_20260202_101010.zip")
+        newer.write_bytes(b"PK-nuevo")
+        register_backup(newer.parent, "demo", KIND_ZIP, newer, datetime(2026, 2, 2, 10, 10, 10), 8)
+        self.assertEqual(self.builder.build(self.hoja, self.promp).backup, newer)
+
+    def test_archive_replaces_previous(self):
+        first = self.builder.build(self.hoja, self.promp, archive=True)
+        with zipfile.ZipFile(first.archive) as zf:
+            self.assertEqual(sorted(zf.namelist()), sorted(p.name for p in first.files))
+
+        self.promp.write_text("otro", encoding="utf-8")
+        second = self.builder.build(self.hoja, self.promp, archive=True)
+        self.assertTrue(second.archive.is_file())
+        self.assertFalse(first.archive.exists())
+
+    def test_powershell_quoting(self):
+        cmd = powershell_filedrop_command([Path('C:\\a$b\\"x".txt')])
+        self.assertIn('$files.Add("C:\\a`$b\\`"x`".txt");', cmd)
+        self.assertTrue(cmd.endswith("SetFileDropList($files);"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+class TestCliStartup(unittest.TestCase):
+    def test_cli_import_does_not_load_ui(self):
+        probe = (
+            "import sys, ui_main\n"
+            "loaded = [m for m in sys.modules if m == 'tkinter' or m.startswith(('ui.', 'core.'))]\n"
+            "print(','.join(sorted(loaded)))\n"
+        )
+        out = subprocess.run([sys.executable, "-c", probe], cwd=ROOT, capture_output=True, text=True, check=True)
+        self.assertEqual(out.stdout.strip(), "")
+
+    def test_remote_status_runs_without_tk(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        env = dict(os.environ, APPDATA=tmp.name)
+        probe = (
+            "import sys, runpy\n"
+            "sys.argv = ['ui_main.py', '--remote-status']\n"
+            "try:\n"
+            "    runpy.run_path('ui_main.py', run_name='__main__')\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print('tkinter' in sys.modules)\n"
+        )
+        out = subprocess.run([sys.executable, "-c", probe], cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+        self.assertTrue(out.stdout.strip().endswith("False"), out.stdout)
+
+
+if __name__ == "__main__":
+    unittest.main()
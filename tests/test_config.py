@@ -1,6 +1,10 @@
 import unittest
 import os
 import json
+import tempfile
+from pathlib import Path
+
+from core.config import DEFAULT_CONFIG, ConfigService
 
 class TestConfigSettings(unittest.TestCase):
     def setUp(self):
@@ -18,5 +22,45 @@ class TestConfigSettings(unittest.TestCase):
         self.assertIn('version', data)
         self.assertIn('features', data)
 
+class TestConfigService(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.first = Path(self.tmp.name) / "a.json"
+        self.second = Path(self.tmp.name) / "b.json"
+        self.service = ConfigService([self.first, self.second])
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _write(self, path, data):
+        path.write_text(json.dumps(data), encoding="utf-8")
+
+    def test_source_and_skipped_reasons(self):
+        self.first.write_text("{no json", encoding="utf-8")
+        self._write(self.second, {"app_name": "otro"})
+        cfg = self.service.get()
+        self.assertEqual(cfg["app_name"], "otro")
+        self.assertEqual(cfg["labels"], DEFAULT_CONFIG["labels"])
+        self.assertEqual(self.service.source, self.second)
+        self.assertEqual(self.service.skipped[0][0], self.first)
+        self.assertIn("inválido", self.service.skipped[0][1])
+
+    def test_fallback_to_defaults(self):
+        self.assertEqual(self.service.get(), DEFAULT_CONFIG)
+        self.assertIsNone(self.service.source)
+
+    def test_cached_until_file_changes_and_notifies(self):
+        self._write(self.first, {"app_name": "uno"})
+        seen = []
+        self.service.subscribe(lambda data: seen.append(data["app_name"]))
+        self.assertEqual(self.service.get()["app_name"], "uno")
+        self.assertFalse(self.service.refresh())
+
+        self._write(self.first, {"app_name": "dos, más largo"})
+        self.assertTrue(self.service.refresh())
+        self.assertEqual(self.service.get()["app_name"], "dos, más largo")
+        self.assertEqual(seen, ["uno", "dos, más largo"])
+
+
 if __name__ == "__main__":
     unittest.main()
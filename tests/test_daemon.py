@@ -0,0 +1,132 @@
+import argparse
+import io
+import os
+import tempfile
+import threading
+import unittest
+import uuid
+from pathlib import Path
+from unittest.mock import patch
+
+import ui_main
+from core import daemon
+from core.remote_queue import RemoteQueue
+from core.templates import TEMPLATE_CACHE
+
+
+class TestDaemon(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        home = Path(self.tmp.name)
+        self.base = home / "Desktop" / "proyectos"
+        self.base.mkdir(parents=True)
+        env = {
+            "HOME": str(home),
+            "USERPROFILE": str(home),
+            "APPDATA": str(home / "AppData"),
+            # Tubería propia en Windows
+            "USERNAME": f"test-{uuid.uuid4().hex[:8]}",
+        }
+        self._patches = [
+            patch.dict(os.environ, env),
+            patch("core.project_creator.git_try_create_remote_with_gh", return_value=""),
+            patch("core.remote_queue.gh_auth_ok", return_value=False),
+            patch("core.git_utils.gh_auth_ok", return_value=False),
+        ]
+        for p in self._patches:
+            p.start()
+        self.server = None
+
+    def tearDown(self):
+        if self.server is not None:
+            self.server.stop()
+            self.thread.join(5)
+        for p in self._patches:
+            p.stop()
+        self.tmp.cleanup()
+
+    def _start(self):
+        queue = RemoteQueue(path=Path(self.tmp.name) / "remote_queue.json")
+        self.server = daemon.DaemonServer(remote_queue=queue, watch=False)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.assertTrue(self.server.ready.wait(10))
+
+    def test_absent_daemon_falls_back(self):
+        self.assertIsNone(daemon.forward("ping"))
+        self.assertFalse(daemon.is_running())
+
+    def test_commands_are_forwarded(self):
+        TEMPLATE_CACHE.invalidate()
+        self._start()
+        # warm() ya dejó promp_maestro.txt y hoja_de_ruta.txt en la caché
+        self.assertEqual(TEMPLATE_CACHE.stats()["entries"], 2)
+        info = daemon.forward("ping")
+        self.assertEqual(info["pid"], os.getpid())
+
+        reply = daemon.forward("create", project_name="demo", project_type="Python", open_vscode=False, tasks=["uno"])
+        self.assertTrue(reply["ok"], reply["msg"])
+        self.assertTrue((self.base / "demo" / "hoja_de_ruta.txt").is_file())
+        self.assertIn("demo", daemon.forward("projects"))
+
+        with self.assertRaises(daemon.DaemonError):
+            daemon.forward("no_existe")
+        self.assertEqual(daemon.forward("ping")["requests"], 4)
+
+    def test_second_daemon_refuses_and_shutdown(self):
+        self._start()
+        with self.assertRaises(daemon.DaemonRunning):
+            daemon.DaemonServer(watch=False).serve_forever()
+
+        self.assertTrue(daemon.forward("shutdown"))
+        self.thread.join(5)
+        self.assertFalse(self.thread.is_alive())
+        self.assertIsNone(daemon.forward("ping"))
+
+    def test_protocol_mismatch_is_treated_as_absent(self):
+        self._start()
+        conn = daemon.connect()
+        try:
+            conn.send(("call", daemon.PROTOCOL + 1, "ping", {}))
+            self.assertEqual(conn.recv()[0], "protocol")
+        finally:
+            conn.close()
+
+    def test_lost_connection_after_send_is_not_retried_locally(self):
+        class Conn:
+            def __init__(self, send_error=None):
+                self.send_error = send_error
+                self.sent = []
+
+            def send(self, obj):
+                if self.send_error:
+                    raise self.send_error
+                self.sent.append(obj)
+
+            def recv(self):
+                raise EOFError("cerrada")
+
+            def close(self):
+                pass
+
+        # No llegó a enviarse: se ejecuta en este proceso
+        with patch("core.daemon.connect", return_value=Conn(BrokenPipeError())):
+            self.assertIsNone(daemon.forward("create", project_name="demo"))
+
+        # Enviado y sin respuesta: el demonio pudo crearlo ya
+        conn = Conn()
+        with patch("core.daemon.connect", return_value=conn):
+            with self.assertRaises(daemon.DaemonError):
+                daemon.forward("create", project_name="demo")
+        self.assertEqual(conn.sent[0][2], "create")
+
+        args = argparse.Namespace(no_daemon=False)
+        with patch("core.daemon.connect", return_value=Conn()), patch("sys.stderr", new_callable=io.StringIO) as err:
+            with self.assertRaises(SystemExit) as cm:
+                ui_main.forward_to_daemon(args, "create", project_name="demo")
+        self.assertEqual(cm.exception.code, 1)
+        self.assertIn("no se repite", err.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import os
+import stat
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from core import git_utils
+from core.git_meta import parse_git_config, read_origin
+
+
+class TestGitMeta(unittest.TestCase):
+    def test_parse_git_config(self):
+        cfg = parse_git_config(
+            '[core]\n\tbare = false\n[remote "origin"]\n\turl = "https://x/y.git" ; comentario\n'
+            '\tfetch = +refs/heads/*:refs/remotes/origin/*\n[branch "main"]\n\tremote = origin\n'
+        )
+        self.assertEqual(cfg["remote.origin"]["url"], "https://x/y.git")
+        self.assertEqual(cfg["branch.main"]["remote"], "origin")
+        self.assertEqual(cfg["core"]["bare"], "false")
+
+    def test_read_origin_matches_git(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            subprocess.run(["git", "init", "-q"], cwd=tmp, check=True)
+            self.assertEqual(read_origin(tmp), "")
+            subprocess.run(
+                ["git", "remote", "add", "origin", "https://example.invalid/demo.git"],
+                cwd=tmp,
+                check=True,
+            )
+            self.assertEqual(read_origin(tmp), "https://example.invalid/demo.git")
+            self.assertEqual(git_utils.git_get_origin(tmp), "https://example.invalid/demo.git")
+
+    @unittest.skipUnless(os.name == "posix", "gh falso como script sh")
+    def test_gh_auth_status_is_cached(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            counter = Path(tmp) / "calls"
+            gh = Path(tmp) / "gh"
+            gh.write_text(f"#!/bin/sh\necho x >> '{counter}'\nexit 0\n", encoding="utf-8")
+            gh.chmod(gh.stat().st_mode | stat.S_IEXEC)
+
+            env_path = tmp + os.pathsep + os.environ.get("PATH", "")
+            with patch.dict(os.environ, {"PATH": env_path}):
+                git_utils.gh_auth_invalidate()
+                try:
+                    self.assertTrue(git_utils.gh_auth_ok())
+                    self.assertTrue(git_utils.gh_auth_ok())
+                finally:
+                    git_utils.gh_auth_invalidate()
+
+            self.assertEqual(counter.read_text().count("x"), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
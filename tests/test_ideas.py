@@ -0,0 +1,103 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from core.ideas import format_report, idea_to_task, is_ready, process_all_ideas, promote_ready_ideas
+from core.roadmap import parse_roadmap
+
+SAMPLE = (
+    "#Tareas\n"
+    "- Descripción: Primera\n"
+    "  Critica: Critica\n"
+    "  Implementada: Implementada\n"
+    "  Dependencias: Ninguna\n"
+    "\n"
+    "#Ideas\n"
+    "- Descripción: Exportar a CSV\n"
+    "  - con cabecera\n"
+    "  Critica: Critica\n"
+    "  Dependencias: Tarea 1\n"
+    "  Lista: Sí\n"
+    "- Idea suelta sin terminar\n"
+    "- Modo oscuro\n"
+    "  Lista: si\n"
+    "--------------------------------------------------\n"
+    "#ProyectoInfo\n"
+    "\n"
+    "repo_git: \n"
+    "name_project: demo\n"
+    "backup: \n"
+    "--------------------------------------------------\n"
+)
+
+
+class TestPromoteIdeas(unittest.TestCase):
+    def test_ready_ideas_become_tasks(self):
+        roadmap = parse_roadmap(SAMPLE)
+        self.assertEqual([is_ready(e) for e in roadmap.ideas], [True, False, True])
+
+        promoted = promote_ready_ideas(roadmap)
+        self.assertEqual(promoted, ["Exportar a CSV", "Modo oscuro"])
+
+        again = parse_roadmap(roadmap.serialize())
+        self.assertEqual([t.number for t in again.tasks], [1, 2, 3])
+        self.assertEqual([i.description for i in again.ideas], ["Idea suelta sin terminar"])
+        csv = again.task(2)
+        self.assertEqual((csv.critica, csv.implementada, csv.dependencias), ("Critica", "No implementada", "Tarea 1"))
+        self.assertIn("  - con cabecera\n", csv.raw)
+        self.assertNotIn("Lista:", again.serialize())
+        self.assertEqual(again.task(3).raw, idea_to_task(parse_roadmap(SAMPLE).ideas[2]))
+        self.assertEqual(again.info.name_project, "demo")
+
+    def test_crlf_kept(self):
+        roadmap = parse_roadmap(SAMPLE.replace("\n", "\r\n"))
+        promote_ready_ideas(roadmap)
+        text = roadmap.serialize()
+        self.assertNotIn("\n", text.replace("\r\n", ""))
+
+
+class TestProcessAllIdeas(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.base = Path(self.tmp.name)
+        for i in range(4):
+            folder = self.base / f"p{i}"
+            folder.mkdir()
+            text = SAMPLE if i % 2 == 0 else SAMPLE.replace("Lista:", "Pendiente:")
+            (folder / "hoja_de_ruta.txt").write_text(text, encoding="utf-8")
+        (self.base / "roto").mkdir()
+        (self.base / "roto" / "hoja_de_ruta.txt").write_bytes(b"#Ideas\n- x\n  Lista: S\xed\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _check(self, report):
+        self.assertEqual(report.scanned, 5)
+        self.assertEqual(report.promoted, 4)
+        self.assertEqual([r.project for r in report.errors], ["roto"])
+        for i in (0, 2):
+            roadmap = parse_roadmap((self.base / f"p{i}" / "hoja_de_ruta.txt").read_text(encoding="utf-8"))
+            self.assertEqual(len(roadmap.tasks), 3)
+        untouched = (self.base / "p1" / "hoja_de_ruta.txt").read_text(encoding="utf-8")
+        self.assertEqual(untouched, SAMPLE.replace("Lista:", "Pendiente:"))
+
+    def test_inline(self):
+        seen = []
+        report = process_all_ideas(self.base, progress=lambda done, total, r: seen.append((done, total)))
+        self._check(report)
+        # Solo se procesan las hojas que mencionan "Lista:"
+        self.assertEqual(seen, [(1, 3), (2, 3), (3, 3)])
+        self.assertEqual(report.workers, 1)
+        self.assertIn("4 idea(s)", format_report(report))
+
+        second = process_all_ideas(self.base)
+        self.assertEqual(second.promoted, 0)
+
+    def test_process_pool(self):
+        report = process_all_ideas(self.base, workers=2, pool_min=0)
+        self.assertEqual(report.workers, 2)
+        self._check(report)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from core.batch import BatchEntry, check_collisions
+from core.project_catalog import ProjectCatalog
+from core.roadmap import format_entry
+
+INFO = "#ProyectoInfo\n\nrepo_git: https://example.com/{name}.git\nname_project: {name}\nbackup:\n"
+
+
+def _hoja(name: str, done: int, pending: int) -> str:
+    tasks = [format_entry(f"hecha {i}", implementada="Implementada") for i in range(done)]
+    tasks += [format_entry(f"pendiente {i}", critica="Critica") for i in range(pending)]
+    return "#Tareas\n" + "".join(tasks) + "#Ideas\n" + format_entry("idea") + INFO.format(name=name)
+
+
+class TestProjectCatalog(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        root = Path(self.tmp.name)
+        self.base = root / "proyectos"
+        for i in range(5):
+            self._write(f"p{i}", done=i, pending=1)
+        (self.base / ".yvolo_staging" / "p9.1.abc").mkdir(parents=True)
+        (self.base / "web").mkdir()
+        (self.base / "web" / "app.py").write_text("app", encoding="utf-8")
+        self.catalog = ProjectCatalog(root / "projects.sqlite3", base=self.base)
+
+    def tearDown(self):
+        self.catalog.close()
+        self.tmp.cleanup()
+
+    def _write(self, name: str, done: int, pending: int) -> None:
+        folder = self.base / name
+        folder.mkdir(parents=True, exist_ok=True)
+        (folder / "hoja_de_ruta.txt").write_text(_hoja(name, done, pending), encoding="utf-8")
+
+    def test_incremental_refresh(self):
+        stats = self.catalog.refresh()
+        self.assertEqual(stats["added"], 6)
+        self.assertEqual(self.catalog.parsed, 5)
+
+        p3 = self.catalog.get("P3")
+        self.assertEqual((p3.tasks_total, p3.tasks_done, p3.tasks_critical_open, p3.ideas), (4, 3, 1, 1))
+        self.assertEqual(p3.repo_git, "https://example.com/p3.git")
+        self.assertEqual(self.catalog.get("web").type, "Flask")
+
+        # Sin cambios no se relee nada
+        self.assertEqual(self.catalog.refresh()["unchanged"], 6)
+        self.assertEqual(self.catalog.parsed, 5)
+
+        self._write("p1", done=1, pending=5)
+        shutil.rmtree(self.base / "p4")
+        stats = self.catalog.refresh()
+        self.assertEqual((stats["updated"], stats["removed"]), (1, 1))
+        self.assertEqual(self.catalog.parsed, 6)
+        self.assertEqual(self.catalog.get("p1").tasks_total, 6)
+        self.assertIsNone(self.catalog.get("p4"))
+        self.assertEqual(self.catalog.totals()["projects"], 5)
+
+    def test_recorded_type_survives_refresh(self):
+        self.catalog.record(self.base / "p0", "Python")
+        self.catalog.refresh()
+        self.assertEqual(self.catalog.get("p0").type, "Python")
+
+    def test_collisions_are_index_lookups(self):
+        self.catalog.refresh()
+        shutil.rmtree(self.base / "p2")  # borrado a mano: fila obsoleta
+        entries = [BatchEntry(n, "Vacío", [], False) for n in ("P1", "p2", "nuevo")]
+
+        errors = check_collisions(entries, catalog=self.catalog)
+
+        self.assertEqual(len(errors), 1)
+        self.assertIn("Entrada 1", errors[0])
+        self.assertIsNone(self.catalog.get("p2"))
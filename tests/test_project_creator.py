@@ -0,0 +1,167 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from core.project_creator import STAGES, create_new_project
+from core.staging import LOCK_GRACE, ProjectLock, ProjectLocked, cleanup_stale, staging_root
+from core.templates import TemplateCache
+
+
+class TestCreateNewProject(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.base = Path(self.tmp.name)
+        self._patches = [
+            patch("core.project_creator.projects_base_dir", return_value=self.base),
+            patch("core.project_creator.git_try_create_remote_with_gh", return_value=""),
+            patch.dict(os.environ, {"APPDATA": str(self.base / "AppData")}),
+        ]
+        for p in self._patches:
+            p.start()
+
+    def tearDown(self):
+        for p in self._patches:
+            p.stop()
+        self.tmp.cleanup()
+
+    def test_progress_reports_stages_in_order(self):
+        seen = []
+        ok, msg = create_new_project(
+            "demo",
+            "Python",
+            open_vscode=False,
+            tasks=["uno"],
+            progress=lambda stage, _text: seen.append(stage),
+        )
+        self.assertTrue(ok, msg)
+        self.assertEqual(seen, sorted(seen, key=STAGES.index))
+        self.assertIn("scaffold", seen)
+        self.assertTrue((self.base / "demo" / "src" / "main.py").is_file())
+
+    def test_flask_scaffold_from_template_dir(self):
+        ok, msg = create_new_project("web", "Flask", open_vscode=False, tasks=[])
+        self.assertTrue(ok, msg)
+        self.assertIn("Flask(__name__)", (self.base / "web" / "app.py").read_text(encoding="utf-8"))
+        self.assertTrue((self.base / "web" / "templates").is_dir())
+        self.assertTrue((self.base / "web" / "static").is_dir())
+        self.assertTrue((self.base / "web" / "promp_maestro.txt").is_file())
+
+    def test_cancel_rolls_back(self):
+        cancel = threading.Event()
+
+        def progress(stage, _text):
+            if stage == "git":
+                cancel.set()
+
+        ok, msg = create_new_project(
+            "demo",
+            "Vacío",
+            open_vscode=False,
+            tasks=[],
+            progress=progress,
+            cancel_event=cancel,
+        )
+        self.assertFalse(ok)
+        self.assertIn("cancelada", msg)
+        self.assertFalse((self.base / "demo").exists())
+
+    def test_failure_never_publishes(self):
+        with patch("core.project_creator.git_init_if_needed", side_effect=RuntimeError("boom")):
+            ok, msg = create_new_project("demo", "Python", open_vscode=False, tasks=[])
+        self.assertFalse(ok)
+        self.assertIn("boom", msg)
+        self.assertFalse((self.base / "demo").exists())
+        self.assertFalse((staging_root(self.base) / "demo.lock").exists())
+
+    def test_concurrent_same_name_fails_fast(self):
+        with ProjectLock(self.base, "Demo"):
+            ok, msg = create_new_project("demo", "Python", open_vscode=False, tasks=[])
+        self.assertFalse(ok)
+        self.assertIn("Ya se está creando", msg)
+        self.assertFalse((self.base / "demo").exists())
+
+    def test_stale_staging_and_lock_are_cleaned(self):
+        root = staging_root(self.base)
+        (root / "viejo.999999999.abcd1234" / "src").mkdir(parents=True)
+        (root / "viejo.lock").write_text("999999999 0\n", encoding="utf-8")
+        live = root / "vivo.{}.abcd1234".format(os.getpid())
+        live.mkdir()
+
+        removed = cleanup_stale(self.base)
+
+        self.assertEqual(len(removed), 2)
+        self.assertFalse((root / "viejo.lock").exists())
+        self.assertTrue(live.is_dir())
+
+        # Un lock huérfano no impide crear
+        (root / "demo.lock").write_text("999999999 0\n", encoding="utf-8")
+        ok, msg = create_new_project("demo", "Python", open_vscode=False, tasks=[])
+        self.assertTrue(ok, msg)
+
+
+    def test_lock_without_pid_is_held_during_grace(self):
+        root = staging_root(self.base)
+        root.mkdir(parents=True)
+        empty = root / "demo.lock"
+        empty.touch()
+        with self.assertRaises(ProjectLocked):
+            ProjectLock(self.base, "demo").acquire()
+        self.assertEqual(cleanup_stale(self.base), [])
+
+        old = time.time() - LOCK_GRACE - 5
+        os.utime(empty, (old, old))
+        lock = ProjectLock(self.base, "demo")
+        with lock:
+            self.assertEqual(lock._owner_pid(), os.getpid())
+        self.assertEqual([p.name for p in root.iterdir()], [])
+
+    def test_two_creators_cannot_both_steal_an_orphaned_lock(self):
+        root = staging_root(self.base)
+        root.mkdir(parents=True)
+        (root / "demo.lock").write_text("999999999 0\n", encoding="utf-8")
+        winner = ProjectLock(self.base, "demo")
+        loser = ProjectLock(self.base, "demo")
+        real_rename = os.rename
+        raced = []
+
+        def rename(src, dst):
+            # loser ya juzgó huérfano el lock viejo; winner se le adelanta
+            if not raced:
+                raced.append(True)
+                winner.acquire()
+            return real_rename(src, dst)
+
+        with patch("core.staging.os.rename", side_effect=rename):
+            with self.assertRaises(ProjectLocked):
+                loser.acquire()
+        self.assertTrue(winner.held)
+        self.assertEqual(winner._owner_pid(), os.getpid())
+        winner.release()
+        self.assertEqual(list(root.iterdir()), [])
+
+class TestTemplateCache(unittest.TestCase):
+    def test_hits_misses_and_reload_on_change(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "hoja_de_ruta.txt"
+            path.write_text("#Tareas\n#ProyectoInfo\nname_project: x\n", encoding="utf-8")
+            cache = TemplateCache(verify=True)
+
+            first = cache.hoja(path)
+            self.assertIs(cache.hoja(path), first)
+            self.assertEqual(cache.stats()["misses"], 1)
+            self.assertEqual(cache.stats()["hits"], 1)
+
+            path.write_text("#Tareas\n#ProyectoInfo\nname_project: yy\n", encoding="utf-8")
+            self.assertIsNot(cache.hoja(path), first)
+            self.assertIn("name_project: demo", cache.hoja(path).render("demo", "", "", []))
+
+            cache.invalidate(path)
+            self.assertEqual(cache.stats()["entries"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,179 @@
+import json
+import os
+import stat
+import subprocess
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from core import git_utils
+from core.remote_queue import STATUS_DONE, STATUS_FAILED, STATUS_PENDING, STATUS_RUNNING, RemoteQueue
+from core.roadmap import load_roadmap
+
+FAKE_GH = """#!/bin/sh
+if [ "$1" = "auth" ]; then exit 0; fi
+if [ "$1" = "repo" ] && [ "$2" = "create" ]; then
+  n=$(cat "$GH_COUNTER" 2>/dev/null || echo 0)
+  n=$((n+1))
+  echo $n > "$GH_COUNTER"
+  echo "$3" >> "$GH_COUNTER.log"
+  if [ $n -le "${GH_FAIL_TIMES:-0}" ]; then echo "fallo simulado" >&2; exit 1; fi
+  git remote add origin "https://example.invalid/$3.git"
+  exit 0
+fi
+exit 1
+"""
+
+HOJA = (
+    "#Tareas\n"
+    "#Ideas\n"
+    "--------------------------------------------------\n"
+    "#ProyectoInfo\n"
+    "\n"
+    "repo_git:\n"
+    "name_project: demo\n"
+    "backup: Desktop\\backups\\backup_demo_1.zip\n"
+    "--------------------------------------------------\n"
+)
+
+
+@unittest.skipUnless(os.name == "posix", "gh falso como script sh")
+class TestRemoteQueue(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        root = Path(self.tmp.name)
+
+        bin_dir = root / "bin"
+        bin_dir.mkdir()
+        gh = bin_dir / "gh"
+        gh.write_text(FAKE_GH, encoding="utf-8")
+        gh.chmod(gh.stat().st_mode | stat.S_IEXEC)
+
+        self.project = root / "demo"
+        self.project.mkdir()
+        subprocess.run(["git", "init", "-q"], cwd=self.project, check=True)
+        (self.project / "hoja_de_ruta.txt").write_text(HOJA, encoding="utf-8")
+
+        self.queue_path = root / "remote_queue.json"
+        self.env = patch.dict(
+            os.environ,
+            {
+                "PATH": str(bin_dir) + os.pathsep + os.environ.get("PATH", ""),
+                "GH_COUNTER": str(root / "gh_calls"),
+            },
+        )
+        self.env.start()
+        git_utils.gh_auth_invalidate()
+
+    def tearDown(self):
+        git_utils.gh_auth_invalidate()
+        self.env.stop()
+        self.tmp.cleanup()
+
+    def _queue(self):
+        return RemoteQueue(self.queue_path, concurrency=2, timeout=20, max_attempts=3, backoff_base=0.01)
+
+    def test_retries_then_patches_repo_git(self):
+        os.environ["GH_FAIL_TIMES"] = "1"
+        queue = self._queue()
+        job_id = queue.enqueue(str(self.project), "demo")
+        self.assertTrue(queue.drain(timeout=30))
+        queue.stop(wait=True)
+
+        status = queue.status(job_id)[0]
+        self.assertEqual(status["status"], STATUS_DONE)
+        self.assertEqual(status["attempts"], 2)
+        roadmap = load_roadmap(self.project / "hoja_de_ruta.txt")
+        self.assertEqual(roadmap.info.repo_git, "https://example.invalid/demo.git")
+
+        saved = json.loads(self.queue_path.read_text(encoding="utf-8"))
+        self.assertEqual(saved["jobs"][0]["status"], STATUS_DONE)
+
+    def test_gives_up_after_max_attempts(self):
+        os.environ["GH_FAIL_TIMES"] = "99"
+        queue = self._queue()
+        job_id = queue.enqueue(str(self.project), "demo")
+        self.assertTrue(queue.drain(timeout=30))
+        queue.stop(wait=True)
+
+        status = queue.status(job_id)[0]
+        self.assertEqual(status["status"], STATUS_FAILED)
+        self.assertEqual(status["attempts"], 3)
+        self.assertIn("fallo simulado", status["last_error"])
+
+    def test_running_jobs_resume_as_pending(self):
+        self.queue_path.write_text(
+            json.dumps(
+                {"jobs": [{"id": "x1", "project_dir": str(self.project), "project_name": "demo", "status": "running"}]}
+            ),
+            encoding="utf-8",
+        )
+        queue = self._queue()
+        self.assertEqual(queue.status("x1")[0]["status"], STATUS_PENDING)
+        self.assertFalse(queue.idle())
+
+    def test_running_job_of_live_owner_is_kept(self):
+        job = {
+            "id": "x1",
+            "project_dir": str(self.project),
+            "project_name": "demo",
+            "status": STATUS_RUNNING,
+            "owner": f"{os.getpid()}:otro",
+            "heartbeat": time.time(),
+            "updated_at": time.time(),
+        }
+        self.queue_path.write_text(json.dumps({"jobs": [job]}), encoding="utf-8")
+        queue = self._queue()
+        self.assertEqual(queue.status("x1")[0]["status"], STATUS_RUNNING)
+        # Sin latido reciente el dueño se da por perdido
+        job["heartbeat"] = 0.0
+        job["updated_at"] = time.time() + 1
+        self.queue_path.write_text(json.dumps({"jobs": [job]}), encoding="utf-8")
+        queue = self._queue()
+        self.assertEqual(queue.status("x1")[0]["status"], STATUS_PENDING)
+
+    def test_two_instances_share_the_file(self):
+        other = self.project.parent / "otro"
+        other.mkdir()
+        subprocess.run(["git", "init", "-q"], cwd=other, check=True)
+        first = self._queue()
+        second = self._queue()
+        a = first.enqueue(str(self.project), "demo")
+        b = second.enqueue(str(other), "otro")
+        # second escribió su lista sin perder lo que encoló first
+        saved = json.loads(self.queue_path.read_text(encoding="utf-8"))
+        self.assertEqual(sorted(j["id"] for j in saved["jobs"]), sorted([a, b]))
+        # y first ve lo de second sin reiniciar
+        self.assertEqual(sorted(j["id"] for j in first.status()), sorted([a, b]))
+        # El mismo proyecto no se encola dos veces entre procesos
+        self.assertEqual(second.enqueue(str(self.project), "demo"), a)
+
+        first.start()
+        self.assertTrue(second.drain(timeout=30))
+        first.stop(wait=True)
+        second.stop(wait=True)
+        # Cada repo se creó una sola vez
+        calls = (self.project.parent / "gh_calls.log").read_text(encoding="utf-8").split()
+        self.assertEqual(sorted(calls), ["demo", "otro"])
+        self.assertEqual({j["status"] for j in first.status()}, {STATUS_DONE})
+
+    def test_settled_jobs_are_pruned_on_load(self):
+        old = 0.0
+        recent = time.time()
+        jobs = [
+            {"id": "ok", "project_dir": "a", "project_name": "a", "status": STATUS_DONE, "updated_at": recent},
+            {"id": "viejo", "project_dir": "b", "project_name": "b", "status": STATUS_FAILED, "updated_at": old},
+            {"id": "nuevo", "project_dir": "c", "project_name": "c", "status": STATUS_FAILED, "updated_at": recent},
+            {"id": "cola", "project_dir": "d", "project_name": "d", "status": STATUS_PENDING, "updated_at": old},
+        ]
+        self.queue_path.write_text(json.dumps({"jobs": jobs}), encoding="utf-8")
+        queue = self._queue()
+        self.assertEqual(sorted(j["id"] for j in queue.status()), ["cola", "nuevo"])
+        saved = json.loads(self.queue_path.read_text(encoding="utf-8"))
+        self.assertEqual(len(saved["jobs"]), 2)
+        self.assertEqual(queue.prune_settled(keep_failed=0), 1)
+
+if __name__ == "__main__":
+    unittest.main()
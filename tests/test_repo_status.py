@@ -0,0 +1,107 @@
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from core.repo_status import RepoStatusCache, format_statuses, parse_porcelain, query_status
+
+PORCELAIN = (
+    "# branch.oid 1234567890abcdef\n"
+    "# branch.head main\n"
+    "# branch.upstream origin/main\n"
+    "# branch.ab +2 -1\n"
+    "1 .M N... 100644 100644 100644 abc abc app.py\n"
+    "2 R. N... 100644 100644 100644 abc abc R100 new.py\told.py\n"
+    "? notas.txt\n"
+)
+
+
+def _git(cwd, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=yvolo", "-c", "user.email=yvolo@example.com", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+    )
+
+
+class TestParsePorcelain(unittest.TestCase):
+    def test_fields(self):
+        s = parse_porcelain("demo", "/x/demo", PORCELAIN, has_remote=True)
+        self.assertEqual((s.branch, s.upstream, s.ahead, s.behind), ("main", "origin/main", 2, 1))
+        self.assertEqual((s.changed, s.untracked), (2, 1))
+        self.assertEqual(s.problems, ["sucio", "sin push", "por detrás"])
+
+    def test_new_repo_without_upstream(self):
+        s = parse_porcelain("demo", "/x/demo", "# branch.oid (initial)\n# branch.head main\n", has_remote=True)
+        self.assertFalse(s.has_commits)
+        self.assertEqual(s.problems, [])
+
+
+@unittest.skipUnless(shutil.which("git"), "git no disponible")
+class TestRepoStatusCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.base = Path(self.tmp.name) / "proyectos"
+        for name in ("limpio", "sucio"):
+            repo = self.base / name
+            repo.mkdir(parents=True)
+            _git(repo, "init", "-q")
+            (repo / "a.txt").write_text("a", encoding="utf-8")
+            _git(repo, "add", "a.txt")
+            _git(repo, "commit", "-q", "-m", "uno")
+        (self.base / "sucio" / "b.txt").write_text("b", encoding="utf-8")
+        (self.base / "sin_git").mkdir()
+        self.cache = RepoStatusCache(Path(self.tmp.name) / "git_status.json")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_scan_uses_cache_until_repo_changes(self):
+        report = self.cache.scan(self.base, workers=2)
+        self.assertEqual(report.queried, 2)
+        by_name = {s.name: s.problems for s in report.statuses}
+        self.assertEqual(by_name, {"limpio": ["sin remoto"], "sucio": ["sucio", "sin remoto"], "sin_git": ["sin git"]})
+        table = format_statuses(report.statuses, only_problems=True)
+        self.assertIn("sucio, sin remoto", table)
+        table.splitlines()[0].encode("cp1252")  # --git-status > fichero en Windows
+
+        # Otra instancia lee la caché persistida: ni un git status
+        again = RepoStatusCache(self.cache.path).scan(self.base)
+        self.assertEqual(again.queried, 0)
+        self.assertEqual(again.statuses, report.statuses)
+
+        _git(self.base / "sucio", "add", "b.txt")
+        staged = self.cache.scan(self.base)
+        self.assertEqual(staged.queried, 1)
+        self.assertEqual([s.changed for s in staged.statuses if s.name == "sucio"], [1])
+        self.assertEqual(self.cache.scan(self.base, force=True).queried, 2)
+
+    def test_status_does_not_rewrite_index(self):
+        index = self.base / "limpio" / ".git" / "index"
+        os.utime(index, ns=(1, 1))
+        (self.base / "limpio" / "a.txt").touch()
+        self.cache.scan(self.base)
+        self.assertEqual(index.stat().st_mtime_ns, 1)
+
+    def test_expired_results_are_queried_again(self):
+        self.cache.scan(self.base)
+        with patch("core.repo_status.time.time", return_value=10**10):
+            self.assertEqual(self.cache.scan(self.base).queried, 2)
+
+
+    def test_remote_from_included_config_asks_git(self):
+        repo = self.base / "limpio"
+        (repo / ".git" / "remotos.config").write_text(
+            '[remote "origin"]\n\turl = https://example.invalid/limpio.git\n', encoding="utf-8"
+        )
+        _git(repo, "config", "include.path", "remotos.config")
+        status = query_status(repo)
+        self.assertTrue(status.has_remote)
+        self.assertNotIn("sin remoto", status.problems)
+
+if __name__ == "__main__":
+    unittest.main()
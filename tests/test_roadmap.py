@@ -0,0 +1,126 @@
+import os
+import unittest
+
+from core.project_creator import _apply_hoja_template
+from core.roadmap import parse_roadmap
+from core.task_graph import TaskGraph, parse_dependencies
+
+
+BASE_DIR = os.path.dirname(os.path.dirname(__file__))
+HOJA_PATH = os.path.join(BASE_DIR, "hoja_de_ruta.txt")
+
+SAMPLE = (
+    "#Tareas\n"
+    "- Descripción: Primera\n"
+    "  - detalle\n"
+    "  Critica: Critica\n"
+    "  Implementada: Implementada\n"
+    "  Dependencias: Ninguna\n"
+    "\n"
+    "- Descripción: Segunda\n"
+    "  Critica: No critica\n"
+    "  Implementada: No implementada\n"
+    "  Dependencias: Tarea 1\n"
+    "\n"
+    "#Ideas\n"
+    "- Una idea suelta\n"
+    "--------------------------------------------------\n"
+    "#ProyectoInfo\n"
+    "\n"
+    "repo_git: \n"
+    "name_project: demo\n"
+    "backup: Desktop\\backups\\backup_demo_1.zip\n"
+    "--------------------------------------------------\n"
+)
+
+
+class TestRoadmapParser(unittest.TestCase):
+    def test_round_trip_repo_file(self):
+        with open(HOJA_PATH, "rb") as f:
+            raw = f.read().decode("utf-8")
+        self.assertEqual(parse_roadmap(raw).serialize(), raw)
+
+    def test_round_trip_crlf(self):
+        crlf = SAMPLE.replace("\n", "\r\n")
+        roadmap = parse_roadmap(crlf)
+        self.assertEqual(roadmap.serialize(), crlf)
+        self.assertEqual(roadmap.tasks[0].implementada, "Implementada")
+
+    def test_model_fields_and_indexes(self):
+        roadmap = parse_roadmap(SAMPLE)
+        self.assertEqual([t.number for t in roadmap.tasks], [1, 2])
+        self.assertEqual(roadmap.tasks[1].description, "Segunda")
+        self.assertEqual(roadmap.tasks[1].dependencias, "Tarea 1")
+        self.assertEqual(len(roadmap.ideas), 1)
+        self.assertEqual(roadmap.info.name_project, "demo")
+        self.assertEqual(roadmap.info.backup, "Desktop\\backups\\backup_demo_1.zip")
+        self.assertEqual([t.description for t in roadmap.tasks_by_status("no implementada")], ["Segunda"])
+        self.assertEqual(len(roadmap.tasks_by_critica("Critica")), 1)
+
+    def test_edits(self):
+        roadmap = parse_roadmap(SAMPLE)
+        roadmap.set_task_field(roadmap.tasks[1], "Implementada", "Implementada")
+        roadmap.insert_tasks(len(roadmap.tasks), ["Tercera"])
+        roadmap.info.set("repo_git", "https://example.invalid/demo.git")
+
+        again = parse_roadmap(roadmap.serialize())
+        self.assertEqual(len(again.tasks_by_status("Implementada")), 2)
+        self.assertEqual(again.tasks[2].description, "Tercera")
+        self.assertEqual(again.tasks[2].number, 3)
+        self.assertEqual(again.info.repo_git, "https://example.invalid/demo.git")
+        self.assertEqual(len(again.ideas), 1)
+
+    def test_apply_hoja_template_keeps_backslashes(self):
+        text = _apply_hoja_template(SAMPLE, "nuevo", "", "Desktop\\backups\\backup_nuevo_2.zip", ["t1"])
+        roadmap = parse_roadmap(text)
+        self.assertEqual(roadmap.info.backup, "Desktop\\backups\\backup_nuevo_2.zip")
+        self.assertEqual(roadmap.info.name_project, "nuevo")
+        self.assertEqual(roadmap.tasks[0].description, "t1")
+        self.assertEqual(len(roadmap.tasks), 3)
+
+
+class TestTaskGraph(unittest.TestCase):
+    def _graph(self):
+        g = TaskGraph()
+        g.add_task(1, [], implemented=True, critical=True)
+        g.add_task(2, [1], critical=True)
+        g.add_task(3, [2], critical=True)
+        g.add_task(4, [1])
+        g.add_task(5, [9])
+        return g
+
+    def test_parse_dependencies(self):
+        self.assertEqual(parse_dependencies("Ninguna"), [])
+        self.assertEqual(parse_dependencies("Tarea 3"), [3])
+        self.assertEqual(parse_dependencies("Tarea 1, Tarea 4"), [1, 4])
+
+    def test_unblocked_updates_incrementally(self):
+        g = self._graph()
+        self.assertEqual(g.unblocked(), [2, 4, 5])
+        g.set_implemented(2)
+        self.assertEqual(g.unblocked(), [3, 4, 5])
+        g.set_implemented(1, False)
+        self.assertEqual(g.unblocked(), [1, 3, 5])
+        g.set_dependencies(4, [])
+        self.assertEqual(g.unblocked(), [1, 3, 4, 5])
+        g.add_task(9, [])
+        self.assertNotIn(5, g.unblocked())
+
+    def test_order_cycles_and_critical_path(self):
+        g = self._graph()
+        self.assertEqual(g.topological_order(), [1, 2, 3, 4, 5])
+        self.assertEqual(g.critical_path(), [2, 3])
+        self.assertEqual(g.missing_references(), {5: [9]})
+        g.add_task(6, [7])
+        g.add_task(7, [6])
+        self.assertEqual(g.cycles(), [[6, 7]])
+        self.assertNotIn(6, g.topological_order())
+
+    def test_from_roadmap(self):
+        g = TaskGraph.from_roadmap(parse_roadmap(SAMPLE))
+        self.assertEqual(g.dependencies(2), [1])
+        self.assertEqual(g.unblocked(), [2])
+
+
+if __name__ == "__main__":
+    unittest.main()
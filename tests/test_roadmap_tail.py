@@ -0,0 +1,118 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from core.roadmap import load_roadmap, parse_roadmap, update_info_fields
+from core.roadmap_tail import TAIL_BLOCK, read_info, read_info_block, update_info_tail
+
+INFO = (
+    "#ProyectoInfo\n"
+    "\n"
+    "repo_git: \n"
+    "name_project: demo\n"
+    "backup: \n"
+    "--------------------------------------------------\n"
+)
+
+
+def _tasks(n):
+    return "#Tareas\n" + "".join(
+        f"- Descripción: Tarea número {i} con acentos áéí\n"
+        "  Critica: No critica\n"
+        "  Implementada: No implementada\n"
+        "  Dependencias: Ninguna\n"
+        "\n"
+        for i in range(1, n + 1)
+    )
+
+
+class TestRoadmapTail(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "hoja_de_ruta.txt"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _write(self, text):
+        self.path.write_bytes(text.encode("utf-8"))
+
+    def test_read_matches_full_parse(self):
+        text = _tasks(500) + INFO
+        self.assertGreater(len(text.encode("utf-8")), TAIL_BLOCK * 4)
+        self._write(text)
+        block = read_info_block(self.path)
+        self.assertEqual(text.encode("utf-8")[block.offset:], block.raw)
+        self.assertEqual(block.info.fields(), load_roadmap(self.path).info.fields())
+
+    def test_large_info_block_reads_further_back(self):
+        notes = "".join(f"nota_{i}: {'x' * 60}\n" for i in range(200))
+        self._write(_tasks(50) + INFO.replace("backup: \n", "backup: \n" + notes))
+        self.assertEqual(read_info(self.path).get("nota_199"), "x" * 60)
+
+    def test_update_matches_model(self):
+        text = (_tasks(200) + INFO).replace("\n", "\r\n")
+        # REPLACE_MAX=0: bloque en su sitio (hojas grandes); si no, copia + replace
+        for in_place in (False, True):
+            with self.subTest(in_place=in_place), patch("core.roadmap_tail.REPLACE_MAX", 0 if in_place else 1 << 30):
+                self._write(text)
+                inode = self.path.stat().st_ino
+                self.assertTrue(update_info_tail(self.path, backup="Desktop/backups/demo.zip", nuevo="1"))
+                self.assertEqual(self.path.stat().st_ino == inode, in_place)
+
+                expected = parse_roadmap(text)
+                expected.info.set("backup", "Desktop/backups/demo.zip", "\r\n")
+                expected.info.set("nuevo", "1", "\r\n")
+                self.assertEqual(self.path.read_bytes().decode("utf-8"), expected.serialize())
+
+                # Más corto que antes: truncate quita lo que sobraba
+                update_info_fields(self.path, backup="", nuevo="1")
+                expected.info.set("backup", "", "\r\n")
+                self.assertEqual(self.path.read_bytes().decode("utf-8"), expected.serialize())
+
+    def test_duplicated_block_goes_to_the_parsers_block(self):
+        text = _tasks(3) + INFO + INFO.replace("name_project: demo", "name_project: copia")
+        self._write(text)
+        self.assertIsNone(read_info(self.path))
+        self.assertFalse(update_info_tail(self.path, backup="x.zip"))
+        update_info_fields(self.path, backup="x.zip")
+        self.assertEqual(load_roadmap(self.path).info.get("backup"), "x.zip")
+
+        # Repetido lejos del final (fuera de la ventana leída)
+        self._write(_tasks(3) + INFO + _tasks(500).replace("#Tareas\n", "") + INFO)
+        self.assertIsNone(read_info(self.path))
+
+    def test_file_replaced_while_writing_in_place(self):
+        text = _tasks(50) + INFO
+        self._write(text)
+        real_fsync = os.fsync
+        replaced = []
+
+        def fsync(fd):
+            real_fsync(fd)
+            if not replaced:
+                # Otro proceso guarda la hoja (save_roadmap) mientras tanto
+                replaced.append(True)
+                other = self.path.with_name("otra.tmp")
+                other.write_bytes(text.replace("Tarea número 1 ", "Tarea editada ").encode("utf-8"))
+                os.replace(other, self.path)
+
+        with patch("core.roadmap_tail.REPLACE_MAX", 0), patch("core.roadmap_tail.os.fsync", side_effect=fsync):
+            self.assertTrue(update_info_tail(self.path, backup="x.zip"))
+        roadmap = load_roadmap(self.path)
+        self.assertEqual(roadmap.info.get("backup"), "x.zip")
+        self.assertIn("Tarea editada", self.path.read_text(encoding="utf-8"))
+
+    def test_without_info_block(self):
+        self._write(_tasks(3))
+        self.assertIsNone(read_info(self.path))
+        self.assertFalse(update_info_tail(self.path, backup="x.zip"))
+        with self.assertRaises(ValueError):
+            update_info_fields(self.path, backup="x.zip")
+        self.assertEqual(self.path.read_bytes().decode("utf-8"), _tasks(3))
+
+
+if __name__ == "__main__":
+    unittest.main()
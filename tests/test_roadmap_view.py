@@ -0,0 +1,59 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from core.roadmap import format_entry, parse_roadmap, peek_tasks
+from core.roadmap_view import (
+    DEPS_NONE,
+    DEPS_SOME,
+    DEPS_UNBLOCKED,
+    RoadmapFilter,
+    filter_rows,
+    load_model,
+    read_first_rows,
+)
+
+ROADMAP = (
+    "#Tareas\n"
+    + format_entry("base", implementada="Implementada")
+    + format_entry("api", critica="Critica", dependencias="Tarea 1")
+    + format_entry("ui", dependencias="Tarea 2")
+    + format_entry("docs")
+    + "#Ideas\n"
+    + format_entry("idea")
+    + "#ProyectoInfo\n\nrepo_git:\n"
+)
+
+
+class TestRoadmapView(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "hoja_de_ruta.txt"
+        self.path.write_text(ROADMAP, encoding="utf-8")
+        self.model = load_model(self.path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def numbers(self, flt):
+        return [self.model.rows[i].number for i in filter_rows(self.model, flt)]
+
+    def test_filters(self):
+        self.assertEqual(self.numbers(RoadmapFilter()), [1, 2, 3, 4])
+        self.assertEqual(self.numbers(RoadmapFilter(critica="Critica")), [2])
+        self.assertEqual(self.numbers(RoadmapFilter(implementada="No implementada")), [2, 3, 4])
+        self.assertEqual(self.numbers(RoadmapFilter(dependencias=DEPS_NONE)), [1, 4])
+        self.assertEqual(self.numbers(RoadmapFilter(dependencias=DEPS_SOME)), [2, 3])
+        self.assertEqual(self.numbers(RoadmapFilter(dependencias=DEPS_UNBLOCKED)), [2, 4])
+        self.assertEqual(self.numbers(RoadmapFilter(text="AP")), [2])
+
+    def test_first_rows_match_full_parse(self):
+        first = read_first_rows(self.path, 2)
+        self.assertEqual(first, self.model.rows[:2])
+
+    def test_peek_stops_at_next_section(self):
+        tasks = peek_tasks(ROADMAP, 100)
+        self.assertEqual([t.description for t in tasks], ["base", "api", "ui", "docs"])
+        self.assertEqual(
+            [t.raw for t in tasks], [t.raw for t in parse_roadmap(ROADMAP).tasks]
+        )
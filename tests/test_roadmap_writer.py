@@ -0,0 +1,119 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from core.roadmap import parse_roadmap, update_info_fields
+from core.roadmap_writer import RoadmapWriter, writer_for
+
+SAMPLE = (
+    "#Tareas\n"
+    "- Descripción: Primera\n"
+    "  Critica: Critica\n"
+    "  Implementada: Implementada\n"
+    "  Dependencias: Ninguna\n"
+    "\n"
+    "- Descripción: Segunda\n"
+    "  Critica: No critica\n"
+    "  Implementada: No implementada\n"
+    "  Dependencias: Tarea 1\n"
+    "\n"
+    "#Ideas\n"
+    "- Una idea suelta\n"
+    "--------------------------------------------------\n"
+    "#ProyectoInfo\n"
+    "\n"
+    "repo_git: \n"
+    "name_project: demo\n"
+    "backup: \n"
+    "--------------------------------------------------\n"
+)
+
+
+class TestRoadmapWriter(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "hoja_de_ruta.txt"
+        self.path.write_bytes(SAMPLE.encode("utf-8"))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _expected(self, edit):
+        roadmap = parse_roadmap(SAMPLE)
+        edit(roadmap)
+        return roadmap.serialize()
+
+    def test_batch_is_one_write_and_matches_model(self):
+        writer = RoadmapWriter(self.path)
+        with writer:
+            writer.set_task_field(2, "Implementada", "Implementada")
+            new = writer.append_tasks(["Tercera", "Cuarta"])
+            writer.set_task_field(4, "Critica", "Critica")
+            writer.set_info(repo_git="https://example.com/demo.git")
+        self.assertEqual([e.number for e in new], [3, 4])
+        self.assertEqual(writer.writes, 1)
+
+        def edit(r):
+            r.set_task_field(r.task(2), "Implementada", "Implementada")
+            r.insert_tasks(2, ["Tercera", "Cuarta"])
+            r.set_task_field(r.task(4), "Critica", "Critica")
+            r.info.set("repo_git", "https://example.com/demo.git", r.newline)
+
+        text = self.path.read_bytes().decode("utf-8")
+        self.assertEqual(text, self._expected(edit))
+        self.assertEqual(writer.roadmap.serialize(), text)
+
+    def test_consecutive_commits_do_not_reparse(self):
+        writer = RoadmapWriter(self.path)
+        for n in (1, 2):
+            writer.set_task_field(n, "Dependencias", "Tarea 9")
+            self.assertTrue(writer.commit())
+        writer.append_tasks(["Añadida después"])
+        writer.commit()
+        writer.set_task_field(3, "Critica", "Critica")
+        writer.set_info(name_project="demoñ")
+        writer.commit()
+        self.assertFalse(writer.commit())
+        self.assertEqual((writer.loads, writer.writes), (1, 4))
+
+        text = self.path.read_text(encoding="utf-8")
+        self.assertEqual(writer.roadmap.serialize(), text)
+        roadmap = parse_roadmap(text)
+        self.assertEqual([t.dependencias for t in roadmap.tasks], ["Tarea 9", "Tarea 9", "Ninguna"])
+        self.assertEqual(roadmap.tasks[2].critica, "Critica")
+        self.assertEqual(roadmap.info.name_project, "demoñ")
+
+    def test_external_change_replays_pending_edits(self):
+        writer = RoadmapWriter(self.path)
+        writer.set_info(backup="nuevo.zip")
+        changed = SAMPLE.replace("#Ideas\n", "#Ideas\n- Otra idea\n")
+        self.path.write_bytes(changed.encode("utf-8"))
+        os.utime(self.path, ns=(1, 1))
+        writer.commit()
+
+        roadmap = parse_roadmap(self.path.read_text(encoding="utf-8"))
+        self.assertEqual(len(roadmap.ideas), 2)
+        self.assertEqual(roadmap.info.backup, "nuevo.zip")
+        self.assertEqual(writer.loads, 2)
+
+    def test_error_discards_batch(self):
+        writer = RoadmapWriter(self.path)
+        with self.assertRaises(IndexError):
+            with writer:
+                writer.set_info(backup="x.zip")
+                writer.set_task_field(99, "Critica", "Critica")
+        self.assertEqual(self.path.read_text(encoding="utf-8"), SAMPLE)
+        self.assertEqual(writer.pending(), 0)
+
+    def test_update_info_fields_crlf(self):
+        crlf = SAMPLE.replace("\n", "\r\n")
+        self.path.write_bytes(crlf.encode("utf-8"))
+        update_info_fields(self.path, repo_git="git@x:demo.git")
+        text = self.path.read_bytes().decode("utf-8")
+        self.assertEqual(text, crlf.replace("repo_git: \r\n", "repo_git: git@x:demo.git\r\n"))
+        self.assertIs(writer_for(self.path), writer_for(self.path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from core.scaffold import (
+    MANIFEST_NAME,
+    ManifestCache,
+    Manifest,
+    available_types,
+    build_manifest,
+    materialize,
+    place_file,
+    template_dir,
+    templates_root,
+    write_manifest,
+)
+
+
+class TestManifests(unittest.TestCase):
+    def test_committed_manifests_are_fresh(self):
+        for project_type in available_types()[1:]:
+            root = template_dir(project_type)
+            stored = Manifest.from_dict(json.loads((root / MANIFEST_NAME).read_text(encoding="utf-8")))
+            empty = [d for d in stored.dirs if not (root / d).is_dir()]
+            self.assertEqual(stored, build_manifest(root, empty), project_type)
+
+    def test_unsafe_type_names_are_ignored(self):
+        self.assertIsNone(template_dir(".."))
+        self.assertIsNone(template_dir("../x"))
+        self.assertEqual(template_dir("Python"), templates_root() / "Python")
+
+
+class TestMaterialize(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.work = Path(self.tmp.name)
+        self.template = self.work / "tpl"
+        for i in range(100):
+            folder = self.template / f"pkg_{i % 7}"
+            folder.mkdir(parents=True, exist_ok=True)
+            (folder / f"mod_{i}.py").write_text(f"x = {i}\n", encoding="utf-8")
+        (self.template / "README.md.tmpl").write_text("# {{project_name}}\n", encoding="utf-8")
+        (self.template / MANIFEST_NAME).write_text('{"dirs": ["vacia"]}', encoding="utf-8")
+        write_manifest(self.template)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_parallel_materialize(self):
+        dest = self.work / "out"
+        dest.mkdir()
+        counts = materialize("x", dest, "demo", root=self.template, allow_hardlink=False)
+
+        self.assertEqual(sum(counts.values()), 101)
+        self.assertEqual(counts["render"], 1)
+        self.assertEqual((dest / "README.md").read_text(encoding="utf-8"), "# demo\n")
+        self.assertEqual((dest / "pkg_3" / "mod_10.py").read_text(encoding="utf-8"), "x = 10\n")
+        self.assertTrue((dest / "vacia").is_dir())
+        self.assertFalse((dest / MANIFEST_NAME).exists())
+        # Sin hardlink el proyecto nunca comparte fichero con la plantilla
+        self.assertEqual(os.stat(dest / "pkg_3" / "mod_10.py").st_nlink, 1)
+
+    def test_hardlink_when_allowed(self):
+        dest = self.work / "out"
+        dest.mkdir()
+        src = self.template / "pkg_0" / "mod_0.py"
+        used = place_file(src, dest / "mod_0.py", allow_hardlink=True)
+        self.assertIn(used, ("reflink", "hardlink", "copy"))
+        self.assertEqual((dest / "mod_0.py").read_bytes(), src.read_bytes())
+        if used == "hardlink":
+            self.assertTrue(os.path.samefile(src, dest / "mod_0.py"))
+
+    def test_manifest_cache_reloads_on_change(self):
+        cache = ManifestCache(verify=True)
+        first = cache.get(self.template)
+        self.assertIs(cache.get(self.template), first)
+        (self.template / "nuevo.txt").write_text("n", encoding="utf-8")
+        write_manifest(self.template)
+        self.assertEqual(len(cache.get(self.template).files), len(first.files) + 1)
+        self.assertIsNone(cache.get(self.work / "no_existe"))
@@ -0,0 +1,63 @@
+import json
+import os
+import tempfile
+import unittest
+from collections import deque
+from pathlib import Path
+from unittest.mock import patch
+
+from core import tracing
+from core.project_creator import create_new_project
+
+
+class TestTracing(unittest.TestCase):
+    def tearDown(self):
+        tracing.disable()
+        tracing.reset()
+
+    def test_disabled_records_nothing(self):
+        with tracing.span("x") as sp:
+            sp.set(a=1)
+        self.assertIs(tracing.span("y"), tracing.span("z"))
+        self.assertEqual(tracing.events(), [])
+
+    def test_summary_percentiles(self):
+        evts = [{"name": "git.init", "dur": ms * 1000.0} for ms in range(1, 101)]
+        stats = tracing.summary(evts)["git.init"]
+        self.assertEqual(stats["count"], 100)
+        self.assertEqual(stats["p50"], 50.0)
+        self.assertEqual(stats["p95"], 95.0)
+        self.assertEqual(stats["max"], 100.0)
+
+    def test_events_are_bounded(self):
+        self.assertEqual(tracing._events.maxlen, tracing.MAX_EVENTS)
+        tracing.enable()
+        with patch.object(tracing, "_events", deque(maxlen=3)):
+            for i in range(5):
+                with tracing.span(f"s{i}"):
+                    pass
+            self.assertEqual([e["name"] for e in tracing.events()], ["s2", "s3", "s4"])
+
+    def test_creation_emits_stage_spans_and_chrome_trace(self):
+        tracing.enable()
+        with tempfile.TemporaryDirectory() as tmp:
+            base = Path(tmp)
+            with patch("core.project_creator.projects_base_dir", return_value=base), patch(
+                "core.project_creator.git_try_create_remote_with_gh", return_value=""
+            ), patch.dict(os.environ, {"APPDATA": str(base / "AppData")}):
+                ok, msg = create_new_project("demo", "Python", False, ["uno"])
+            self.assertTrue(ok, msg)
+
+            names = [e["name"] for e in tracing.events()]
+            for expected in ("create_new_project", "stage.dirs", "stage.git", "stage.scaffold", "hoja.render"):
+                self.assertIn(expected, names)
+            root = next(e for e in tracing.events() if e["name"] == "create_new_project")
+            self.assertEqual(root["args"]["project"], "demo")
+
+            path = tracing.export_chrome_trace(base / "trace.json")
+            data = json.loads(path.read_text(encoding="utf-8"))
+            self.assertTrue(all(e["ph"] == "X" for e in data["traceEvents"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from core.roadmap import format_entry
+from core.watcher import CREATED, DELETED, MODIFIED, FileWatcher, watch_app_state
+
+
+class TestFileWatcher(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+        self.file = self.dir / "hoja_de_ruta.txt"
+        self.file.write_text("uno", encoding="utf-8")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_check_reports_changes_by_signature(self):
+        watcher = FileWatcher(use_inotify=False)
+        seen = []
+        watcher.watch(self.file, seen.append)
+        watcher.watch(self.dir / "nuevo.txt", seen.append)
+
+        self.assertEqual(watcher.check(), [])
+        self.file.write_text("uno dos", encoding="utf-8")
+        (self.dir / "nuevo.txt").write_text("x", encoding="utf-8")
+        kinds = sorted(e.kind for e in watcher.check())
+        self.assertEqual(kinds, [CREATED, MODIFIED])
+
+        self.file.unlink()
+        self.assertEqual([e.kind for e in watcher.check()], [DELETED])
+        self.assertEqual(len(seen), 3)
+
+        watcher.unwatch(self.file)
+        self.file.write_text("otra vez", encoding="utf-8")
+        self.assertEqual(watcher.check(), [])
+
+    def _wait_for_event(self, watcher):
+        got = threading.Event()
+        watcher.watch(self.file, lambda _e: got.set())
+        watcher.start()
+        try:
+            time.sleep(0.05)
+            self.file.write_text("cambiado", encoding="utf-8")
+            return got.wait(3.0)
+        finally:
+            watcher.stop()
+
+    def test_thread_delivers_events(self):
+        self.assertTrue(self._wait_for_event(FileWatcher()))
+
+    def test_polling_interval_adapts(self):
+        watcher = FileWatcher(min_interval=0.01, max_interval=0.05, use_inotify=False)
+        self.assertTrue(self._wait_for_event(watcher))
+        watcher = FileWatcher(min_interval=0.01, max_interval=0.04, use_inotify=False)
+        watcher.watch(self.file, lambda _e: None)
+        watcher.start()
+        time.sleep(0.3)
+        watcher.stop()
+        self.assertEqual(watcher.interval, 0.04)
+        self.assertGreater(watcher.polls, 2)
+
+
+class TestWatchAppState(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        home = Path(self.tmp.name)
+        self.base = home / "Desktop" / "proyectos"
+        self.base.mkdir(parents=True)
+        self._env = patch.dict(os.environ, {"HOME": str(home), "USERPROFILE": str(home), "APPDATA": str(home / "AppData")})
+        self._env.start()
+
+    def tearDown(self):
+        self._env.stop()
+        self.tmp.cleanup()
+
+    def test_projects_are_indexed_as_they_change(self):
+        from core.project_catalog import default_catalog
+
+        watcher = FileWatcher(use_inotify=False)
+        watch_app_state(watcher, projects_base=self.base)
+        watcher._run_pending()
+
+        hoja = self.base / "demo" / "hoja_de_ruta.txt"
+        hoja.parent.mkdir()
+        hoja.write_text("#Tareas\n" + format_entry("uno"), encoding="utf-8")
+        os.utime(self.base, ns=(0, 0))  # mtime distinto aunque el reloj sea grueso
+        watcher.check()
+        self.assertEqual(default_catalog().get("demo").tasks_total, 1)
+
+        hoja.write_text("#Tareas\n" + format_entry("uno") + format_entry("dos"), encoding="utf-8")
+        watcher.check()
+        self.assertEqual(default_catalog().get("demo").tasks_total, 2)
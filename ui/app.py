@@ -1,14 +1,42 @@
 # C:\Users\Usuario\Desktop\proyectos\yvolo\ui\app.py
 from __future__ import annotations
 
+import queue
 import subprocess
 import tkinter as tk
-from tkinter import ttk, messagebox
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from tkinter import filedialog, ttk, messagebox
+from typing import Any, Dict, Optional
 
-from core.config import load_config
-from core.paths import yvolo_root_file
-from core.project_creator import create_new_project
+from core.chat_bundle import CHAT_BUNDLES
+from core.config import CONFIG, load_config
+from core.ideas import format_report, process_all_ideas
+from core.paths import projects_base_dir, yvolo_root_file
+from core.project_creator import STAGES, create_new_project
+from core.staging import cleanup_stale_async
+from core.remote_queue import STATUS_FAILED, default_queue
+from core.roadmap import load_roadmap
+from core.task_graph import TaskGraph, format_triage
+from core.watcher import FileWatcher, watch_app_state
+from ui.creation_progress import CreationProgressDialog
 from ui.new_project_dialog import NewProjectDialog
+from ui.repo_status_panel import RepoStatusPanel
+from ui.roadmap_viewer import RoadmapViewer
+
+
+# Intervalo de sondeo de la cola de eventos de los workers (ms)
+POLL_MS = 100
+
+
+def _set_clipboard_files(ps_command: str) -> None:
+    # Adaptador Windows: el script lo genera core.chat_bundle
+    subprocess.run(
+        ["powershell", "-NoProfile", "-Command", ps_command],
+        check=False,
+        capture_output=True,
+        text=True,
+    )
 
 
 class YvoloApp(tk.Tk):
@@ -19,7 +47,39 @@ class YvoloApp(tk.Tk):
         self.title(self.config_data.get("app_name", "yvolo"))
         self.resizable(False, False)
 
+        # Trabajo pesado (git, gh, VSCode) fuera del hilo de Tk
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._events: "queue.Queue[tuple]" = queue.Queue()
+        self._progress_dialog: Optional[CreationProgressDialog] = None
+        self._ideas_dialog: Optional[CreationProgressDialog] = None
+
+        self._buttons: Dict[str, ttk.Button] = {}
         self._build_ui()
+        self._build_menu()
+
+        # Recargar labels/título si cambia settings.json, sin reiniciar
+        self._unsubscribe_config = CONFIG.subscribe(lambda data: self._events.put(("config", data)))
+
+        # Repos remotos en segundo plano; reanudar los pendientes de otra sesión
+        # y recoger los que encolen la CLI o el demonio mientras la UI está abierta
+        self._remote_queue = default_queue()
+        self._unsubscribe_remote = self._remote_queue.subscribe(
+            lambda job: self._events.put(("remote", job.to_dict()))
+        )
+        self._remote_queue.start()
+
+        self._poll_job = self.after(POLL_MS, self._poll_events)
+
+        # Cambios en hoja/promp/settings.json y en los proyectos sin reiniciar
+        # (sustituye al sondeo de settings.json desde el hilo de Tk)
+        self._watcher = FileWatcher()
+        watch_app_state(self._watcher)
+        self._watcher.start()
+
+        # Dejar el paquete de Abrir Chat preparado antes del primer clic
+        self._submit(self._prewarm_chat_bundle)
+        # Restos de creaciones interrumpidas en una sesión anterior
+        cleanup_stale_async()
 
     # =========================
     # UI
@@ -30,92 +90,237 @@ class YvoloApp(tk.Tk):
 
         labels = self.config_data.get("labels", {})
 
-        ttk.Button(
-            self,
-            text=labels.get("btn_open_chat", "Abrir Chat"),
-            command=self._open_chat,
-        ).grid(row=0, column=0, **pad)
-
-        ttk.Button(
-            self,
-            text=labels.get("btn_close_chat", "Cerrar Chat"),
-            command=self.destroy,
-        ).grid(row=1, column=0, **pad)
-
-        ttk.Button(
-            self,
-            text=labels.get("btn_process_ideas", "Procesar Ideas"),
-            command=self._process_ideas_placeholder,
-        ).grid(row=2, column=0, **pad)
-
-        ttk.Button(
-            self,
-            text=labels.get("btn_new_project", "Nuevo Proyecto"),
-            command=self._open_new_project_dialog,
-        ).grid(row=3, column=0, **pad)
+        buttons = (
+            ("btn_open_chat", "Abrir Chat", self._open_chat),
+            ("btn_close_chat", "Cerrar Chat", self.destroy),
+            ("btn_process_ideas", "Procesar Ideas", self._process_ideas),
+            ("btn_new_project", "Nuevo Proyecto", self._open_new_project_dialog),
+        )
+
+        for row, (key, default, command) in enumerate(buttons):
+            btn = ttk.Button(self, text=labels.get(key, default), command=command)
+            btn.grid(row=row, column=0, **pad)
+            self._buttons[key] = btn
+
+    def _build_menu(self) -> None:
+        # Paneles secundarios en el menú: la ventana principal son los 4 botones
+        menubar = tk.Menu(self)
+        view = tk.Menu(menubar, tearoff=False)
+        view.add_command(label="Hoja de ruta de yvolo", command=self._open_roadmap_viewer)
+        view.add_command(label="Hoja de ruta de un proyecto...", command=self._open_project_roadmap)
+        view.add_command(label="Triage de yvolo", command=self._show_triage)
+        view.add_command(label="Estado git de proyectos", command=lambda: RepoStatusPanel(self))
+        menubar.add_cascade(label="Ver", menu=view)
+        self.configure(menu=menubar)
+
+    def _apply_config(self, data: Dict[str, Any]) -> None:
+        self.config_data = data
+        self.title(data.get("app_name", "yvolo"))
+        labels = data.get("labels", {})
+        for key, btn in self._buttons.items():
+            text = labels.get(key)
+            if text:
+                btn.configure(text=text)
 
     # =========================
     # Actions
     # =========================
 
-    def _process_ideas_placeholder(self) -> None:
-        messagebox.showinfo("Info", "Funcionalidad no implementada aún.")
+    def _process_ideas(self) -> None:
+        """
+        Pasa a #Tareas las ideas con "Lista: Sí" de todos los proyectos
+        (core.ideas, en procesos aparte). El progreso llega por la cola.
+        """
+        if self._ideas_dialog is not None:
+            messagebox.showwarning("WARN", "Ya se están procesando las ideas.")
+            return
+
+        dialog = CreationProgressDialog(self, "Procesar Ideas", [], cancel_message="Cancelando...")
+        self._ideas_dialog = dialog
+
+        def show(done: int, total: int, result) -> None:
+            self._events.put(("ideas_progress", done, total, f"{done}/{total} - {result.project}"))
+
+        def job() -> None:
+            try:
+                report = process_all_ideas(progress=show, cancel_event=dialog.cancel_event)
+                ok, msg = not report.errors, format_report(report)
+            except Exception as e:
+                ok, msg = False, f"Error procesando ideas: {e}"
+            self._events.put(("ideas_done", ok, msg))
+
+        self._submit(job)
+
+    def _show_triage(self) -> None:
+        """
+        Triage de la hoja de ruta: tareas desbloqueadas, camino crítico y ciclos.
+        """
+        hoja = yvolo_root_file("hoja_de_ruta.txt")
+        if not hoja.exists():
+            messagebox.showwarning("WARN", "No existe hoja_de_ruta.txt.")
+            return
+
+        try:
+            roadmap = load_roadmap(hoja)
+        except Exception as e:
+            messagebox.showerror("Error", f"No se pudo leer hoja_de_ruta.txt: {e}")
+            return
+
+        graph = TaskGraph.from_roadmap(roadmap)
+        messagebox.showinfo("Triage", format_triage(roadmap, graph))
+
+    def _open_roadmap_viewer(self, path: Optional[Path] = None) -> None:
+        hoja = path if path is not None else yvolo_root_file("hoja_de_ruta.txt")
+        if not hoja.exists():
+            messagebox.showwarning("WARN", f"No existe {hoja}.")
+            return
+        RoadmapViewer(self, hoja)
+
+    def _open_project_roadmap(self) -> None:
+        selected = filedialog.askopenfilename(
+            parent=self,
+            title="Hoja de ruta",
+            initialdir=str(projects_base_dir()),
+            filetypes=[("Hoja de ruta", "hoja_de_ruta.txt"), ("Texto", "*.txt")],
+        )
+        if selected:
+            self._open_roadmap_viewer(Path(selected))
 
     def _open_new_project_dialog(self) -> None:
+        if self._progress_dialog is not None:
+            messagebox.showwarning("WARN", "Ya hay un proyecto creándose.")
+            return
+
         dialog = NewProjectDialog(self)
         self.wait_window(dialog)
 
         if dialog.project_name:
-            ok, msg = create_new_project(
-                project_name=dialog.project_name,
-                project_type=dialog.project_type or "Vacío",
-                open_vscode=dialog.open_vscode,
-                tasks=dialog.tasks,
-            )
-
-            if ok:
-                messagebox.showinfo("Éxito", msg)
-            else:
-                messagebox.showerror("Error", msg)
+            progress = CreationProgressDialog(self, "Creando proyecto", STAGES)
+            self._progress_dialog = progress
 
-    def _open_chat(self) -> None:
+            def job() -> None:
+                try:
+                    ok, msg = create_new_project(
+                        project_name=dialog.project_name,
+                        project_type=dialog.project_type or "Vacío",
+                        open_vscode=dialog.open_vscode,
+                        tasks=dialog.tasks,
+                        progress=lambda stage, text: self._events.put(("progress", stage, text)),
+                        cancel_event=progress.cancel_event,
+                        remote_queue=self._remote_queue,
+                    )
+                except Exception as e:
+                    ok, msg = False, f"Error creando proyecto: {e}"
+                self._events.put(("done", ok, msg))
+
+            self._remote_queue.start()
+            self._submit(job)
+
+    @staticmethod
+    def _prewarm_chat_bundle() -> None:
+        try:
+            CHAT_BUNDLES.build()
+        except Exception:
+            pass
+
+    def _submit(self, fn) -> None:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="yvolo")
+        self._executor.submit(fn)
+
+    def _poll_events(self) -> None:
         """
-        Mantiene lógica original:
-        Copia hoja_de_ruta.txt y promp_maestro.txt al portapapeles como FileDropList.
+        Vacía la cola de eventos de los workers en el hilo de Tk.
+        Se reprograma con after() durante toda la vida de la ventana.
         """
+        try:
+            while True:
+                event = self._events.get_nowait()
+                kind = event[0]
+                if kind == "progress" and self._progress_dialog is not None:
+                    self._progress_dialog.set_stage(event[1], event[2])
+                elif kind == "done":
+                    self._finish_creation(event[1], event[2])
+                elif kind == "ideas_progress" and self._ideas_dialog is not None:
+                    self._ideas_dialog.set_progress(event[1], event[2], event[3])
+                elif kind == "ideas_done":
+                    self._finish_ideas(event[1], event[2])
+                elif kind == "config":
+                    self._apply_config(event[1])
+                elif kind == "remote" and event[1]["status"] == STATUS_FAILED:
+                    job = event[1]
+                    messagebox.showwarning(
+                        "WARN",
+                        f"No se pudo crear el repositorio remoto de {job['project_name']}:\n"
+                        f"{job['last_error']}",
+                    )
+        except queue.Empty:
+            pass
 
-        hoja = yvolo_root_file("hoja_de_ruta.txt")
-        promp = yvolo_root_file("promp_maestro.txt")
+        self._poll_job = self.after(POLL_MS, self._poll_events)
 
-        files = []
-        if hoja.exists():
-            files.append(str(hoja))
-        if promp.exists():
-            files.append(str(promp))
+    def _finish_creation(self, ok: bool, msg: str) -> None:
+        if self._progress_dialog is not None:
+            try:
+                self._progress_dialog.destroy()
+            except Exception:
+                pass
+            self._progress_dialog = None
 
-        if not files:
-            messagebox.showwarning("WARN", "No se encontraron archivos para copiar.")
-            return
+        if ok:
+            messagebox.showinfo("Éxito", msg)
+        else:
+            messagebox.showerror("Error", msg)
 
-        try:
-            ps_command = (
-                "Add-Type -AssemblyName System.Windows.Forms;"
-                "$files = New-Object System.Collections.Specialized.StringCollection;"
-            )
+    def _finish_ideas(self, ok: bool, msg: str) -> None:
+        if self._ideas_dialog is not None:
+            try:
+                self._ideas_dialog.destroy()
+            except Exception:
+                pass
+            self._ideas_dialog = None
 
-            for f in files:
-                ps_command += f'$files.Add("{f}");'
+        if ok:
+            messagebox.showinfo("Procesar Ideas", msg)
+        else:
+            messagebox.showerror("Procesar Ideas", msg)
 
-            ps_command += "[System.Windows.Forms.Clipboard]::SetFileDropList($files);"
+    def destroy(self) -> None:
+        try:
+            self.after_cancel(self._poll_job)
+        except Exception:
+            pass
+        self._watcher.stop()
+        self._unsubscribe_config()
+        self._unsubscribe_remote()
+        # Lo pendiente queda persistido y se reanuda en el próximo arranque
+        self._remote_queue.stop(wait=False)
+        if self._progress_dialog is not None:
+            self._progress_dialog.cancel_event.set()
+        if self._ideas_dialog is not None:
+            self._ideas_dialog.cancel_event.set()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        super().destroy()
+
+    def _open_chat(self) -> None:
+        """
+        Copia hoja_de_ruta.txt, promp_maestro.txt y el último backup al
+        portapapeles como FileDropList. El paquete sale de la caché
+        (core.chat_bundle); aquí solo queda la llamada a PowerShell.
+        """
+        try:
+            bundle = CHAT_BUNDLES.build()
+        except Exception:
+            bundle = None
 
-            subprocess.run(
-                ["powershell", "-NoProfile", "-Command", ps_command],
-                check=False,
-                capture_output=True,
-                text=True,
-            )
+        if bundle is None:
+            messagebox.showwarning("WARN", "No se encontraron archivos para copiar.")
+            return
 
+        try:
+            _set_clipboard_files(bundle.command)
             messagebox.showinfo("OK", "Archivos copiados al portapapeles.")
-
         except Exception:
             messagebox.showerror("Error", "No se pudo copiar al portapapeles.")
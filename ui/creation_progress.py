@@ -0,0 +1,71 @@
+# C:\Users\Usuario\Desktop\proyectos\yvolo\ui\creation_progress.py
+from __future__ import annotations
+
+import threading
+import tkinter as tk
+from tkinter import ttk
+from typing import Sequence
+
+
+class CreationProgressDialog(tk.Toplevel):
+    """
+    Ventana de progreso no bloqueante.
+    La actualiza YvoloApp desde el hilo de Tk (nunca desde el worker).
+    """
+
+    def __init__(
+        self,
+        parent: tk.Tk,
+        title: str,
+        stages: Sequence[str],
+        cancel_message: str = "Cancelando... (se deshará lo creado)",
+    ):
+        super().__init__(parent)
+        self.title(title)
+        self.resizable(False, False)
+        self.transient(parent)
+
+        self.stages = list(stages)
+        self.cancel_message = cancel_message
+        self.cancel_event = threading.Event()
+
+        self._build_ui()
+        # Cerrar la ventana equivale a cancelar
+        self.protocol("WM_DELETE_WINDOW", self._cancel)
+
+    def _build_ui(self) -> None:
+        pad = {"padx": 10, "pady": 5}
+
+        self.var_status = tk.StringVar(value="Preparando...")
+        ttk.Label(self, textvariable=self.var_status, width=50).grid(
+            row=0, column=0, sticky="w", **pad
+        )
+
+        self.progress = ttk.Progressbar(
+            self,
+            mode="determinate",
+            maximum=max(len(self.stages), 1),
+            length=320,
+        )
+        self.progress.grid(row=1, column=0, **pad)
+
+        self.btn_cancel = ttk.Button(self, text="Cancelar", command=self._cancel)
+        self.btn_cancel.grid(row=2, column=0, pady=10)
+
+    def set_stage(self, stage: str, message: str) -> None:
+        if stage in self.stages:
+            self.progress["value"] = self.stages.index(stage) + 1
+        self.var_status.set(message)
+
+    def set_progress(self, done: int, total: int, message: str) -> None:
+        """Progreso por unidades (p.ej. proyectos) en lugar de etapas."""
+        self.progress.configure(maximum=max(total, 1))
+        self.progress["value"] = done
+        self.var_status.set(message)
+
+    def _cancel(self) -> None:
+        if self.cancel_event.is_set():
+            return
+        self.cancel_event.set()
+        self.var_status.set(self.cancel_message)
+        self.btn_cancel.state(["disabled"])
@@ -5,6 +5,8 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 from typing import List, Optional
 
+from core.scaffold import available_types
+
 
 class NewProjectDialog(tk.Toplevel):
     def __init__(self, parent: tk.Tk):
@@ -31,7 +33,7 @@ class NewProjectDialog(tk.Toplevel):
         ttk.Label(self, text="Tipo de proyecto:").grid(row=2, column=0, sticky="w", **pad)
         self.combo_type = ttk.Combobox(
             self,
-            values=["Vacío", "Python", "Flask"],
+            values=available_types(),
             state="readonly",
             width=37,
         )
@@ -0,0 +1,158 @@
+# C:\Users\Usuario\Desktop\proyectos\yvolo\ui\repo_status_panel.py
+from __future__ import annotations
+
+import queue
+import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+from tkinter import ttk
+from typing import List
+
+from core.repo_status import RepoStatus, ScanReport, default_cache
+
+POLL_MS = 100
+
+COLUMNS = (
+    ("name", "Proyecto", 180),
+    ("branch", "Rama", 100),
+    ("changes", "Cambios", 70),
+    ("remote", "Remoto", 70),
+    ("ahead", "↑", 40),
+    ("behind", "↓", 40),
+    ("state", "Estado", 220),
+)
+
+
+class RepoStatusPanel(tk.Toplevel):
+    """
+    Estado git de todos los proyectos (core.repo_status).
+    El escaneo va en un hilo aparte; las filas llegan por una cola que se
+    vacía con after(). "Actualizar" solo vuelve a lanzar git en los repos
+    que cambiaron; "Forzar" en todos.
+    """
+
+    def __init__(self, parent: tk.Misc):
+        super().__init__(parent)
+        self.title("Estado git de proyectos")
+
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="yvolo-git-status")
+        self._events: "queue.Queue[tuple]" = queue.Queue()
+        self._statuses: List[RepoStatus] = []
+        self._scanning = False
+
+        self._build_ui()
+        self.protocol("WM_DELETE_WINDOW", self.destroy)
+        self._poll_job = self.after(POLL_MS, self._poll_events)
+        self.refresh()
+
+    def _build_ui(self) -> None:
+        pad = {"padx": 5, "pady": 5}
+        bar = ttk.Frame(self)
+        bar.grid(row=0, column=0, columnspan=2, sticky="ew")
+
+        self.btn_refresh = ttk.Button(bar, text="Actualizar", command=self.refresh)
+        self.btn_refresh.grid(row=0, column=0, **pad)
+        self.btn_force = ttk.Button(bar, text="Forzar", command=lambda: self.refresh(force=True))
+        self.btn_force.grid(row=0, column=1, **pad)
+        self.var_only_problems = tk.BooleanVar(value=False)
+        ttk.Checkbutton(
+            bar, text="Solo con avisos", variable=self.var_only_problems, command=self._show_rows
+        ).grid(row=0, column=2, **pad)
+
+        self.tree = ttk.Treeview(self, columns=[c[0] for c in COLUMNS], show="headings", height=20)
+        for key, text, width in COLUMNS:
+            self.tree.heading(key, text=text)
+            self.tree.column(key, width=width, stretch=(key == "state"))
+        self.tree.grid(row=1, column=0, sticky="nsew")
+        scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.tree.yview)
+        scrollbar.grid(row=1, column=1, sticky="ns")
+        self.tree.configure(yscrollcommand=scrollbar.set)
+
+        self.var_status = tk.StringVar(value="")
+        ttk.Label(self, textvariable=self.var_status).grid(row=2, column=0, columnspan=2, sticky="w", **pad)
+
+        self.rowconfigure(1, weight=1)
+        self.columnconfigure(0, weight=1)
+
+    # =========================
+    # Escaneo
+    # =========================
+
+    def refresh(self, force: bool = False) -> None:
+        if self._scanning:
+            return
+        self._scanning = True
+        self.btn_refresh.state(["disabled"])
+        self.btn_force.state(["disabled"])
+        self.var_status.set("Consultando git...")
+
+        def progress(done: int, total: int, _status: RepoStatus) -> None:
+            self._events.put(("progress", done, total))
+
+        def job() -> None:
+            try:
+                self._events.put(("done", default_cache().scan(force=force, progress=progress)))
+            except Exception as e:
+                self._events.put(("error", str(e)))
+
+        self._executor.submit(job)
+
+    def _poll_events(self) -> None:
+        try:
+            while True:
+                event = self._events.get_nowait()
+                kind = event[0]
+                if kind == "progress":
+                    self.var_status.set(f"Consultando git... {event[1]}/{event[2]}")
+                elif kind == "done":
+                    self._on_report(event[1])
+                elif kind == "error":
+                    self._scan_finished()
+                    self.var_status.set(f"Error: {event[1]}")
+        except queue.Empty:
+            pass
+        self._poll_job = self.after(POLL_MS, self._poll_events)
+
+    def _scan_finished(self) -> None:
+        self._scanning = False
+        self.btn_refresh.state(["!disabled"])
+        self.btn_force.state(["!disabled"])
+
+    def _on_report(self, report: ScanReport) -> None:
+        self._scan_finished()
+        self._statuses = report.statuses
+        self._show_rows()
+        with_problems = sum(1 for s in report.statuses if s.problems)
+        self.var_status.set(
+            f"{len(report.statuses)} proyecto(s), {with_problems} con avisos; "
+            f"git consultado en {report.queried} ({report.seconds:.2f} s)"
+        )
+
+    def _show_rows(self) -> None:
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
+        only_problems = self.var_only_problems.get()
+        for s in self._statuses:
+            if only_problems and not s.problems:
+                continue
+            self.tree.insert(
+                "",
+                "end",
+                values=(
+                    s.name,
+                    s.branch or "-",
+                    s.changed + s.untracked,
+                    "sí" if s.has_remote else "no",
+                    s.ahead,
+                    s.behind,
+                    s.summary,
+                ),
+            )
+
+    def destroy(self) -> None:
+        try:
+            self.after_cancel(self._poll_job)
+        except Exception:
+            pass
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        super().destroy()
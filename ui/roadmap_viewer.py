@@ -0,0 +1,233 @@
+# C:\Users\Usuario\Desktop\proyectos\yvolo\ui\roadmap_viewer.py
+from __future__ import annotations
+
+import queue
+import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from tkinter import ttk
+from typing import List, Optional
+
+from core.roadmap_view import (
+    CRITICA_VALUES,
+    DEPENDENCIAS_VALUES,
+    IMPLEMENTADA_VALUES,
+    RoadmapFilter,
+    RoadmapModel,
+    TaskRow,
+    filter_rows,
+    load_model,
+    read_first_rows,
+)
+
+# Filas que se insertan de golpe en el Treeview (primera pantalla y cada
+# vez que el scroll se acerca al final de lo ya insertado)
+PAGE_SIZE = 200
+# Fracción de scroll a partir de la cual se carga la página siguiente
+LOAD_MORE_AT = 0.85
+POLL_MS = 50
+
+COLUMNS = (
+    ("number", "#", 60),
+    ("description", "Descripción", 420),
+    ("critica", "Crítica", 90),
+    ("implementada", "Implementada", 120),
+    ("dependencias", "Dependencias", 160),
+)
+
+
+class RoadmapViewer(tk.Toplevel):
+    """
+    Visor de hoja_de_ruta.txt para ficheros muy grandes.
+
+    - La primera pantalla sale de peek_tasks() (solo las primeras filas).
+    - El parseo completo y los filtros se calculan en un hilo aparte; el
+      resultado vuelve por una cola que se vacía con after().
+    - El Treeview solo contiene las filas ya vistas: se añade una página
+      cuando el scroll se acerca al final.
+    """
+
+    def __init__(self, parent: tk.Misc, path: Path):
+        super().__init__(parent)
+        self.title(f"Hoja de ruta - {path.parent.name}")
+        self.path = Path(path)
+
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="yvolo-roadmap")
+        self._events: "queue.Queue[tuple]" = queue.Queue()
+        self._model: Optional[RoadmapModel] = None
+        self._preview: List[TaskRow] = []
+        # Índices (en el modelo) de las filas que pasan el filtro actual
+        self._visible: List[int] = []
+        self._materialized = 0
+        # Cada cambio de filtro invalida los resultados en vuelo
+        self._generation = 0
+
+        self._build_ui()
+        self.protocol("WM_DELETE_WINDOW", self.destroy)
+
+        self._show_preview()
+        self._executor.submit(self._load_job)
+        self._poll_job = self.after(POLL_MS, self._poll_events)
+
+    # =========================
+    # UI
+    # =========================
+
+    def _build_ui(self) -> None:
+        pad = {"padx": 5, "pady": 5}
+        filters = ttk.Frame(self)
+        filters.grid(row=0, column=0, columnspan=2, sticky="ew")
+
+        self.var_critica = tk.StringVar(value=CRITICA_VALUES[0])
+        self.var_implementada = tk.StringVar(value=IMPLEMENTADA_VALUES[0])
+        self.var_dependencias = tk.StringVar(value=DEPENDENCIAS_VALUES[0])
+        self.var_text = tk.StringVar(value="")
+
+        for col, (label, var, values) in enumerate(
+            (
+                ("Crítica:", self.var_critica, CRITICA_VALUES),
+                ("Implementada:", self.var_implementada, IMPLEMENTADA_VALUES),
+                ("Dependencias:", self.var_dependencias, DEPENDENCIAS_VALUES),
+            )
+        ):
+            ttk.Label(filters, text=label).grid(row=0, column=col * 2, sticky="w", **pad)
+            combo = ttk.Combobox(filters, textvariable=var, values=values, state="readonly", width=16)
+            combo.grid(row=0, column=col * 2 + 1, **pad)
+            combo.bind("<<ComboboxSelected>>", lambda _e: self._apply_filter())
+
+        ttk.Label(filters, text="Buscar:").grid(row=0, column=6, sticky="w", **pad)
+        entry = ttk.Entry(filters, textvariable=self.var_text, width=20)
+        entry.grid(row=0, column=7, **pad)
+        entry.bind("<Return>", lambda _e: self._apply_filter())
+
+        self.tree = ttk.Treeview(self, columns=[c[0] for c in COLUMNS], show="headings", height=25)
+        for key, text, width in COLUMNS:
+            self.tree.heading(key, text=text)
+            self.tree.column(key, width=width, stretch=(key == "description"))
+        self.tree.grid(row=1, column=0, sticky="nsew")
+
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.tree.yview)
+        self.scrollbar.grid(row=1, column=1, sticky="ns")
+        self.tree.configure(yscrollcommand=self._on_scroll)
+
+        self.var_status = tk.StringVar(value="Cargando...")
+        ttk.Label(self, textvariable=self.var_status).grid(row=2, column=0, columnspan=2, sticky="w", **pad)
+
+        self.rowconfigure(1, weight=1)
+        self.columnconfigure(0, weight=1)
+
+    def _current_filter(self) -> RoadmapFilter:
+        return RoadmapFilter(
+            self.var_critica.get(),
+            self.var_implementada.get(),
+            self.var_dependencias.get(),
+            self.var_text.get(),
+        )
+
+    def _rows(self) -> List[TaskRow]:
+        return self._model.rows if self._model is not None else self._preview
+
+    # =========================
+    # Filas (solo las vistas)
+    # =========================
+
+    def _show_preview(self) -> None:
+        try:
+            self._preview = read_first_rows(self.path, PAGE_SIZE)
+        except (OSError, UnicodeDecodeError) as e:
+            self.var_status.set(f"No se pudo leer {self.path.name}: {e}")
+            return
+        self._visible = list(range(len(self._preview)))
+        self._materialize(PAGE_SIZE)
+
+    def _reset_rows(self, visible: List[int]) -> None:
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
+        self._visible = visible
+        self._materialized = 0
+        self._materialize(PAGE_SIZE)
+        self.tree.yview_moveto(0)
+
+    def _materialize(self, count: int) -> None:
+        rows = self._rows()
+        end = min(len(self._visible), self._materialized + count)
+        for i in self._visible[self._materialized:end]:
+            r = rows[i]
+            self.tree.insert(
+                "",
+                "end",
+                iid=str(i),
+                values=(r.number, r.description, r.critica, r.implementada, r.dependencias),
+            )
+        self._materialized = end
+        self._update_status()
+
+    def _on_scroll(self, first: str, last: str) -> None:
+        self.scrollbar.set(first, last)
+        if float(last) >= LOAD_MORE_AT and self._materialized < len(self._visible):
+            # after_idle: no insertar filas dentro del propio callback de scroll
+            self.after_idle(self._materialize, PAGE_SIZE)
+
+    def _update_status(self) -> None:
+        if self._model is None:
+            self.var_status.set(f"Cargando... ({self._materialized} tareas mostradas)")
+            return
+        total = len(self._model.rows)
+        self.var_status.set(f"{len(self._visible)} de {total} tareas ({self._materialized} cargadas)")
+
+    # =========================
+    # Trabajo en segundo plano
+    # =========================
+
+    def _load_job(self) -> None:
+        try:
+            self._events.put(("model", load_model(self.path)))
+        except Exception as e:
+            self._events.put(("error", str(e)))
+
+    def _apply_filter(self) -> None:
+        if self._model is None:
+            return
+        self._generation += 1
+        generation = self._generation
+        model, flt = self._model, self._current_filter()
+        self.var_status.set("Filtrando...")
+
+        def job() -> None:
+            self._events.put(("filtered", generation, filter_rows(model, flt)))
+
+        self._executor.submit(job)
+
+    def _poll_events(self) -> None:
+        try:
+            while True:
+                event = self._events.get_nowait()
+                kind = event[0]
+                if kind == "model":
+                    self._on_model(event[1])
+                elif kind == "filtered" and event[1] == self._generation:
+                    self._reset_rows(event[2])
+                elif kind == "error":
+                    self.var_status.set(f"Error leyendo {self.path.name}: {event[1]}")
+        except queue.Empty:
+            pass
+        self._poll_job = self.after(POLL_MS, self._poll_events)
+
+    def _on_model(self, model: RoadmapModel) -> None:
+        self._model = model
+        self._preview = []
+        if self._current_filter().is_default:
+            # Las filas de la vista previa son las primeras del modelo: se conservan
+            self._visible = list(range(len(model.rows)))
+            self._update_status()
+        else:
+            self._apply_filter()
+
+    def destroy(self) -> None:
+        try:
+            self.after_cancel(self._poll_job)
+        except Exception:
+            pass
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        super().destroy()
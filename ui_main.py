@@ -4,43 +4,417 @@ from __future__ import annotations
 
 import argparse
 import sys
+from pathlib import Path
+from typing import Optional
 
-from core.project_creator import create_new_project
-from ui.app import YvoloApp
+# Al cargar solo stdlib mínima: cada modo importa lo suyo dentro de main()
+# (el modo CLI no carga tkinter ni la UI; ver benchmarks/bench_startup.py).
 
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(prog="yvolo")
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="",
+        default=None,
+        metavar="TRAZA.json",
+        help="Mide cada etapa: guarda una traza Chrome (chrome://tracing) y muestra un resumen",
+    )
     parser.add_argument("--create", type=str, help="Nombre del proyecto")
-    parser.add_argument("--type", type=str, default="Vacío", help="Tipo: Vacío, Python, Flask")
+    parser.add_argument("--type", type=str, default="Vacío", help="Tipo: Vacío o una carpeta de project_templates (Python, Flask...)")
     parser.add_argument("--open-vscode", type=int, default=1, help="1 = abrir VSCode, 0 = no")
+    parser.add_argument(
+        "--create-from",
+        type=str,
+        help="Manifiesto .json o .csv con varios proyectos (name, type, tasks)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help="Hilos para --create-from, --backup y --git-status, procesos para --process-ideas (0 = automático)",
+    )
+    parser.add_argument(
+        "--no-wait-remote",
+        action="store_true",
+        help="No esperar a los repos remotos: quedan en cola (ver --remote-run)",
+    )
+    parser.add_argument("--remote-status", action="store_true", help="Estado de la cola de repos remotos")
+    parser.add_argument("--remote-run", action="store_true", help="Procesa los repos remotos pendientes")
+    parser.add_argument(
+        "--backup",
+        type=str,
+        help="Crea un zip del proyecto (nombre o ruta) en Desktop\\backups",
+    )
+    parser.add_argument(
+        "--snapshot",
+        action="store_true",
+        help="Con --backup: snapshot deduplicado en Desktop\\backups\\store en lugar de zip",
+    )
+    parser.add_argument(
+        "--export",
+        action="store_true",
+        help="Con --snapshot: exporta también backup_<nombre>_<fecha>.zip",
+    )
+    parser.add_argument(
+        "--backups",
+        nargs="?",
+        const="",
+        default=None,
+        metavar="PROYECTO",
+        help="Lista los backups registrados (de un proyecto o de todos)",
+    )
+    parser.add_argument(
+        "--prune-backups",
+        action="store_true",
+        help="Aplica la retención (backup_retention de settings.json o 10/7/4)",
+    )
+    parser.add_argument(
+        "--chat-bundle",
+        action="store_true",
+        help="Genera el zip de Abrir Chat (hoja, promp y último backup) y muestra su ruta",
+    )
+    parser.add_argument(
+        "--projects",
+        action="store_true",
+        help="Lista los proyectos de Desktop\\proyectos con tareas hechas/totales (índice en appdata)",
+    )
+    parser.add_argument(
+        "--git-status",
+        action="store_true",
+        help="Estado git de todos los proyectos: cambios sin commit, sin remoto, sin push",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Con --git-status: volver a consultar git en todos los repos",
+    )
+    parser.add_argument(
+        "--process-ideas",
+        action="store_true",
+        help="Pasa a #Tareas las ideas con \"Lista: Sí\" de todos los proyectos",
+    )
+    parser.add_argument(
+        "--template-manifests",
+        action="store_true",
+        help="Regenera project_templates/<tipo>/manifest.json tras editar una plantilla",
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Servicio residente: --create y --projects se le pasan si está en marcha",
+    )
+    parser.add_argument("--daemon-status", action="store_true", help="Estado del demonio")
+    parser.add_argument("--daemon-stop", action="store_true", help="Detiene el demonio")
+    parser.add_argument("--no-daemon", action="store_true", help="Ejecutar en este proceso aunque haya demonio")
+    parser.add_argument(
+        "--config-info",
+        action="store_true",
+        help="Muestra qué settings.json se usa y por qué se descartan los demás",
+    )
     return parser.parse_args()
 
 
+def wait_remote(job_count_before: int) -> None:
+    from core.remote_queue import default_queue, format_status
+
+    queue = default_queue()
+    if queue.idle():
+        return
+    print("Creando repositorios remotos...")
+    queue.drain()
+    queue.stop()
+    print(format_status(queue.status()[job_count_before:]))
+
+
+def forward_to_daemon(args: argparse.Namespace, command: str, **kwargs):
+    """
+    Respuesta del demonio o None para ejecutar en este proceso (solo si el
+    comando no llegó al demonio). Si falla después de enviarlo, el demonio
+    pudo haberlo ejecutado ya (p.ej. publicar el proyecto): se informa y se
+    sale sin repetirlo.
+    """
+    if args.no_daemon:
+        return None
+    from core.daemon import DaemonError, forward
+
+    try:
+        return forward(command, **kwargs)
+    except DaemonError as e:
+        print(f"ERROR: el demonio falló ({e}); no se repite sin demonio.", file=sys.stderr)
+        sys.exit(1)
+
+
+def cleanup_staging() -> None:
+    """Restos de creaciones interrumpidas (staging y locks huérfanos)."""
+    from core.paths import projects_base_dir
+    from core.staging import cleanup_stale
+
+    try:
+        cleanup_stale(projects_base_dir())
+    except Exception:
+        # no romper flujo: es mantenimiento
+        pass
+
+
+def run_create_from(manifest: str, workers: int, wait: bool = True) -> int:
+    from core.batch import check_collisions, default_workers, format_summary, load_manifest, run_batch
+    from core.remote_queue import default_queue
+
+    try:
+        entries = load_manifest(manifest)
+    except Exception as e:
+        print(f"Error leyendo manifiesto: {e}")
+        return 1
+
+    if not entries:
+        print("El manifiesto no contiene proyectos.")
+        return 1
+
+    errors = check_collisions(entries)
+    if errors:
+        print("Lote cancelado, no se ha creado ningún proyecto:")
+        for err in errors:
+            print(f"  {err}")
+        return 1
+
+    cleanup_staging()
+    workers = workers if workers > 0 else default_workers()
+    queue = default_queue()
+    before = len(queue.status())
+    try:
+        results, total = run_batch(entries, workers=workers, remote_queue=queue)
+    except FileNotFoundError as e:
+        print(str(e))
+        return 1
+
+    print(format_summary(results, total, workers))
+    if wait:
+        wait_remote(before)
+    return 0 if all(r.ok for r in results) else 1
+
+
+def setup_profiling(profile: Optional[str]) -> None:
+    """--profile o YVOLO_PROFILE: la traza se escribe al salir del proceso."""
+    import atexit
+
+    from core import tracing
+
+    if profile is None:
+        tracing.configure_from_env()
+        return
+
+    tracing.enable()
+    path = profile or None
+
+    def report() -> None:
+        print()
+        print(tracing.format_summary())
+        try:
+            print(f"Traza: {tracing.export_chrome_trace(path)}")
+        except OSError as e:
+            print(f"No se pudo guardar la traza: {e}")
+
+    atexit.register(report)
+
+
 def main() -> None:
     args = parse_args()
+    setup_profiling(args.profile)
+
+    if args.config_info:
+        from core.config import CONFIG
+
+        print(CONFIG.describe())
+        sys.exit(0)
+
+    if args.daemon:
+        from core.daemon import DaemonRunning, DaemonServer
+
+        server = DaemonServer()
+        print(f"Demonio yvolo escuchando en {server.address} (Ctrl+C para salir)")
+        try:
+            server.serve_forever()
+        except DaemonRunning as e:
+            print(str(e))
+            sys.exit(1)
+        except KeyboardInterrupt:
+            pass
+        sys.exit(0)
+
+    if args.daemon_status or args.daemon_stop:
+        from core.daemon import DaemonError, forward
+
+        try:
+            info = forward("shutdown" if args.daemon_stop else "ping")
+        except DaemonError as e:
+            info, error = None, str(e)
+        else:
+            error = ""
+        if info is None:
+            print(error or "No hay demonio en marcha.")
+            sys.exit(1)
+        if args.daemon_stop:
+            print("Demonio detenido.")
+        else:
+            print(f"Demonio pid {info['pid']}, {info['uptime']:.0f} s en marcha, {info['requests']} peticiones.")
+        sys.exit(0)
+
+    if args.projects:
+        report = forward_to_daemon(args, "projects")
+        if report is None:
+            from core.project_catalog import default_catalog, format_report
+
+            catalog = default_catalog()
+            catalog.refresh()
+            report = format_report(catalog)
+        print(report)
+        sys.exit(0)
+
+    if args.template_manifests:
+        from core.scaffold import write_all_manifests
+
+        for path in write_all_manifests():
+            print(path)
+        sys.exit(0)
+
+    if args.git_status:
+        from core.repo_status import default_cache, format_statuses
+
+        report = default_cache().scan(workers=args.workers or None, force=args.no_cache)
+        print(format_statuses(report.statuses))
+        with_problems = sum(1 for st in report.statuses if st.problems)
+        print(
+            f"\n{len(report.statuses)} proyecto(s), {with_problems} con avisos; "
+            f"git consultado en {report.queried} ({report.seconds:.2f} s)."
+        )
+        sys.exit(0)
+
+    if args.process_ideas:
+        from core.ideas import format_report, process_all_ideas
+
+        def show(done: int, total: int, result) -> None:
+            if result.promoted or result.error:
+                print(f"[{done}/{total}] {result.project}: {len(result.promoted)} idea(s) {result.error}".rstrip())
+
+        report = process_all_ideas(workers=args.workers or None, progress=show)
+        print(format_report(report))
+        sys.exit(1 if report.errors else 0)
+
+    if args.remote_status:
+        from core.remote_queue import default_queue, format_status
+
+        print(format_status(default_queue().status()))
+        sys.exit(0)
+
+    if args.remote_run:
+        from core.remote_queue import default_queue, format_status
+
+        queue = default_queue()
+        queue.retry_failed()
+        if queue.idle():
+            print(format_status(queue.status()))
+        wait_remote(0)
+        sys.exit(0)
+
+    if args.backup:
+        from core.paths import projects_base_dir
+
+        project_dir = Path(args.backup)
+        if not project_dir.is_dir():
+            project_dir = projects_base_dir() / args.backup
+        if args.snapshot:
+            from core.snapshots import snapshot_project
+
+            ok, msg = snapshot_project(project_dir, export=args.export, workers=args.workers or None)
+        else:
+            from core.backup import backup_project
+
+            ok, msg = backup_project(project_dir, workers=args.workers or None)
+        print(msg)
+        sys.exit(0 if ok else 1)
+
+    if args.chat_bundle:
+        from core.chat_bundle import CHAT_BUNDLES
+
+        bundle = CHAT_BUNDLES.build(archive=True)
+        if bundle is None:
+            print("No se encontraron archivos para el chat.")
+            sys.exit(1)
+        print(bundle.archive)
+        sys.exit(0)
+
+    if args.backups is not None:
+        from core.backup_catalog import catalog_for, format_catalog
+
+        print(format_catalog(catalog_for(), args.backups or None))
+        sys.exit(0)
+
+    if args.prune_backups:
+        from core.backup_catalog import RetentionPolicy, catalog_for, retention_policy
+        from core.config import CONFIG
+
+        policy = retention_policy(CONFIG.get()) or RetentionPolicy()
+        removed = catalog_for().prune(policy)
+        for e in removed:
+            print(f"Borrado: {e['path']}")
+        print(f"{len(removed)} backup(s) eliminados.")
+        sys.exit(0)
+
+    # Modo CLI por lotes
+    if args.create_from:
+        sys.exit(run_create_from(args.create_from, args.workers, wait=not args.no_wait_remote))
 
     # Modo CLI
     if args.create:
+        reply = forward_to_daemon(
+            args,
+            "create",
+            project_name=args.create,
+            project_type=args.type,
+            open_vscode=bool(args.open_vscode),
+            tasks=[],
+        )
+        if reply is not None:
+            print(reply["msg"])
+            if reply["ok"] and not args.no_wait_remote:
+                status = forward_to_daemon(args, "wait_remote", before=reply["remote_before"])
+                if status:
+                    print("Creando repositorios remotos...")
+                    print(status)
+            sys.exit(0 if reply["ok"] else 1)
+
+        from core.project_creator import create_new_project
+        from core.remote_queue import default_queue
+
+        cleanup_staging()
         tasks = []  # CLI no pide tareas por ahora
+        queue = default_queue()
+        before = len(queue.status())
         ok, msg = create_new_project(
             project_name=args.create,
             project_type=args.type,
             open_vscode=bool(args.open_vscode),
             tasks=tasks,
+            remote_queue=queue,
         )
 
-        if ok:
-            print(msg)
-            sys.exit(0)
-        else:
-            print(msg)
-            sys.exit(1)
+        print(msg)
+        if ok and not args.no_wait_remote:
+            wait_remote(before)
+        sys.exit(0 if ok else 1)
 
     # Modo UI
+    from ui.app import YvoloApp
+
     app = YvoloApp()
     app.mainloop()
 
 
 if __name__ == "__main__":
+    # Procesar Ideas usa procesos: en el exe de PyInstaller el hijo arranca aquí
+    import multiprocessing
+
+    multiprocessing.freeze_support()
     main()
@@ -5,7 +5,7 @@ a = Analysis(
     ['ui_main.py'],
     pathex=[],
     binaries=[],
-    datas=[('promp_maestro.txt', '.'), ('hoja_de_ruta.txt', '.')],
+    datas=[('promp_maestro.txt', '.'), ('hoja_de_ruta.txt', '.'), ('project_templates', 'project_templates')],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},